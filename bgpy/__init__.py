@@ -1,18 +1,48 @@
-# Modifying the order of these causes lots of circular imports, so skip isort
+import importlib
+from typing import TYPE_CHECKING, Any
 
 # For backwards compatability
 from . import enums
 
-from . import (  # isort: skip
-    shared,
-    simulation_engine,
-    as_graphs,
-    simulation_framework,
-    tests,
-    utils,
+# Only for type checkers, since at runtime __getattr__ below imports these on
+# first access (PEP 562). They're still exported in __all__
+if TYPE_CHECKING:
+    from . import (  # noqa: TC004
+        as_graphs,
+        shared,
+        simulation_engine,
+        simulation_framework,
+        tests,
+        utils,
+    )
+
+# Subpackages are only imported on first access (PEP 562), since some pull in
+# heavy dependencies (i.e. matplotlib, pytest, graphviz). This way, for example
+# from bgpy.simulation_engine import BGP only imports what the engine needs
+_LAZY_SUBPACKAGES = frozenset(
+    {
+        "shared",
+        "simulation_engine",
+        "as_graphs",
+        "simulation_framework",
+        "tests",
+        "utils",
+    }
 )
 
 
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBPACKAGES:
+        # Importing a submodule also sets it as an attribute of this package,
+        # so this is only called once per subpackage
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_SUBPACKAGES})
+
+
 __all__ = [
     "shared",
     "as_graphs",
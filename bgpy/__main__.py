@@ -1,3 +1,6 @@
+import argparse
+import json
+import sys
 from pathlib import Path
 
 from bgpy.shared.enums import SpecialPercentAdoptions
@@ -6,7 +9,10 @@ from bgpy.simulation_framework import ScenarioConfig, Simulation, SubprefixHijac
 
 
 def main():
-    """Runs the defaults"""
+    """Runs the defaults, or the benchmarks with bgpy bench"""
+
+    if sys.argv[1:2] == ["bench"]:
+        sys.exit(bench(sys.argv[2:]))
 
     # Simulation for the paper
     sim = Simulation(
@@ -30,5 +36,67 @@ def main():
     sim.run()
 
 
+def bench(argv: list[str]) -> int:
+    """Runs the benchmarks offline and returns 1 if any regressed"""
+
+    # Imported here since the benchmarks need the resource module (not on
+    # Windows), and the defaults don't
+    from bgpy.utils.benchmark import Benchmark, BenchmarkWorkload
+
+    parser = argparse.ArgumentParser(
+        prog="bgpy bench",
+        description="Benchmarks policies and scenarios on synthetic AS graphs",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Numbers of ASes of the synthetic AS graphs",
+    )
+    parser.add_argument(
+        "--policies",
+        nargs="+",
+        help="Class names of the adopting policies to benchmark (default all)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        help="Class names of the scenarios to benchmark (default all)",
+    )
+    parser.add_argument("--trials", type=int, default=2, help="Trials per workload")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", type=Path, default=Path("bgpy_bench.json"), help="Results JSON"
+    )
+    parser.add_argument("--baseline", type=Path, help="Results JSON to compare to")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Fraction a workload can be slower or use more RAM than the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    workloads = tuple(
+        x
+        for x in BenchmarkWorkload.get_default_workloads(tuple(args.sizes))
+        if (args.policies is None or x.AdoptPolicyCls.__name__ in args.policies)
+        and (args.scenarios is None or x.ScenarioCls.__name__ in args.scenarios)
+    )
+    results = Benchmark(workloads, num_trials=args.trials, seed=args.seed).run()
+    Benchmark.write(results, args.output)
+    print(json.dumps(results, indent=4))  # noqa: T201
+
+    if args.baseline is None:
+        return 0
+    regressions = Benchmark.compare(
+        results, Benchmark.read(args.baseline), tolerance=args.tolerance
+    )
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)  # noqa: T201
+    return 1 if regressions else 0
+
+
 if __name__ == "__main__":
     main()
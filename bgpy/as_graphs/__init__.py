@@ -1,23 +1,47 @@
 from .base import (
     AS,
     ASGraph,
+    ASGraphAttrs,
+    ASGraphCache,
     ASGraphCollector,
     ASGraphInfo,
+    ColumnarASGraphInfo,
+    ConeASNs,
+    ConeIndex,
     CustomerProviderLink,
     Link,
     PeerLink,
+    ProviderConeView,
+    ReachabilityIndex,
+    SharedASGraphInfo,
 )
 from .caida_as_graph import CAIDAASGraph, CAIDAASGraphCollector, CAIDAASGraphConstructor
+from .synthetic_as_graph import (
+    SimpleSyntheticASGraphCollector,
+    SyntheticASGraphCollector,
+    SyntheticASGraphGenerator,
+)
 
 __all__ = [
     "ASGraph",
     "AS",
+    "ConeASNs",
+    "ConeIndex",
+    "ASGraphAttrs",
+    "ASGraphCache",
     "ASGraphCollector",
     "ASGraphInfo",
+    "ColumnarASGraphInfo",
     "CustomerProviderLink",
     "Link",
     "PeerLink",
+    "ProviderConeView",
+    "ReachabilityIndex",
+    "SharedASGraphInfo",
     "CAIDAASGraphCollector",
     "CAIDAASGraphConstructor",
     "CAIDAASGraph",
+    "SimpleSyntheticASGraphCollector",
+    "SyntheticASGraphCollector",
+    "SyntheticASGraphGenerator",
 ]
@@ -1,16 +1,35 @@
-from .as_graph import AS, ASGraph
+from .as_graph import (
+    AS,
+    ASGraph,
+    ConeASNs,
+    ConeIndex,
+    ProviderConeView,
+    ReachabilityIndex,
+)
+from .as_graph_attrs import ASGraphAttrs
+from .as_graph_cache import ASGraphCache
 from .as_graph_collector import ASGraphCollector
 from .as_graph_constructor import ASGraphConstructor
 from .as_graph_info import ASGraphInfo
+from .columnar_as_graph_info import ColumnarASGraphInfo
 from .links import CustomerProviderLink, Link, PeerLink
+from .shared_as_graph_info import SharedASGraphInfo
 
 __all__ = [
     "ASGraph",
     "AS",
+    "ConeASNs",
+    "ConeIndex",
+    "ProviderConeView",
+    "ReachabilityIndex",
+    "ASGraphAttrs",
+    "ASGraphCache",
     "ASGraphCollector",
     "ASGraphConstructor",
     "ASGraphInfo",
+    "ColumnarASGraphInfo",
     "CustomerProviderLink",
     "Link",
     "PeerLink",
+    "SharedASGraphInfo",
 ]
@@ -1,4 +1,13 @@
 from .as_graph import ASGraph
 from .base_as import AS
+from .cone_asns import ConeASNs, ConeIndex
+from .reachability_index import ProviderConeView, ReachabilityIndex
 
-__all__ = ["AS", "ASGraph"]
+__all__ = [
+    "AS",
+    "ASGraph",
+    "ConeASNs",
+    "ConeIndex",
+    "ProviderConeView",
+    "ReachabilityIndex",
+]
@@ -1,4 +1,4 @@
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from weakref import proxy
 
 from frozendict import frozendict
@@ -6,6 +6,7 @@ from yamlable import YamlAble, yaml_info, yaml_info_decorate
 
 import bgpy
 from bgpy.as_graphs.base.as_graph_info import ASGraphInfo
+from bgpy.as_graphs.base.columnar_as_graph_info import ColumnarASGraphInfo
 from bgpy.shared.enums import ASGroups, Relationships
 
 from .base_as import AS
@@ -13,7 +14,7 @@ from .cone_funcs import (
     _get_and_store_customer_cone_and_set_size,
     _get_and_store_provider_cone_and_set_size,
     _get_as_rank,
-    _get_cone_helper,
+    _get_cone_bits,
     _get_size_of_and_store_cone,
 )
 
@@ -29,9 +30,13 @@ from .graph_building_funcs import (
 # propagation rank building funcs
 from .propagation_rank_funcs import (
     _assign_propagation_ranks,
-    _assign_ranks_helper,
+    _get_customer_provider_cycle_asns,
     _get_propagation_ranks,
 )
+from .reachability_index import ReachabilityIndex
+
+if TYPE_CHECKING:
+    from bgpy.as_graphs.base.as_graph_attrs import ASGraphAttrs
 
 
 @yaml_info(yaml_tag="ASGraph")
@@ -45,7 +50,7 @@ class ASGraph(YamlAble):
 
     # propagation rank building funcs
     _assign_propagation_ranks = _assign_propagation_ranks
-    _assign_ranks_helper = _assign_ranks_helper
+    _get_customer_provider_cycle_asns = _get_customer_provider_cycle_asns
     _get_propagation_ranks = _get_propagation_ranks
 
     # Cone funcs
@@ -59,7 +64,7 @@ class ASGraph(YamlAble):
     _get_and_store_provider_cone_and_set_size = (
         _get_and_store_provider_cone_and_set_size
     )
-    _get_cone_helper = _get_cone_helper
+    _get_cone_bits = _get_cone_bits
     _get_as_rank = _get_as_rank
 
     def __init_subclass__(cls, *args, **kwargs):
@@ -73,7 +78,7 @@ class ASGraph(YamlAble):
 
     def __init__(
         self,
-        as_graph_info: "ASGraphInfo",
+        as_graph_info: "ASGraphInfo | ColumnarASGraphInfo",
         BaseASCls: type[AS] = AS,
         BasePolicyCls: type[bgpy.simulation_engine.Policy] = bgpy.simulation_engine.BGP,
         store_customer_cone_size: bool = True,
@@ -86,6 +91,8 @@ class ASGraph(YamlAble):
         additional_as_group_filters: frozendict[
             str, Callable[["ASGraph"], frozenset[AS]]
         ] = frozendict(),
+        # Ranks and cones from an ASGraphCache, to avoid recomputing them
+        as_graph_attrs: Optional["ASGraphAttrs"] = None,
     ):
         """Reads in relationship data from a TSV and generate graph"""
 
@@ -102,9 +109,26 @@ class ASGraph(YamlAble):
                 store_customer_cone_asns,
                 store_provider_cone_size,
                 store_provider_cone_asns,
+                as_graph_attrs,
             )
         # Set the AS and ASN group groups
         self._set_as_groups(additional_as_group_filters)
+        # Built on first use, see the reachability_index property
+        self._reachability_index: ReachabilityIndex | None = None
+        # Which ASes run which policies, rebuilt by the engine for each scenario
+        self.adoption_index: bgpy.simulation_engine.AdoptionIndex = (
+            bgpy.simulation_engine.AdoptionIndex.from_ases(self.ases)
+        )
+
+    @property
+    def reachability_index(self) -> ReachabilityIndex:
+        """Index for provider/customer cone membership without storing the cones"""
+
+        if self._reachability_index is None:
+            self._reachability_index = ReachabilityIndex(
+                bgpy.simulation_engine.CSRGraph.from_as_graph(self)
+            )
+        return self._reachability_index
 
     def __eq__(self, other) -> bool:
         if isinstance(other, ASGraph):
@@ -140,18 +164,21 @@ class ASGraph(YamlAble):
 
     def _set_non_yaml_attrs(
         self,
-        as_graph_info: ASGraphInfo,
+        as_graph_info: ASGraphInfo | ColumnarASGraphInfo,
         BaseASCls: type["AS"],
         BasePolicyCls: type["bgpy.simulation_engine.Policy"],
         store_customer_cone_size: bool,
         store_customer_cone_asns: bool,
         store_provider_cone_size: bool,
         store_provider_cone_asns: bool,
+        as_graph_attrs: Optional["ASGraphAttrs"] = None,
     ) -> None:
         """Generates the AS graph normally (not from YAML)"""
 
-        assert as_graph_info.ixp_asns is not None
-        self.ixp_asns = as_graph_info.ixp_asns
+        # The graph is built from the columns, which are much cheaper to iterate
+        if isinstance(as_graph_info, ASGraphInfo):
+            as_graph_info = ColumnarASGraphInfo.from_as_graph_info(as_graph_info)
+        self.ixp_asns = frozenset(as_graph_info.ixp_asns)
         # Probably there is a better way to do this, but for now we
         # store this as a dict then later make frozendict, thus the type ignore
         self.as_dict: frozendict[int, AS] = dict()  # type: ignore
@@ -170,6 +197,14 @@ class ASGraph(YamlAble):
         self.ases = tuple(self.as_dict.values())
         # Remove duplicates from relationships and sort
         self._make_relationships_tuples()
+        # Cone ASNs are never cached, so those must always be computed
+        if as_graph_attrs is not None and not any(
+            [store_customer_cone_asns, store_provider_cone_asns]
+        ):
+            # Ranks and cone sizes were already computed for this graph
+            as_graph_attrs.set_attrs(self)
+            self.propagation_ranks = self._get_propagation_ranks()
+            return
         # Assign propagation rank to each AS
         self._assign_propagation_ranks()
         # Get the ranks for the graph
@@ -215,7 +250,7 @@ class ASGraph(YamlAble):
 
         for as_group_key, filter_func in self.as_group_filters.items():
             as_groups[as_group_key] = filter_func(self)
-            asn_groups[as_group_key] = frozenset(x.asn for x in filter_func(self))
+            asn_groups[as_group_key] = frozenset(x.asn for x in as_groups[as_group_key])
 
         # Turn these into frozen dicts. They shouldn't be modified
         self.as_groups: frozendict[str, frozenset[AS]] = frozendict(as_groups)
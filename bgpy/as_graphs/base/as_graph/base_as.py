@@ -1,3 +1,4 @@
+from collections.abc import Set
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional
 from weakref import CallableProxyType, proxy
@@ -26,9 +27,9 @@ class AS(YamlAble):
         peers: tuple["AS", ...] = tuple(),
         providers: tuple["AS", ...] = tuple(),
         customers: tuple["AS", ...] = tuple(),
-        customer_cone_asns: frozenset[int] | None = None,
+        customer_cone_asns: Set[int] | None = None,
         customer_cone_size: int | None = None,
-        provider_cone_asns: frozenset[int] | None = None,
+        provider_cone_asns: Set[int] | None = None,
         provider_cone_size: int | None = None,
         as_rank: int | None = None,
         propagation_rank: int | None = None,
@@ -49,9 +50,9 @@ class AS(YamlAble):
         # Read Caida's paper to understand these
         self.input_clique: bool = input_clique
         self.ixp: bool = ixp
-        self.customer_cone_asns: frozenset[int] | None = customer_cone_asns
+        self.customer_cone_asns: Set[int] | None = customer_cone_asns
         self.customer_cone_size: int | None = customer_cone_size
-        self.provider_cone_asns: frozenset[int] | None = provider_cone_asns
+        self.provider_cone_asns: Set[int] | None = provider_cone_asns
         self.provider_cone_size: int | None = provider_cone_size
         self.as_rank: int | None = as_rank
         # Propagation rank. Rank leaves to clique
@@ -78,7 +79,10 @@ class AS(YamlAble):
             return NotImplemented
 
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, AS):
+        # Skips dumping both ASes (i.e. when checking policy.as_ in _gen_graph)
+        if other is self:
+            return True
+        elif isinstance(other, AS):
             return self.__to_yaml_dict__() == other.__to_yaml_dict__()
         else:
             return NotImplemented
@@ -91,7 +95,7 @@ class AS(YamlAble):
         def asns(as_objs: tuple["AS", ...]) -> str:
             return "{" + ",".join(str(x.asn) for x in sorted(as_objs)) + "}"
 
-        def frozenset_asns(asns: frozenset[int]) -> str:
+        def frozenset_asns(asns: Set[int]) -> str:
             return "{" + ",".join(str(asn) for asn in sorted(asns)) + "}"
 
         def _format(x: Any) -> str:
@@ -102,7 +106,7 @@ class AS(YamlAble):
                 return ""
             elif any(isinstance(x, my_type) for my_type in (str, int, float)):
                 return str(x)
-            elif isinstance(x, frozenset):
+            elif isinstance(x, Set):
                 return frozenset_asns(x)
             else:
                 raise ValueError(f"improper format type: {type(x)} {x}")
@@ -184,15 +188,21 @@ class AS(YamlAble):
             "providers": tuple([x.asn for x in self.providers]),
             "input_clique": self.input_clique,
             "ixp": self.ixp,
-            "customer_cone_asns": self.customer_cone_asns,
+            "customer_cone_asns": self._get_yaml_cone_asns(self.customer_cone_asns),
             "customer_cone_size": self.customer_cone_size,
-            "provider_cone_asns": self.provider_cone_asns,
+            "provider_cone_asns": self._get_yaml_cone_asns(self.provider_cone_asns),
             "provider_cone_size": self.provider_cone_size,
             "as_rank": self.as_rank,
             "propagation_rank": self.propagation_rank,
             "policy": self.policy,
         }
 
+    @staticmethod
+    def _get_yaml_cone_asns(cone_asns: Set[int] | None) -> frozenset[int] | None:
+        """Cones are stored as ConeASNs views, but dumped as frozensets"""
+
+        return None if cone_asns is None else frozenset(cone_asns)
+
     @classmethod
     def __from_yaml_dict__(cls, dct: dict[Any, Any], yaml_tag: str = ""):
         """This optional method is called when you call yaml.load()"""
@@ -0,0 +1,53 @@
+from collections.abc import Iterator, Set
+
+
+class ConeIndex:
+    """Bit index of each ASN, shared by all of the cones of an AS graph"""
+
+    __slots__ = ("asn_indexes", "asns")
+
+    def __init__(self, asns: tuple[int, ...]) -> None:
+        self.asns: tuple[int, ...] = asns
+        self.asn_indexes: dict[int, int] = {asn: i for i, asn in enumerate(asns)}
+
+
+class ConeASNs(Set[int]):
+    """Read only view of the ASNs in a customer or provider cone
+
+    Storing a set of ASNs per AS takes GBs of RAM for the full CAIDA graph,
+    so instead each cone is a bitset over the ASN indexes of a ConeIndex,
+    stored as bytes. Membership checks are O(1), and the ASNs are only
+    decoded when iterating. Since this is a Set, it compares equal to
+    (and hashes the same as) the frozenset of the same ASNs
+    """
+
+    __slots__ = ("_bits", "_cone_index", "_size")
+
+    def __init__(self, bits: int, cone_index: ConeIndex) -> None:
+        self._bits: bytes = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        self._cone_index: ConeIndex = cone_index
+        self._size: int = bits.bit_count()
+
+    def __contains__(self, asn: object) -> bool:
+        index = self._cone_index.asn_indexes.get(asn)  # type: ignore
+        if index is None or index >= len(self._bits) * 8:
+            return False
+        return bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        asns = self._cone_index.asns
+        for byte_index, byte in enumerate(self._bits):
+            bits = byte
+            while bits:
+                lowest_bit = bits & -bits
+                yield asns[byte_index * 8 + lowest_bit.bit_length() - 1]
+                bits ^= lowest_bit
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __hash__(self) -> int:
+        return self._hash()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({sorted(self)})"
@@ -3,6 +3,7 @@
 from bgpy.shared.enums import Relationships
 
 from .base_as import AS
+from .cone_asns import ConeASNs, ConeIndex
 
 
 def _get_size_of_and_store_cone(
@@ -17,59 +18,60 @@ def _get_size_of_and_store_cone(
 
 
 def _get_and_store_customer_cone_and_set_size(self, store_asns: bool = False) -> None:
-    # Recursively assign the customer cone size
-    non_edges: list[AS] = []
-    cone_dict: dict[int, set[int]] = {}
-    for as_obj in self:
-        if as_obj.stub or as_obj.multihomed:
-            as_obj.customer_cone_size = 0
-            cone_dict[as_obj.asn] = set()
-            if store_asns:
-                as_obj.customer_cone_asns = frozenset()
-        else:
-            non_edges.append(as_obj)
-    for as_obj in non_edges:
-        # NOTE: This also updates the cone_dict behind the scenes
-        customer_cone: set[int] = self._get_cone_helper(
-            as_obj, cone_dict, Relationships.CUSTOMERS.name.lower()
-        )
-        as_obj.customer_cone_size = len(customer_cone)
+    # Customers have lower propagation ranks than their providers
+    ases = [as_obj for rank in self.propagation_ranks for as_obj in rank]
+    cone_index, cone_bits = self._get_cone_bits(
+        ases,
+        Relationships.CUSTOMERS.name.lower(),
+        empty_cone_asns=frozenset(x.asn for x in ases if x.stub or x.multihomed),
+    )
+    for as_obj, bits in zip(ases, cone_bits, strict=True):
+        as_obj.customer_cone_size = bits.bit_count()
         if store_asns:
-            as_obj.customer_cone_asns = frozenset(customer_cone)
+            as_obj.customer_cone_asns = ConeASNs(bits, cone_index)
 
 
 def _get_and_store_provider_cone_and_set_size(self, store_asns: bool = False) -> None:
-    # Recursively assign the provider cone size
-    cone_dict: dict[int, set[int]] = {}
-    for as_obj in self:
-        # NOTE: This also updates the cone_dict behind the scenes
-        provider_cone: set[int] = self._get_cone_helper(
-            as_obj, cone_dict, Relationships.PROVIDERS.name.lower()
-        )
-        as_obj.provider_cone_size = len(provider_cone)
+    # Providers have higher propagation ranks than their customers
+    ases = [as_obj for rank in reversed(self.propagation_ranks) for as_obj in rank]
+    cone_index, cone_bits = self._get_cone_bits(
+        ases, Relationships.PROVIDERS.name.lower()
+    )
+    for as_obj, bits in zip(ases, cone_bits, strict=True):
+        as_obj.provider_cone_size = bits.bit_count()
         if store_asns:
-            as_obj.provider_cone_asns = frozenset(provider_cone)
+            as_obj.provider_cone_asns = ConeASNs(bits, cone_index)
 
 
-def _get_cone_helper(
+def _get_cone_bits(
     self,
-    as_obj: AS,
-    cone_dict: dict[int, set[int]],
+    ases: list[AS],
     rel_attr: str,
-) -> set[int]:
-    """Recursively determines the cone size of an as"""
-
-    as_asn = as_obj.asn
-    if as_asn in cone_dict:
-        return cone_dict[as_asn]
-    else:
-        cone_dict[as_asn] = set()
-        for neighbor in getattr(as_obj, rel_attr):
-            cone_dict[as_asn].add(neighbor.asn)
-            if neighbor.asn not in cone_dict:
-                self._get_cone_helper(neighbor, cone_dict, rel_attr)
-            cone_dict[as_asn].update(cone_dict[neighbor.asn])
-    return cone_dict[as_asn]
+    empty_cone_asns: frozenset[int] = frozenset(),
+) -> tuple[ConeIndex, list[int]]:
+    """Returns the cone of each AS as a bitset over the AS indexes in ases
+
+    The ASes must be in topological order, with each AS after all
+    of the ASes in its rel_attr (so no recursion is needed). Each AS's
+    cone is then just the union of its neighbors and their cones.
+    Since each cone only contains ASes that come before it,
+    the bitsets of the ASes early on stay small.
+
+    ASes in empty_cone_asns are given empty cones
+    """
+
+    cone_index = ConeIndex(tuple([x.asn for x in ases]))
+    asn_indexes = cone_index.asn_indexes
+    cone_bits: list[int] = []
+    for as_obj in ases:
+        bits = 0
+        if as_obj.asn not in empty_cone_asns:
+            for neighbor in getattr(as_obj, rel_attr):
+                neighbor_index = asn_indexes[neighbor.asn]
+                assert neighbor_index < len(cone_bits), "ASes aren't in topo order"
+                bits |= cone_bits[neighbor_index] | 1 << neighbor_index
+        cone_bits.append(bits)
+    return cone_index, cone_bits
 
 
 def _get_as_rank(self) -> None:
@@ -1,72 +1,34 @@
-"""Functions to determine customer cone size"""
+"""Deprecated, cones are built iteratively as bitsets in cone_funcs"""
 
-from .base_as import AS
-
-
-def _get_customer_cone_size(self) -> None:
-    """Gets the AS rank by customer cone, the same way Caida does it"""
-
-    # Recursively assign the customer cone size
-    non_edges: list[AS] = []
-    cone_dict: dict[int, set[int]] = {}
-    for as_obj in self:
-        if as_obj.stub or as_obj.multihomed:
-            as_obj.customer_cone_size = 0
-            cone_dict[as_obj.asn] = set()
-        else:
-            non_edges.append(as_obj)
-    for as_obj in non_edges:
-        customer_cone: set[int] = self._get_cone_size_helper(as_obj, cone_dict)
-        as_obj.customer_cone_size = len(customer_cone)
-
-
-def _get_cone_size_helper(self, as_obj: AS, cone_dict: dict[int, set[int]]) -> set[int]:
-    """Recursively determines the cone size of an as"""
+from warnings import warn
 
-    if as_obj.asn in cone_dict:
-        return cone_dict[as_obj.asn]
-    else:
-        cone_dict[as_obj.asn] = set()
-        for customer in as_obj.customers:
-            cone_dict[as_obj.asn].add(customer.asn)
-            self._get_cone_size_helper(customer, cone_dict)
-            cone_dict[as_obj.asn].update(cone_dict[customer.asn])
-    return cone_dict[as_obj.asn]
+from .base_as import AS
+from .cone_funcs import _get_as_rank
 
+warn(
+    "customer_cone_funcs is deprecated, please use cone_funcs. "
+    "This will be removed in a later version",
+    DeprecationWarning,
+    stacklevel=2,
+)
 
-def _get_as_rank(self) -> None:
-    """Calculate the AS rank
+__all__ = ["_get_as_rank", "_get_cone_size_helper", "_get_customer_cone_size"]
 
-    ASRank is owned by CAIDA, so one would assume that their
-    serial-2 datasets are the same as their AS Rank relationships
 
-    They calculate AS Rank based on just the customer cone size, as seen
-    here under the AS Rank header:
-    https://asrank.caida.org/about
+def _get_customer_cone_size(self) -> None:
+    """Gets the customer cone size of every AS"""
 
-    The one caveat is that if two ASes have the same customer cone size,
-    they have the same AS rank, but then the next AS will have a rank as
-    if the sequence never stopped incrementing.
-    For example:
+    self._get_and_store_customer_cone_and_set_size()
 
-    ASN1: cone size 100: AS Rank 1
-    ASN2: cone size 100: AS Rank 1
-    ASN3: cone size 99: AS Rank 3
 
-    In this example, ASN3 has a AS Rank of 3, because even though there is no AS
-    with a rank of 2, the sequence continues even if there are ties
+def _get_cone_size_helper(self, as_obj: AS, cone_dict: dict[int, set[int]]) -> set[int]:
+    """Determines the customer cone of an AS (without recursion)
 
-    All of this is documented at the URL above
+    Uses as_obj's own graph, so this can be bound onto any class, not just ASGraph
     """
 
-    # Highest customer cone size first
-    ases = sorted(self, key=lambda x: x.customer_cone_size, reverse=True)
-    last_as = ases[0]
-    last_as.as_rank = 0
-    for i, as_obj in enumerate(ases[1:]):
-        if as_obj.customer_cone_size == last_as.customer_cone_size:
-            as_obj.as_rank = last_as.as_rank
-        else:
-            as_obj.as_rank = i
-
-        last_as = as_obj
+    if as_obj.asn not in cone_dict:
+        cone_dict[as_obj.asn] = set(
+            as_obj.as_graph.reachability_index.get_customer_cone_asns(as_obj.asn)
+        )
+    return cone_dict[as_obj.asn]
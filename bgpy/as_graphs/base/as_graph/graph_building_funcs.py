@@ -6,13 +6,13 @@ from weakref import proxy
 from .base_as import AS
 
 if TYPE_CHECKING:
-    from bgpy.as_graphs import ASGraphInfo
+    from bgpy.as_graphs import ColumnarASGraphInfo
     from bgpy.simulation_engine import Policy
 
 
 def _gen_graph(
     self,
-    as_graph_info: "ASGraphInfo",
+    as_graph_info: "ColumnarASGraphInfo",
     BaseASCls: type[AS],
     BasePolicyCls: type["Policy"],
 ):
@@ -52,24 +52,27 @@ def _gen_graph(
         self.as_dict[asn].input_clique = True
 
 
-def _add_relationships(self, as_graph_info: "ASGraphInfo") -> None:
+def _add_relationships(self, as_graph_info: "ColumnarASGraphInfo") -> None:
     """Adds relationships to the graph as references
 
     NOTE: we monkey patch peers_setup_set while the AS Graph is being generated
     for speed
     """
 
-    for cp_link in as_graph_info.customer_provider_links:
+    for provider_asn, customer_asn in zip(
+        as_graph_info.provider_asns, as_graph_info.customer_asns, strict=True
+    ):
         # Extract customer and provider obj
-        customer = self.as_dict[cp_link.customer_asn]
-        provider = self.as_dict[cp_link.provider_asn]
+        customer = self.as_dict[customer_asn]
+        provider = self.as_dict[provider_asn]
         # Store references
         customer.providers_setup_set.add(provider)
         provider.customers_setup_set.add(customer)
 
-    for peer_link in as_graph_info.peer_links:
+    for asn1, asn2 in zip(
+        as_graph_info.peer1_asns, as_graph_info.peer2_asns, strict=True
+    ):
         # Extract as objects for peers
-        asn1, asn2 = peer_link.asns
         p1, p2 = self.as_dict[asn1], self.as_dict[asn2]
         # Add references to peers
         p1.peers_setup_set.add(p2)
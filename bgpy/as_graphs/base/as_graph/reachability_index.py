@@ -0,0 +1,211 @@
+from array import array
+from collections.abc import Container
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bgpy.simulation_engine import CSRGraph
+
+
+class ReachabilityIndex:
+    """Answers whether an AS is in another AS's provider or customer cone
+
+    This doesn't store the cones (see store_provider_cone_asns), which take
+    a set per AS. Instead it is pruned landmark labeling (Yano et al. 2013)
+    over the customer -> provider DAG:
+
+    Every AS is a "landmark", taken in order of importance (most customers
+    and providers first). Each AS gets two labels: landmarks in its provider
+    cone (up labels) and landmarks in its customer cone (down labels), both
+    including itself. AS B is in the provider cone of AS A iff A's up labels
+    and B's down labels share a landmark. Each landmark only labels the ASes
+    whose paths to it aren't already covered by a more important landmark,
+    which keeps this exact while skipping most of the labels. On the
+    hierarchical AS graph nearly every path goes through a few large
+    providers, so labels stay small and memory is close to linear.
+
+    The labels are built on the first query, so that just walking the
+    cones (see get_customer_cone_asns) doesn't pay for them
+    """
+
+    __slots__ = ("_asn_indexes", "_csr_graph", "_extra_down_labels", "_up_labels")
+
+    def __init__(self, csr_graph: "CSRGraph") -> None:
+        self._csr_graph: CSRGraph = csr_graph
+        self._asn_indexes: dict[int, int] = csr_graph.get_asn_to_index()
+        # Landmarks (as CSR indexes) in the provider cone of each AS
+        self._up_labels: list[tuple[int, ...]] | None = None
+        # Nearly every AS's down labels are just itself, so only the
+        # down labels other than the AS itself are stored, and only if any
+        self._extra_down_labels: dict[int, frozenset[int]] = dict()
+
+    ###########
+    # Queries #
+    ###########
+
+    def in_provider_cone(self, asn: int, of_asn: int) -> bool:
+        """Returns True if asn is in the provider cone of of_asn"""
+
+        return self._reachable(of_asn, asn)
+
+    def in_customer_cone(self, asn: int, of_asn: int) -> bool:
+        """Returns True if asn is in the customer cone of of_asn"""
+
+        return self._reachable(asn, of_asn)
+
+    def get_provider_cone(self, asn: int) -> "ProviderConeView":
+        """Returns a view of the provider cone of the AS for membership checks"""
+
+        return ProviderConeView(self, asn)
+
+    def get_customer_cone_asns(self, asn: int) -> frozenset[int]:
+        """Returns the ASNs in the customer cone of the AS
+
+        Unlike membership checks, this has to walk the whole cone
+        """
+
+        csr_graph = self._csr_graph
+        return self._get_cone_asns(
+            asn, csr_graph.customer_offsets, csr_graph.customer_indexes
+        )
+
+    def get_provider_cone_asns(self, asn: int) -> frozenset[int]:
+        """Returns the ASNs in the provider cone of the AS
+
+        Unlike membership checks, this has to walk the whole cone
+        """
+
+        csr_graph = self._csr_graph
+        return self._get_cone_asns(
+            asn, csr_graph.provider_offsets, csr_graph.provider_indexes
+        )
+
+    def _reachable(self, from_asn: int, to_asn: int) -> bool:
+        """Returns True if to_asn is reachable going up from from_asn"""
+
+        if self._up_labels is None:
+            self._build_labels()
+        assert self._up_labels is not None, "for mypy"
+        from_index = self._asn_indexes.get(from_asn)
+        to_index = self._asn_indexes.get(to_asn)
+        if from_index is None or to_index is None or from_index == to_index:
+            return False
+        up_labels = self._up_labels[from_index]
+        if to_index in up_labels:
+            return True
+        extra_down_labels = self._extra_down_labels.get(to_index)
+        return extra_down_labels is not None and not extra_down_labels.isdisjoint(
+            up_labels
+        )
+
+    def _get_cone_asns(
+        self,
+        asn: int,
+        offsets: array,  # type: ignore[type-arg]
+        indexes: array,  # type: ignore[type-arg]
+    ) -> frozenset[int]:
+        """Walks the cone iteratively, so deep chains can't hit a recursion limit"""
+
+        visited: set[int] = set()
+        stack = [self._asn_indexes[asn]]
+        while stack:
+            index = stack.pop()
+            for neighbor_index in indexes[offsets[index] : offsets[index + 1]]:
+                if neighbor_index not in visited:
+                    visited.add(neighbor_index)
+                    stack.append(neighbor_index)
+        asns = self._csr_graph.asns
+        return frozenset([asns[x] for x in visited])
+
+    ##################
+    # Label building #
+    ##################
+
+    def _build_labels(self) -> None:
+        """Builds the up and down labels with a pruned search from each landmark"""
+
+        csr_graph = self._csr_graph
+        num_ases = len(csr_graph)
+        down_labels: list[set[int]] = [set() for _ in range(num_ases)]
+        up_labels: list[set[int]] = [set() for _ in range(num_ases)]
+        for landmark in self._get_landmark_order():
+            # Label the provider cone with the landmark (it's below all of them)
+            self._label_cone(
+                landmark,
+                csr_graph.provider_offsets,
+                csr_graph.provider_indexes,
+                labels=down_labels,
+                covered_labels=up_labels[landmark],
+                other_labels=down_labels,
+            )
+            # Label the customer cone with the landmark (it's above all of them)
+            self._label_cone(
+                landmark,
+                csr_graph.customer_offsets,
+                csr_graph.customer_indexes,
+                labels=up_labels,
+                covered_labels=down_labels[landmark],
+                other_labels=up_labels,
+            )
+        self._up_labels = [tuple(x) for x in up_labels]
+        self._extra_down_labels = {
+            i: frozenset(x - {i}) for i, x in enumerate(down_labels) if len(x) > 1
+        }
+
+    def _label_cone(
+        self,
+        landmark: int,
+        offsets: array,  # type: ignore[type-arg]
+        indexes: array,  # type: ignore[type-arg]
+        *,
+        labels: list[set[int]],
+        covered_labels: set[int],
+        other_labels: list[set[int]],
+    ) -> None:
+        """Adds the landmark to the labels of the cone, pruning covered ASes
+
+        An AS in the cone is already covered if one of its labels is a landmark
+        that's also in the opposite labels of this landmark. Then everything
+        past it in the cone is covered as well, so the search stops there
+        """
+
+        labels[landmark].add(landmark)
+        visited = {landmark}
+        stack = [landmark]
+        while stack:
+            index = stack.pop()
+            for neighbor_index in indexes[offsets[index] : offsets[index + 1]]:
+                if neighbor_index in visited:
+                    continue
+                visited.add(neighbor_index)
+                if covered_labels.isdisjoint(other_labels[neighbor_index]):
+                    labels[neighbor_index].add(landmark)
+                    stack.append(neighbor_index)
+
+    def _get_landmark_order(self) -> list[int]:
+        """Returns AS indexes from most to least important
+
+        ASes with more customers and providers are on more paths
+        """
+
+        customer_offsets = self._csr_graph.customer_offsets
+        provider_offsets = self._csr_graph.provider_offsets
+
+        def degree_product(index: int) -> int:
+            num_customers = customer_offsets[index + 1] - customer_offsets[index]
+            num_providers = provider_offsets[index + 1] - provider_offsets[index]
+            return (num_customers + 1) * (num_providers + 1)
+
+        return sorted(range(len(self._csr_graph)), key=degree_product, reverse=True)
+
+
+class ProviderConeView(Container[int]):
+    """Provider cone of an AS for membership checks, from a ReachabilityIndex"""
+
+    __slots__ = ("_asn", "_reachability_index")
+
+    def __init__(self, reachability_index: ReachabilityIndex, asn: int) -> None:
+        self._reachability_index: ReachabilityIndex = reachability_index
+        self._asn: int = asn
+
+    def __contains__(self, asn: object) -> bool:
+        return self._reachability_index.in_provider_cone(asn, self._asn)  # type: ignore
@@ -0,0 +1,94 @@
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .as_graph import ASGraph
+
+# All values are stored as signed 64 bit ints
+_TYPECODE = "q"
+# Stored in place of None for the per AS attributes
+_NONE = -1
+
+
+@dataclass(frozen=True, slots=True)
+class ASGraphAttrs:
+    """Per AS attributes that are expensive to compute when building an ASGraph
+
+    Each tuple is aligned with asns. None is used for attrs that weren't computed
+    """
+
+    asns: tuple[int, ...]
+    propagation_ranks: tuple[int, ...]
+    customer_cone_sizes: tuple[int | None, ...]
+    provider_cone_sizes: tuple[int | None, ...]
+    as_ranks: tuple[int | None, ...]
+
+    @classmethod
+    def from_as_graph(cls, as_graph: "ASGraph") -> "ASGraphAttrs":
+        """Gets the attrs from an already built ASGraph"""
+
+        ases = as_graph.ases
+        return cls(
+            asns=tuple([x.asn for x in ases]),
+            propagation_ranks=tuple([x.propagation_rank for x in ases]),
+            customer_cone_sizes=tuple([x.customer_cone_size for x in ases]),
+            provider_cone_sizes=tuple([x.provider_cone_size for x in ases]),
+            as_ranks=tuple([x.as_rank for x in ases]),
+        )
+
+    def to_array(self) -> array:
+        """Packs the attrs into a flat int64 array
+
+        Layout: the number of ASes, then each column in field order
+        """
+
+        values = array(_TYPECODE, [len(self.asns)])
+        for attrs_field in fields(self):
+            column = getattr(self, attrs_field.name)
+            values.extend([_NONE if x is None else x for x in column])
+        return values
+
+    @classmethod
+    def from_values(
+        cls, values: Sequence[int], start: int = 0
+    ) -> tuple["ASGraphAttrs", int]:
+        """Unpacks attrs packed by to_array
+
+        Returns the ASGraphAttrs and the index just past them within values
+        """
+
+        num_ases = values[start]
+        i = start + 1
+        columns: list[tuple[Any, ...]] = list()
+        for _ in fields(cls):
+            columns.append(
+                tuple([None if x == _NONE else x for x in values[i : i + num_ases]])
+            )
+            i += num_ases
+        return cls(*columns), i
+
+    def set_attrs(self, as_graph: "ASGraph") -> None:
+        """Sets the attrs onto the ASes of an ASGraph"""
+
+        as_dict = as_graph.as_dict
+        for (
+            asn,
+            propagation_rank,
+            customer_cone_size,
+            provider_cone_size,
+            as_rank,
+        ) in zip(
+            self.asns,
+            self.propagation_ranks,
+            self.customer_cone_sizes,
+            self.provider_cone_sizes,
+            self.as_ranks,
+            strict=True,
+        ):
+            as_obj = as_dict[asn]
+            as_obj.propagation_rank = propagation_rank
+            as_obj.customer_cone_size = customer_cone_size
+            as_obj.provider_cone_size = provider_cone_size
+            as_obj.as_rank = as_rank
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import sys
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bgpy.shared.constants import bgpy_logger
+
+from .as_graph_attrs import ASGraphAttrs
+from .as_graph_info import ASGraphInfo
+from .columnar_as_graph_info import ColumnarASGraphInfo
+from .shared_as_graph_info import as_graph_info_from_values, as_graph_info_to_array
+
+if TYPE_CHECKING:
+    from .as_graph import ASGraph
+
+# Bump this whenever the layout below (or what gets cached) changes
+AS_GRAPH_CACHE_VERSION = 2
+_MAGIC = b"BGPYASG\x00"
+# Length of a sha256 digest
+_KEY_LEN = 32
+# All values are stored as signed 64 bit ints
+_TYPECODE = "q"
+
+
+class ASGraphCache:
+    """Binary on disk cache of a parsed ASGraph
+
+    Stores the ASGraphInfo along with the ASGraphAttrs so that subsequent runs
+    skip both parsing the source file and computing ranks and cones.
+
+    The cache is keyed on the source file (path, size, and mtime) plus whatever
+    else the caller passes in key_parts (i.e. the as_graph_kwargs). If any of
+    these change, the key no longer matches and the cache is treated as a miss,
+    so there is never a need to manually delete it.
+
+    Callables in key_parts (i.e. additional_as_group_filters) are keyed by
+    their module and qualname, since their repr has a memory address that
+    changes from process to process. So changing a callable's code without
+    renaming it still hits the cache (the AS groups aren't cached anyways).
+
+    Layout: magic, sha256 of the key, then (all int64) the version,
+    as_graph_info_to_array's layout, and ASGraphAttrs.to_array's layout
+    """
+
+    def __init__(self, source_path: Path, key_parts: tuple[Any, ...] = ()) -> None:
+        self.source_path: Path = source_path
+        self.path: Path = source_path.with_suffix(".bgpygraph")
+        self.key: bytes = self._get_key(source_path, key_parts)
+
+    @classmethod
+    def _get_key(cls, source_path: Path, key_parts: tuple[Any, ...]) -> bytes:
+        """Returns a digest of everything that the cached graph depends on"""
+
+        stat = source_path.stat()
+        parts = (
+            AS_GRAPH_CACHE_VERSION,
+            sys.byteorder,
+            str(source_path.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            *key_parts,
+        )
+        return hashlib.sha256(repr(cls._get_stable_key_part(parts)).encode()).digest()
+
+    @classmethod
+    def _get_stable_key_part(cls, part: Any) -> Any:
+        """Returns part with the same repr in every process
+
+        Callables are replaced by their module and qualname, and mappings
+        and sets are sorted, since their order can depend on the hash seed
+        """
+
+        if isinstance(part, Mapping):
+            items = [(cls._get_stable_key_part(k), v) for k, v in part.items()]
+            return tuple(
+                (k, cls._get_stable_key_part(v))
+                for k, v in sorted(items, key=lambda x: repr(x[0]))
+            )
+        elif isinstance(part, (set, frozenset)):
+            return tuple(sorted(map(cls._get_stable_key_part, part), key=repr))
+        elif isinstance(part, (list, tuple)):
+            return tuple(map(cls._get_stable_key_part, part))
+        elif callable(part) and hasattr(part, "__qualname__"):
+            return f"{part.__module__}.{part.__qualname__}"
+        else:
+            return part
+
+    def read(self) -> tuple[ColumnarASGraphInfo, ASGraphAttrs] | None:
+        """Returns the cached ASGraphInfo and ASGraphAttrs, or None if stale"""
+
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        key_start = len(_MAGIC)
+        values_start = key_start + _KEY_LEN
+        if (
+            data[:key_start] != _MAGIC
+            or data[key_start:values_start] != self.key
+            # Partially written file
+            or (len(data) - values_start) % array(_TYPECODE).itemsize
+        ):
+            bgpy_logger.info(f"AS graph cache at {self.path} is stale, ignoring it")
+            return None
+
+        values = array(_TYPECODE)
+        values.frombytes(data[values_start:])
+        if values[0] != AS_GRAPH_CACHE_VERSION:
+            return None
+        as_graph_info, i = as_graph_info_from_values(values, start=1)
+        return as_graph_info, ASGraphAttrs.from_values(values, start=i)[0]
+
+    def write(
+        self, as_graph_info: ASGraphInfo | ColumnarASGraphInfo, as_graph: "ASGraph"
+    ) -> None:
+        """Writes the ASGraphInfo and the ASGraph's attrs to the cache"""
+
+        values = array(_TYPECODE, [AS_GRAPH_CACHE_VERSION])
+        values.extend(as_graph_info_to_array(as_graph_info))
+        values.extend(ASGraphAttrs.from_as_graph(as_graph).to_array())
+
+        # Write to a temp file first so that readers never see a partial file
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            f.write(_MAGIC)
+            f.write(self.key)
+            values.tofile(f)
+        tmp_path.replace(self.path)
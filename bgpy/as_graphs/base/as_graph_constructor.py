@@ -1,16 +1,21 @@
 import csv
 from abc import ABC, abstractmethod
+from inspect import signature
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from frozendict import frozendict
 
 from bgpy.shared.constants import bgpy_logger
 
+from .as_graph_cache import ASGraphCache
+
 if TYPE_CHECKING:
     from .as_graph import ASGraph
+    from .as_graph_attrs import ASGraphAttrs
     from .as_graph_collector import ASGraphCollector
     from .as_graph_info import ASGraphInfo
+    from .columnar_as_graph_info import ColumnarASGraphInfo
 
 
 class ASGraphConstructor(ABC):
@@ -22,8 +27,13 @@ class ASGraphConstructor(ABC):
         as_graph_kwargs=frozendict(),
         tsv_path: Path | None = None,
         stubs: bool = True,
+        use_as_graph_cache: bool = True,
     ) -> None:
-        """Stores download time and cache_dir instance vars and creates dir"""
+        """Stores download time and cache_dir instance vars and creates dir
+
+        use_as_graph_cache stores the parsed graph in a binary ASGraphCache
+        next to the downloaded file, so that later runs load it much faster
+        """
 
         self.as_graph_collector: ASGraphCollector = ASGraphCollectorCls(
             **as_graph_collector_kwargs
@@ -32,33 +42,128 @@ class ASGraphConstructor(ABC):
         self.as_graph_kwargs = as_graph_kwargs
         self.tsv_path: Path | None = tsv_path
         self.stubs: bool = stubs
+        self.use_as_graph_cache: bool = use_as_graph_cache
 
-    def run(self) -> "ASGraph":
+    def run(
+        self,
+        as_graph_info: Optional["ASGraphInfo | ColumnarASGraphInfo"] = None,
+        as_graph_attrs: Optional["ASGraphAttrs"] = None,
+    ) -> "ASGraph":
         """Generates AS graph in the following steps:
 
         1. download file from source using the GraphCollector
         2. parse downloaded file to get ASGraphInfo object
+           (or load it from the ASGraphCache if it's there)
         3. Generate the graph based on ASGraphInfo object
         4. Write to tsv_path if it is set
         5. Return ASGraph
+
+        If as_graph_info is passed in (i.e. from get_as_graph_info in another
+        process) then steps 1 and 2 are skipped, and if as_graph_attrs
+        are passed in too, so is computing the ranks and cones
+        """
+
+        if as_graph_info is None:
+            as_graph = self._get_as_graph_from_dl()
+        else:
+            # Generate AS Graph from ASGraphInfo
+            as_graph = self._get_as_graph_with_attrs(as_graph_info, as_graph_attrs)
+
+        # Write to TSV if tsv_path is set
+        self.write_tsv(as_graph, self.tsv_path)
+        return as_graph
+
+    def get_as_graph_info(self) -> "ASGraphInfo | ColumnarASGraphInfo":
+        """Downloads and parses the file into ASGraphInfo (removing stubs if set)"""
+
+        return self.get_as_graph_info_and_attrs()[0]
+
+    def get_as_graph_info_and_attrs(
+        self,
+    ) -> tuple["ASGraphInfo | ColumnarASGraphInfo", Optional["ASGraphAttrs"]]:
+        """Returns the ASGraphInfo, and the ASGraphAttrs if they're cached
+
+        Pass both into run (i.e. in another process) to build the ASGraph
+        without parsing the file or computing the ranks and cones
         """
 
         # Download file (for ex: from CAIDA)
         dl_path = self.as_graph_collector.run()
+        as_graph_cache = self._get_as_graph_cache(dl_path)
+        if as_graph_cache is not None:
+            cached = as_graph_cache.read()
+            if cached is not None:
+                return cached
+        return self._parse_as_graph_info(dl_path), None
+
+    def _get_as_graph_from_dl(self) -> "ASGraph":
+        """Downloads and generates the AS graph, using the ASGraphCache if set"""
+
+        # Download file (for ex: from CAIDA)
+        dl_path = self.as_graph_collector.run()
+        as_graph_cache = self._get_as_graph_cache(dl_path)
+        if as_graph_cache is not None:
+            cached = as_graph_cache.read()
+            if cached is not None:
+                return self._get_as_graph_with_attrs(*cached)
+
+        as_graph_info = self._parse_as_graph_info(dl_path)
+        as_graph = self._get_as_graph(as_graph_info)
+        if as_graph_cache is not None:
+            as_graph_cache.write(as_graph_info, as_graph)
+        return as_graph
+
+    def _get_as_graph_with_attrs(
+        self,
+        as_graph_info: "ASGraphInfo | ColumnarASGraphInfo",
+        as_graph_attrs: Optional["ASGraphAttrs"] = None,
+    ) -> "ASGraph":
+        """Returns the AS Graph, using the precomputed ranks and cones if possible
+
+        Subclasses may still override _get_as_graph with only as_graph_info,
+        from before it took as_graph_attrs. Those compute the ranks and cones
+        themselves, rather than failing with a TypeError
+        """
+
+        if as_graph_attrs is None:
+            return self._get_as_graph(as_graph_info)
+        try:
+            signature(self._get_as_graph).bind(as_graph_info, as_graph_attrs)
+        except TypeError:
+            return self._get_as_graph(as_graph_info)
+        else:
+            return self._get_as_graph(as_graph_info, as_graph_attrs)
+
+    def _parse_as_graph_info(
+        self, dl_path: Path
+    ) -> "ASGraphInfo | ColumnarASGraphInfo":
+        """Parses the downloaded file into ASGraphInfo (removing stubs if set)"""
+
         # Get ASGraphInfo from downloaded file
         as_graph_info = self._get_as_graph_info(dl_path)
-        # Generate AS Graph from ASGraphInfo
-        as_graph = self._get_as_graph(as_graph_info)
         if not self.stubs:
+            # Generate AS Graph from ASGraphInfo to determine the stubs
+            as_graph = self._get_as_graph(as_graph_info)
             invalid_asns = frozenset([as_obj.asn for as_obj in as_graph if as_obj.stub])
             # Get ASGraphInfo from downloaded file
             as_graph_info = self._get_as_graph_info(dl_path, invalid_asns)
-            # Generate AS Graph from ASGraphInfo
-            as_graph = self._get_as_graph(as_graph_info)
+        return as_graph_info
 
-        # Write to TSV if tsv_path is set
-        self.write_tsv(as_graph, self.tsv_path)
-        return as_graph
+    def _get_as_graph_cache(self, dl_path: Path) -> ASGraphCache | None:
+        """Returns the ASGraphCache for the downloaded file (if it's being used)
+
+        The cache is keyed on everything besides the file that changes the graph
+        """
+
+        if not self.use_as_graph_cache:
+            return None
+
+        key_parts = (
+            f"{self.ASGraphCls.__module__}.{self.ASGraphCls.__qualname__}",
+            self.stubs,
+            sorted(self.as_graph_kwargs.items()),
+        )
+        return ASGraphCache(dl_path, key_parts)
 
     def remove_stubs(self, as_graph: "ASGraph") -> None:
         """Removes stubs from as graph"""
@@ -93,7 +198,7 @@ class ASGraphConstructor(ABC):
     @abstractmethod
     def _get_as_graph_info(
         self, dl_path: Path, invalid_asns: frozenset[int] = frozenset()
-    ) -> "ASGraphInfo":
+    ) -> "ASGraphInfo | ColumnarASGraphInfo":
         """Reads cached directory, gets AS graph info and returns ASGraphInfo
 
         dl_path is the Path to the downloaded file
@@ -101,6 +206,13 @@ class ASGraphConstructor(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def _get_as_graph(self, as_graph_info: "ASGraphInfo") -> "ASGraph":
-        """Returns AS Graph based on ASGraphInfo"""
+    def _get_as_graph(
+        self,
+        as_graph_info: "ASGraphInfo | ColumnarASGraphInfo",
+        as_graph_attrs: Optional["ASGraphAttrs"] = None,
+    ) -> "ASGraph":
+        """Returns AS Graph based on ASGraphInfo
+
+        as_graph_attrs are precomputed ranks and cones from the ASGraphCache
+        """
         raise NotImplementedError
@@ -0,0 +1,194 @@
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from .as_graph_info import ASGraphInfo
+from .links import CustomerProviderLink as CPLink
+from .links import Link, PeerLink
+
+# All ASN columns are signed 64 bit ints
+_TYPECODE = "q"
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ColumnarASGraphInfo:
+    """Contains information to build a graph, stored as columns of ASNs
+
+    Rather than a Link object per link like ASGraphInfo, links are stored
+    as parallel arrays (provider_asns[i] is the provider of customer_asns[i],
+    and peer1_asns[i] peers with peer2_asns[i]), which are much cheaper to
+    create, validate, and pack for large graphs. The ASNs of the graph are
+    computed once, rather than on every access. The unlinked, IXP, and
+    input clique ASNs stay frozensets like in ASGraphInfo.
+
+    ASGraph accepts either, and from_as_graph_info/to_as_graph_info convert
+    between them. The links properties also build Link objects on access for
+    code written for ASGraphInfo
+    """
+
+    # Links
+    provider_asns: array = field(default_factory=lambda: array(_TYPECODE))
+    customer_asns: array = field(default_factory=lambda: array(_TYPECODE))
+    peer1_asns: array = field(default_factory=lambda: array(_TYPECODE))
+    peer2_asns: array = field(default_factory=lambda: array(_TYPECODE))
+    unlinked_asns: frozenset[int] = field(default_factory=frozenset)
+    # Metadata
+    ixp_asns: frozenset[int] = field(default_factory=frozenset)
+    input_clique_asns: frozenset[int] = field(default_factory=frozenset)
+    # You can optionally add diagram ranks for graphviz here
+    # By default, it just uses the propagation ranks
+    diagram_ranks: tuple[tuple[int, ...], ...] = ()
+    # Sorted ASNs of all links and unlinked ASNs, set in __post_init__
+    asns: tuple[int, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of ASNs for convenience
+        for attr in ("provider_asns", "customer_asns", "peer1_asns", "peer2_asns"):
+            asns = getattr(self, attr)
+            if not isinstance(asns, array) or asns.typecode != _TYPECODE:
+                object.__setattr__(self, attr, array(_TYPECODE, asns))
+        for attr in ("unlinked_asns", "ixp_asns", "input_clique_asns"):
+            asns = getattr(self, attr)
+            if not isinstance(asns, frozenset):
+                object.__setattr__(self, attr, frozenset(asns))
+
+        assert len(self.provider_asns) == len(self.customer_asns)
+        assert len(self.peer1_asns) == len(self.peer2_asns)
+        # Both link types are keyed by their sorted ASNs, like Link.asns
+        link_keys = set(self._get_link_keys(self.provider_asns, self.customer_asns))
+        link_keys.update(self._get_link_keys(self.peer1_asns, self.peer2_asns))
+        msg = "Shouldn't have duplicate links or a customer-provider that's a peer!"
+        assert len(link_keys) == len(self.provider_asns) + len(self.peer1_asns), msg
+
+        asns = set(self.provider_asns)
+        asns.update(self.customer_asns)
+        asns.update(self.peer1_asns)
+        asns.update(self.peer2_asns)
+        asns.update(self.unlinked_asns)
+        object.__setattr__(self, "asns", tuple(sorted(asns)))
+
+    # The ASN columns are mutable arrays, so not hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ColumnarASGraphInfo | ASGraphInfo):
+            return list(self.asns) == list(other.asns)
+        else:
+            return NotImplemented
+
+    @staticmethod
+    def _get_link_keys(
+        asns1: Sequence[int], asns2: Sequence[int]
+    ) -> Iterable[tuple[int, int]]:
+        """Returns the sorted ASNs of each link, all at C speed"""
+
+        return zip(map(min, asns1, asns2), map(max, asns1, asns2), strict=True)
+
+    ###############
+    # Conversions #
+    ###############
+
+    @classmethod
+    def from_pairs(
+        cls,
+        cp_asns: Sequence[int],
+        peer_asns: Sequence[int],
+        unlinked_asns: Iterable[int] = (),
+        ixp_asns: Iterable[int] = (),
+        input_clique_asns: Iterable[int] = (),
+    ) -> "ColumnarASGraphInfo":
+        """Creates from flat (provider, customer) and (peer, peer) ASN pairs
+
+        Duplicate links are only added once, as they would be in the
+        frozensets of ASGraphInfo
+        """
+
+        provider_asns, customer_asns = cls._get_unique_links(
+            cp_asns[0::2], cp_asns[1::2]
+        )
+        peer1_asns, peer2_asns = cls._get_unique_links(
+            # Sorted, so that the same peers in either order are the same link
+            array(_TYPECODE, map(min, peer_asns[0::2], peer_asns[1::2])),
+            array(_TYPECODE, map(max, peer_asns[0::2], peer_asns[1::2])),
+        )
+        return cls(
+            provider_asns=provider_asns,
+            customer_asns=customer_asns,
+            peer1_asns=peer1_asns,
+            peer2_asns=peer2_asns,
+            unlinked_asns=frozenset(unlinked_asns),
+            ixp_asns=frozenset(ixp_asns),
+            input_clique_asns=frozenset(input_clique_asns),
+        )
+
+    @staticmethod
+    def _get_unique_links(
+        asns1: Sequence[int], asns2: Sequence[int]
+    ) -> tuple[Sequence[int], Sequence[int]]:
+        """Removes duplicate links, keeping the order of the first of each"""
+
+        unique_links = dict.fromkeys(zip(asns1, asns2, strict=True))
+        if len(unique_links) == len(asns1):
+            return asns1, asns2
+        else:
+            return (
+                array(_TYPECODE, [x for x, _ in unique_links]),
+                array(_TYPECODE, [x for _, x in unique_links]),
+            )
+
+    @classmethod
+    def from_as_graph_info(cls, as_graph_info: ASGraphInfo) -> "ColumnarASGraphInfo":
+        cp_links = as_graph_info.customer_provider_links
+        peer_links = as_graph_info.peer_links
+        return cls(
+            provider_asns=array(_TYPECODE, [x.provider_asn for x in cp_links]),
+            customer_asns=array(_TYPECODE, [x.customer_asn for x in cp_links]),
+            peer1_asns=array(_TYPECODE, [x.peer_asns[0] for x in peer_links]),
+            peer2_asns=array(_TYPECODE, [x.peer_asns[1] for x in peer_links]),
+            unlinked_asns=as_graph_info.unlinked_asns,
+            ixp_asns=as_graph_info.ixp_asns,
+            input_clique_asns=as_graph_info.input_clique_asns,
+            diagram_ranks=as_graph_info.diagram_ranks,
+        )
+
+    def to_as_graph_info(self) -> ASGraphInfo:
+        return ASGraphInfo(
+            customer_provider_links=self.customer_provider_links,
+            peer_links=self.peer_links,
+            unlinked_asns=self.unlinked_asns,
+            ixp_asns=self.ixp_asns,
+            input_clique_asns=self.input_clique_asns,
+            diagram_ranks=self.diagram_ranks,
+        )
+
+    #########
+    # Links #
+    #########
+
+    @property
+    def customer_provider_links(self) -> frozenset[CPLink]:
+        return frozenset(
+            [
+                CPLink(provider_asn=provider_asn, customer_asn=customer_asn)
+                for provider_asn, customer_asn in zip(
+                    self.provider_asns, self.customer_asns, strict=True
+                )
+            ]
+        )
+
+    @property
+    def peer_links(self) -> frozenset[PeerLink]:
+        return frozenset(
+            [
+                PeerLink(peer1_asn, peer2_asn)
+                for peer1_asn, peer2_asn in zip(
+                    self.peer1_asns, self.peer2_asns, strict=True
+                )
+            ]
+        )
+
+    @property
+    def links(self) -> frozenset[Link]:
+        """Returns all the links"""
+
+        return frozenset({*self.customer_provider_links, *self.peer_links})
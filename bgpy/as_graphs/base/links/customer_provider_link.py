@@ -9,6 +9,12 @@ class CustomerProviderLink(Link):
 
         self.__customer_asn: int = int(customer_asn)
         self.__provider_asn: int = int(provider_asn)
+        # Sorted once here since this is used for every hash
+        self.__asns: tuple[int, int] = (
+            (self.__customer_asn, self.__provider_asn)
+            if self.__customer_asn <= self.__provider_asn
+            else (self.__provider_asn, self.__customer_asn)
+        )
         super().__init__(customer_asn, provider_asn)
 
     def __hash__(self) -> int:
@@ -44,6 +50,4 @@ class CustomerProviderLink(Link):
     def asns(self) -> tuple[int, ...]:
         """Returns asns associated with this link. Used for hashing"""
 
-        asns = sorted([self.customer_asn, self.provider_asn])
-        assert len(asns) == 2, "mypy type check"
-        return tuple(asns)
+        return self.__asns
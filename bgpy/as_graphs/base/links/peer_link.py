@@ -1,5 +1,3 @@
-from typing import cast
-
 from .link import Link
 
 
@@ -9,8 +7,10 @@ class PeerLink(Link):
     def __init__(self, peer1_asn: int, peer2_asn: int):
         """Saves the link info"""
 
-        self.__peer_asns: tuple[int, int] = cast(
-            tuple[int, int], tuple(sorted([int(peer1_asn), int(peer2_asn)]))
+        peer1_asn, peer2_asn = int(peer1_asn), int(peer2_asn)
+        # Sorted once here since this is used for every hash
+        self.__peer_asns: tuple[int, int] = (
+            (peer1_asn, peer2_asn) if peer1_asn <= peer2_asn else (peer2_asn, peer1_asn)
         )
         super(PeerLink, self).__init__(peer1_asn, peer2_asn)
 
@@ -38,4 +38,5 @@ class PeerLink(Link):
     def asns(self) -> tuple[int, ...]:
         """Returns asns associated with this link"""
 
-        return tuple(sorted(self.__peer_asns))
+        # Already sorted in __init__
+        return self.__peer_asns
@@ -0,0 +1,202 @@
+from array import array
+from collections.abc import Iterable, Sequence
+from multiprocessing.shared_memory import SharedMemory
+
+from .as_graph_attrs import ASGraphAttrs
+from .as_graph_info import ASGraphInfo
+from .columnar_as_graph_info import ColumnarASGraphInfo
+
+# Bump this whenever the layout below changes
+SHARED_AS_GRAPH_INFO_VERSION = 2
+# num cp links, num peer links, num unlinked, num ixps, num input clique
+_INFO_HEADER_LEN = 5
+# All values are stored as signed 64 bit ints
+_TYPECODE = "q"
+
+
+def as_graph_info_to_array(
+    as_graph_info: ASGraphInfo | ColumnarASGraphInfo,
+) -> array:
+    """Packs ASGraphInfo into a flat int64 array
+
+    Layout: header of section lengths, then customer provider links as
+    (provider, customer) pairs, peer links as pairs, then unlinked ASNs,
+    IXP ASNs, and input clique ASNs
+
+    NOTE: diagram_ranks are not stored, since they are only for diagrams
+    """
+
+    if isinstance(as_graph_info, ASGraphInfo):
+        as_graph_info = ColumnarASGraphInfo.from_as_graph_info(as_graph_info)
+
+    sections: tuple[array | list[int], ...] = (
+        _interleave(as_graph_info.provider_asns, as_graph_info.customer_asns),
+        _interleave(as_graph_info.peer1_asns, as_graph_info.peer2_asns),
+        sorted(as_graph_info.unlinked_asns),
+        sorted(as_graph_info.ixp_asns),
+        sorted(as_graph_info.input_clique_asns),
+    )
+    header = [len(sections[0]) // 2, len(sections[1]) // 2]
+    header.extend(len(x) for x in sections[2:])
+    assert len(header) == _INFO_HEADER_LEN, "Header is the wrong length"
+    values = array(_TYPECODE, header)
+    for section in sections:
+        values.extend(section)
+    return values
+
+
+def _interleave(asns1: array, asns2: array) -> array:
+    """Returns asns1[0], asns2[0], asns1[1], asns2[1], ..."""
+
+    pairs = array(_TYPECODE, bytes(len(asns1) * 2 * asns1.itemsize))
+    pairs[0::2] = asns1
+    pairs[1::2] = asns2
+    return pairs
+
+
+def as_graph_info_from_values(
+    values: Sequence[int], start: int = 0
+) -> tuple[ColumnarASGraphInfo, int]:
+    """Unpacks ASGraphInfo packed by as_graph_info_to_array
+
+    Returns the ColumnarASGraphInfo and the index just past it within values.
+    values is usually the int64 array itself, so that the link columns are
+    sliced out of it at C speed without creating an int object per ASN
+    """
+
+    num_cp_links, num_peer_links, *section_lens = values[
+        start : start + _INFO_HEADER_LEN
+    ]
+
+    cp_start = start + _INFO_HEADER_LEN
+    peer_start = cp_start + num_cp_links * 2
+    peer_end = peer_start + num_peer_links * 2
+
+    i = peer_end
+    asn_sections: list[frozenset[int]] = list()
+    for section_len in section_lens:
+        asn_sections.append(frozenset(values[i : i + section_len]))
+        i += section_len
+
+    unlinked_asns, ixp_asns, input_clique_asns = asn_sections
+    as_graph_info = ColumnarASGraphInfo(
+        provider_asns=array(_TYPECODE, values[cp_start:peer_start:2]),
+        customer_asns=array(_TYPECODE, values[cp_start + 1 : peer_start : 2]),
+        peer1_asns=array(_TYPECODE, values[peer_start:peer_end:2]),
+        peer2_asns=array(_TYPECODE, values[peer_start + 1 : peer_end : 2]),
+        unlinked_asns=unlinked_asns,
+        ixp_asns=ixp_asns,
+        input_clique_asns=input_clique_asns,
+    )
+    return as_graph_info, i
+
+
+def as_graph_info_from_arrays(
+    cp_asns: Sequence[int],
+    peer_asns: Sequence[int],
+    unlinked_asns: Iterable[int] = (),
+    ixp_asns: Iterable[int] = (),
+    input_clique_asns: Iterable[int] = (),
+) -> ColumnarASGraphInfo:
+    """Creates ASGraphInfo from flat (provider, customer) and (peer, peer) pairs
+
+    Duplicate links are only added once. Kept for existing callers, this is
+    now ColumnarASGraphInfo.from_pairs
+    """
+
+    return ColumnarASGraphInfo.from_pairs(
+        cp_asns,
+        peer_asns,
+        unlinked_asns=unlinked_asns,
+        ixp_asns=ixp_asns,
+        input_clique_asns=input_clique_asns,
+    )
+
+
+class SharedASGraphInfo:
+    """ASGraphInfo packed into a multiprocessing.shared_memory block
+
+    The parent process parses the topology once and packs it here, along with
+    the ASGraphAttrs (ranks and cones) if it has them. Workers attach to the
+    block by name (read only) and build their ASGraph from it, rather than
+    each worker re-reading and re-parsing the CAIDA file and recomputing
+    the ranks and cones. This only saves that work, not memory, since
+    every worker still builds a full ASGraph (AS objects and all).
+
+    Layout (all int64): the version, as_graph_info_to_array's layout, whether
+    ASGraphAttrs are stored (0 or 1), then ASGraphAttrs.to_array's layout
+    """
+
+    def __init__(self, name: str, shared_memory: SharedMemory | None = None) -> None:
+        """Attaches to an existing block (unless it was just created)
+
+        NOTE: only attach from processes started by the creating process (i.e.
+        with multiprocessing) so that they share the creator's resource tracker
+        """
+
+        self.name: str = name
+        # Only the creator unlinks the block
+        self.owner: bool = shared_memory is not None
+        if shared_memory is None:
+            shared_memory = SharedMemory(name=name)
+        self.shared_memory: SharedMemory = shared_memory
+
+    @classmethod
+    def from_as_graph_info(
+        cls,
+        as_graph_info: ASGraphInfo | ColumnarASGraphInfo,
+        as_graph_attrs: ASGraphAttrs | None = None,
+    ) -> "SharedASGraphInfo":
+        """Creates a new shared memory block from ASGraphInfo (and ASGraphAttrs)"""
+
+        values = array(_TYPECODE, [SHARED_AS_GRAPH_INFO_VERSION])
+        values.extend(as_graph_info_to_array(as_graph_info))
+        values.append(int(as_graph_attrs is not None))
+        if as_graph_attrs is not None:
+            values.extend(as_graph_attrs.to_array())
+
+        num_bytes = len(values) * values.itemsize
+        shared_memory = SharedMemory(create=True, size=num_bytes)
+        shared_memory.buf[:num_bytes] = values.tobytes()
+        return cls(shared_memory.name, shared_memory=shared_memory)
+
+    def to_as_graph_info(self) -> ColumnarASGraphInfo:
+        """Reads the shared memory block back into ASGraphInfo"""
+
+        return self.read()[0]
+
+    def read(self) -> tuple[ColumnarASGraphInfo, ASGraphAttrs | None]:
+        """Reads the shared memory block back into ASGraphInfo and ASGraphAttrs"""
+
+        # Copying the bytes into an array is a single memcpy, and the columns
+        # are then sliced out of it without an int object per value
+        values = array(_TYPECODE)
+        values.frombytes(self.shared_memory.buf)
+
+        version = values[0]
+        if version != SHARED_AS_GRAPH_INFO_VERSION:
+            raise ValueError(
+                f"Shared AS graph info is version {version}, "
+                f"expected {SHARED_AS_GRAPH_INFO_VERSION}"
+            )
+        as_graph_info, i = as_graph_info_from_values(values, start=1)
+        if values[i]:
+            as_graph_attrs: ASGraphAttrs | None = ASGraphAttrs.from_values(
+                values, start=i + 1
+            )[0]
+        else:
+            as_graph_attrs = None
+        return as_graph_info, as_graph_attrs
+
+    def close(self) -> None:
+        """Closes this process's view of the block, and frees it if the owner"""
+
+        self.shared_memory.close()
+        if self.owner:
+            self.shared_memory.unlink()
+
+    def __enter__(self) -> "SharedASGraphInfo":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -1,14 +1,9 @@
-import bz2
 import shutil
 from datetime import datetime, timedelta
 from functools import cached_property
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import cast
 
-import requests
-from bs4 import BeautifulSoup as Soup
-
 from bgpy.as_graphs.base import ASGraphCollector
 from bgpy.shared.constants import bgpy_logger
 from bgpy.shared.exceptions import NoCAIDAURLError
@@ -26,17 +21,31 @@ class CAIDAASGraphCollector(ASGraphCollector):
         if cache is True it uses the downloaded file that was cached
         """
 
+        # Unzipped cache from older versions, which the constructor also parses
+        if not self.cache_path.exists() and self.text_cache_path.exists():
+            return self.text_cache_path
         if not self.cache_path.exists():
             bgpy_logger.info("No caida graph cached. Caching...")
-            # Create a temporary dir to write to
-            with TemporaryDirectory() as tmp_dir:
-                # Path to bz2 download
-                bz2_path: Path = Path(tmp_dir) / "download.bz2"
-                # Download Bz2
-                self._download_bz2_file(self._get_url(self.dl_time), bz2_path)
-                self._unzip_and_write_to_cache(bz2_path)
+            # The constructor parses the bz2 file directly, so it's cached as is.
+            # Downloads to a tmp file first so that a failed download isn't cached
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            self._download_bz2_file(self._get_url(self.dl_time), tmp_path)
+            tmp_path.replace(self.cache_path)
         return self.cache_path
 
+    @cached_property
+    def cache_path(self) -> Path:
+        """Path to the cached bz2 file for that day"""
+
+        fmt = f"{self.__class__.__name__}_%Y.%m.%d.txt.bz2"
+        return self.cache_dir / self.dl_time.strftime(fmt)
+
+    @property
+    def text_cache_path(self) -> Path:
+        """Path to the unzipped file that older versions cached instead"""
+
+        return self.cache_path.with_suffix("")
+
     @cached_property
     def default_dl_time(self) -> datetime:
         """Returns default DL time.
@@ -73,6 +82,10 @@ class CAIDAASGraphCollector(ASGraphCollector):
     def _get_hrefs(self, url: str) -> list[str]:
         """Returns hrefs from a tags at a given url"""
 
+        # These are slow to import and only needed when nothing is cached
+        import requests
+        from bs4 import BeautifulSoup as Soup
+
         try:
             # Query URL
             with requests.get(url, stream=True, timeout=30) as r:
@@ -96,18 +109,11 @@ class CAIDAASGraphCollector(ASGraphCollector):
     def _download_bz2_file(self, url: str, bz2_path: Path) -> None:
         """Downloads bz2 file from caida"""
 
+        import requests
+
         # https://stackoverflow.com/a/39217788/8903959
         # Download the file
         with requests.get(url, stream=True, timeout=5) as r:
             r.raise_for_status()
             with bz2_path.open("wb") as f:
                 shutil.copyfileobj(r.raw, f)
-
-    def _unzip_and_write_to_cache(self, bz2_path: Path) -> None:
-        """Unzips bz2 file and writes to cache"""
-
-        # Unzip and read
-        with bz2.open(bz2_path, mode="rb") as bz2_f, self.cache_path.open("w") as txt_f:
-            for line in bz2_f:
-                # Must decode the bytes into strings and strip
-                txt_f.write(line.decode().strip() + "\n")
@@ -0,0 +1,122 @@
+import bz2
+from array import array
+from itertools import compress
+from pathlib import Path
+from typing import BinaryIO
+
+# Bytes read (decompressed) per block
+BLOCK_SIZE = 4 * 1024 * 1024
+# <as1>|<as2>|<relationship>|<source>
+_NUM_FIELDS = 4
+# Relationship field values
+_CUSTOMER_PROVIDER_REL = b"-1"
+_PEER_REL = b"0"
+
+
+def read_serial_2(
+    path: Path, invalid_asns: frozenset[int] = frozenset()
+) -> tuple[array, array, set[int], set[int]]:
+    """Parses a CAIDA serial-2 file (bz2 compressed or not) into int arrays
+
+    https://publicdata.caida.org/datasets/as-relationships/serial-2/
+
+    Returns (provider, customer) ASN pairs, (peer, peer) ASN pairs,
+    IXP ASNs, and input clique ASNs. Links with an invalid ASN are dropped.
+
+    Rather than going line by line, this reads large blocks and splits the
+    records of each block at once, classifying each record by its
+    relationship field (-1 for customer provider, 0 for peers)
+    """
+
+    cp_asns = array("q")
+    peer_asns = array("q")
+    ixp_asns: set[int] = set()
+    input_clique_asns: set[int] = set()
+
+    with _open(path) as f:
+        # Partial last line of the previous block
+        remainder = b""
+        while block := f.read(BLOCK_SIZE):
+            block = remainder + block
+            block, _, remainder = block.rpartition(b"\n")
+            _parse_block(block, cp_asns, peer_asns, ixp_asns, input_clique_asns)
+        _parse_block(remainder, cp_asns, peer_asns, ixp_asns, input_clique_asns)
+
+    if invalid_asns:
+        cp_asns = _remove_invalid_links(cp_asns, invalid_asns)
+        peer_asns = _remove_invalid_links(peer_asns, invalid_asns)
+        ixp_asns.difference_update(invalid_asns)
+        input_clique_asns.difference_update(invalid_asns)
+    return cp_asns, peer_asns, ixp_asns, input_clique_asns
+
+
+def _open(path: Path) -> BinaryIO:
+    if path.suffix == ".bz2":
+        return bz2.open(path, mode="rb")
+    else:
+        return path.open("rb")
+
+
+def _parse_block(
+    block: bytes,
+    cp_asns: array,
+    peer_asns: array,
+    ixp_asns: set[int],
+    input_clique_asns: set[int],
+) -> None:
+    """Parses the whole lines of a block, adding them to the arrays/sets"""
+
+    block = block.strip()
+    # Comments and blank lines are rare, so only split lines when they exist
+    if block.startswith(b"#") or b"\n#" in block or b"\n\n" in block:
+        lines: list[bytes] = list()
+        for line in map(bytes.strip, block.split(b"\n")):
+            # Get CAIDA input clique. See paper on site for what this is
+            if line.startswith(b"# input clique"):
+                input_clique_asns.update(map(int, line.split(b":")[-1].split()))
+            # Get detected CAIDA IXPs. See paper on site for what this is
+            elif line.startswith(b"# IXP ASes"):
+                ixp_asns.update(map(int, line.split(b":")[-1].split()))
+            elif line and not line.startswith(b"#"):
+                lines.append(line)
+        block = b"\n".join(lines)
+    if not block:
+        return
+
+    fields = block.replace(b"\n", b"|").split(b"|")
+    if len(fields) % _NUM_FIELDS:
+        raise ValueError(
+            "serial-2 lines must be <as1>|<as2>|<relationship>|<source>, "
+            f"got {len(fields)} fields in a block of {len(block)} bytes"
+        )
+    rels = fields[2::_NUM_FIELDS]
+    is_cp = list(map(_CUSTOMER_PROVIDER_REL.__eq__, rels))
+    is_peer = list(map(_PEER_REL.__eq__, rels))
+    num_cp = sum(is_cp)
+    num_peers = sum(is_peer)
+    if num_cp + num_peers != len(rels):
+        unknown_rels = set(rels) - {_CUSTOMER_PROVIDER_REL, _PEER_REL}
+        raise ValueError(f"Unknown serial-2 relationships {unknown_rels}")
+
+    as1s = fields[0::_NUM_FIELDS]
+    as2s = fields[1::_NUM_FIELDS]
+    for asns, is_rel, num_links in (
+        (cp_asns, is_cp, num_cp),
+        (peer_asns, is_peer, num_peers),
+    ):
+        # Interleaved as1, as2 pairs of this relationship
+        pairs: list[bytes] = [b""] * (num_links * 2)
+        pairs[0::2] = compress(as1s, is_rel)
+        pairs[1::2] = compress(as2s, is_rel)
+        asns.extend(map(int, pairs))
+
+
+def _remove_invalid_links(asns: array, invalid_asns: frozenset[int]) -> array:
+    """Returns the ASN pairs that don't include an invalid ASN"""
+
+    valid_asns = array("q")
+    for as1, as2 in zip(asns[0::2], asns[1::2], strict=True):
+        if as1 not in invalid_asns and as2 not in invalid_asns:
+            valid_asns.append(as1)
+            valid_asns.append(as2)
+    return valid_asns
@@ -0,0 +1,9 @@
+from .synthetic_as_graph_generator import SyntheticASGraphGenerator
+from .simple_synthetic_as_graph_collector import SimpleSyntheticASGraphCollector
+from .synthetic_as_graph_collector import SyntheticASGraphCollector
+
+__all__ = [
+    "SimpleSyntheticASGraphCollector",
+    "SyntheticASGraphCollector",
+    "SyntheticASGraphGenerator",
+]
@@ -0,0 +1,117 @@
+import random
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+
+from bgpy.as_graphs.base import ASGraphCollector
+from bgpy.shared.constants import DIRS, bgpy_logger
+
+
+class SimpleSyntheticASGraphCollector(ASGraphCollector):
+    """Generates a seeded AS topology and caches it in CAIDA's serial-2 format
+
+    This allows for offline runs (such as benchmarks) with
+    CAIDAASGraphConstructor(ASGraphCollectorCls=SimpleSyntheticASGraphCollector).
+    The topology only depends on num_ases and seed, so it's cached by those
+    rather than by the day
+
+    ASes are layered into an input clique (all peering with one another),
+    transit ASes (with providers among the input clique and earlier transit
+    ASes, and some peers), and stubs (with providers among the transit ASes).
+    For CAIDA-like degree distributions, use SyntheticASGraphCollector
+    """
+
+    def __init__(
+        self,
+        num_ases: int = 10_000,
+        seed: int = 0,
+        dl_time: datetime | None = None,
+        cache_dir: Path = Path(DIRS.user_cache_dir) / "synthetic_as_graphs",
+    ) -> None:
+        if num_ases < 3:
+            raise ValueError("A synthetic AS graph needs at least 3 ASes")
+        self.num_ases: int = num_ases
+        self.seed: int = seed
+        super().__init__(dl_time=dl_time, cache_dir=cache_dir)
+
+    def _run(self) -> Path:
+        """Generates the topology into the cache, if it's not cached yet"""
+
+        if not self.cache_path.exists():
+            bgpy_logger.info(f"Generating {self.num_ases} AS synthetic graph...")
+            # Write to a temporary file first so that a crash can't leave
+            # a partial topology in the cache
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            self._write_serial_2(tmp_path)
+            tmp_path.replace(self.cache_path)
+        return self.cache_path
+
+    @cached_property
+    def cache_path(self) -> Path:
+        """Path to the cached topology for these settings"""
+
+        settings = "_".join(self._get_cache_settings())
+        return self.cache_dir / f"{self.__class__.__name__}_{settings}.txt"
+
+    def _get_cache_settings(self) -> list[str]:
+        """Returns every setting that the topology depends on"""
+
+        return [str(self.num_ases), str(self.seed)]
+
+    @cached_property
+    def default_dl_time(self) -> datetime:
+        """Returns the default download time (the topology doesn't depend on it)"""
+
+        return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    ##################
+    # Topology funcs #
+    ##################
+
+    def _write_serial_2(self, path: Path) -> None:
+        """Writes the topology to path in CAIDA's serial-2 format"""
+
+        with path.open("w") as f:
+            f.writelines(self._get_lines())
+
+    def _get_lines(self) -> list[str]:
+        """Returns the lines of the topology in CAIDA's serial-2 format
+
+        <provider-as>|<customer-as>|-1|<source>
+        <peer-as>|<peer-as>|0|<source>
+        """
+
+        rng = random.Random(self.seed)  # noqa: S311
+        num_clique = max(2, min(10, self.num_ases // 100))
+        num_transit = max(1, self.num_ases * 15 // 100)
+        clique_asns = list(range(1, num_clique + 1))
+        transit_asns = list(range(num_clique + 1, num_clique + num_transit + 1))
+        stub_asns = list(range(num_clique + num_transit + 1, self.num_ases + 1))
+
+        # (provider, customer) pairs. Providers always have lower ASNs than
+        # their customers, so there are no customer provider cycles
+        cp_links: set[tuple[int, int]] = set()
+        for i, asn in enumerate(transit_asns):
+            possible_providers = clique_asns + transit_asns[:i]
+            for provider_asn in rng.sample(
+                possible_providers, min(len(possible_providers), rng.randint(1, 3))
+            ):
+                cp_links.add((provider_asn, asn))
+        for asn in stub_asns:
+            for provider_asn in rng.sample(transit_asns, min(2, rng.randint(1, 2))):
+                cp_links.add((provider_asn, asn))
+
+        peer_links: set[tuple[int, int]] = {
+            (x, y) for x in clique_asns for y in clique_asns if x < y
+        }
+        for asn in transit_asns:
+            for peer_asn in rng.sample(transit_asns, min(len(transit_asns), 2)):
+                link = (min(asn, peer_asn), max(asn, peer_asn))
+                if asn != peer_asn and link not in cp_links:
+                    peer_links.add(link)
+
+        return [
+            "# input clique: " + " ".join(str(x) for x in clique_asns) + "\n",
+            *[f"{x}|{y}|-1|bgp\n" for x, y in sorted(cp_links)],
+            *[f"{x}|{y}|0|bgp\n" for x, y in sorted(peer_links)],
+        ]
@@ -0,0 +1,47 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from frozendict import frozendict
+
+from bgpy.shared.constants import DIRS
+
+from .simple_synthetic_as_graph_collector import SimpleSyntheticASGraphCollector
+from .synthetic_as_graph_generator import SyntheticASGraphGenerator
+
+
+class SyntheticASGraphCollector(SimpleSyntheticASGraphCollector):
+    """Generates a seeded CAIDA-like AS topology in CAIDA's serial-2 format
+
+    Like SimpleSyntheticASGraphCollector, but the topology comes from the
+    SyntheticASGraphGenerator, so it's cached by the generator's settings too
+    """
+
+    def __init__(
+        self,
+        num_ases: int = 10_000,
+        seed: int = 0,
+        # Other kwargs for the SyntheticASGraphGenerator
+        generator_kwargs: frozendict[str, Any] = frozendict(),
+        dl_time: datetime | None = None,
+        cache_dir: Path = Path(DIRS.user_cache_dir) / "synthetic_as_graphs",
+    ) -> None:
+        self.generator: SyntheticASGraphGenerator = SyntheticASGraphGenerator(
+            num_ases, seed, **generator_kwargs
+        )
+        self.generator_kwargs: frozendict[str, Any] = generator_kwargs
+        super().__init__(
+            num_ases=num_ases, seed=seed, dl_time=dl_time, cache_dir=cache_dir
+        )
+
+    def _get_cache_settings(self) -> list[str]:
+        """Returns every setting that the topology depends on"""
+
+        settings = super()._get_cache_settings()
+        settings.extend(f"{k}={v}" for k, v in sorted(self.generator_kwargs.items()))
+        return settings
+
+    def _write_serial_2(self, path: Path) -> None:
+        """Writes the generator's topology to path in CAIDA's serial-2 format"""
+
+        self.generator.write_serial_2(path)
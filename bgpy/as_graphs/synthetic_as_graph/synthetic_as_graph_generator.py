@@ -0,0 +1,251 @@
+import random
+from array import array
+from functools import cached_property
+from pathlib import Path
+
+from bgpy.as_graphs.base import ColumnarASGraphInfo
+
+# Probabilities of 1, 2, 3, ... providers
+TRANSIT_NUM_PROVIDERS_WEIGHTS: tuple[float, ...] = (0.35, 0.35, 0.2, 0.1)
+STUB_NUM_PROVIDERS_WEIGHTS: tuple[float, ...] = (0.55, 0.35, 0.1)
+
+
+class SyntheticASGraphGenerator:
+    """Generates a seeded AS topology that's shaped like CAIDA's
+
+    This is for measuring how the simulator scales (from 1k to 1M ASes)
+    without downloading a topology. The same settings always generate
+    the same topology.
+
+    ASNs are assigned in tiers from the top of the hierarchy down:
+
+    1. The input clique, which all peer with one another
+    2. Transit ASes (transit_fraction of the ASes), each with providers
+       in the input clique or among the transit ASes before it
+    3. IXPs (route servers), which only peer with their members
+    4. Stubs and multihomed ASes, with providers among the transit ASes
+       and input clique
+
+    Since providers always come before their customers, there are no
+    customer provider cycles. Providers are picked by preferential attachment
+    (proportional to one plus their customers so far), which gives a power
+    law of customer degrees like the real AS graph, with a few huge providers.
+
+    Transit ASes also peer with peer_density other transit ASes on average,
+    again preferring large ones. Each IXP has a heavy tailed number of
+    members, mostly transit ASes and a few edge ASes
+    """
+
+    def __init__(
+        self,
+        num_ases: int = 10_000,
+        seed: int = 0,
+        *,
+        num_input_clique_ases: int | None = None,
+        transit_fraction: float = 0.15,
+        peer_density: float = 8.0,
+        num_ixps: int | None = None,
+    ) -> None:
+        # Defaults scale with the graph, roughly matching CAIDA at ~75k ASes
+        if num_input_clique_ases is None:
+            num_input_clique_ases = max(3, min(20, round(num_ases**0.25)))
+        if num_ixps is None:
+            num_ixps = num_ases // 500
+        num_transit = max(1, round(num_ases * transit_fraction))
+        if num_input_clique_ases + num_transit + num_ixps >= num_ases:
+            raise ValueError(
+                f"{num_ases} ASes isn't enough for an input clique of "
+                f"{num_input_clique_ases}, {num_transit} transit ASes, "
+                f"{num_ixps} IXPs, and at least one stub"
+            )
+
+        self.num_ases: int = num_ases
+        self.seed: int = seed
+        self.num_input_clique_ases: int = num_input_clique_ases
+        self.num_transit_ases: int = num_transit
+        self.peer_density: float = peer_density
+        self.num_ixps: int = num_ixps
+
+    ##########
+    # Output #
+    ##########
+
+    def get_as_graph_info(self) -> ColumnarASGraphInfo:
+        """Returns the topology as ColumnarASGraphInfo"""
+
+        cp_links, peer_links = self._links
+        return ColumnarASGraphInfo(
+            provider_asns=array("q", [x for x, _ in cp_links]),
+            customer_asns=array("q", [x for _, x in cp_links]),
+            peer1_asns=array("q", [x for x, _ in peer_links]),
+            peer2_asns=array("q", [x for _, x in peer_links]),
+            ixp_asns=frozenset(self.ixp_asns),
+            input_clique_asns=frozenset(self.input_clique_asns),
+        )
+
+    def write_serial_2(self, path: Path) -> None:
+        """Writes the topology to path in CAIDA's serial-2 format
+
+        <provider-as>|<customer-as>|-1|<source>
+        <peer-as>|<peer-as>|0|<source>
+        """
+
+        cp_links, peer_links = self._links
+        with path.open("w") as f:
+            f.write(f"# input clique: {' '.join(map(str, self.input_clique_asns))}\n")
+            if self.ixp_asns:
+                f.write(f"# IXP ASes: {' '.join(map(str, self.ixp_asns))}\n")
+            f.writelines(f"{x}|{y}|-1|bgp\n" for x, y in cp_links)
+            f.writelines(f"{x}|{y}|0|bgp\n" for x, y in peer_links)
+
+    #########
+    # Tiers #
+    #########
+
+    @property
+    def input_clique_asns(self) -> range:
+        return range(1, self.num_input_clique_ases + 1)
+
+    @property
+    def transit_asns(self) -> range:
+        start = self.input_clique_asns.stop
+        return range(start, start + self.num_transit_ases)
+
+    @property
+    def ixp_asns(self) -> range:
+        start = self.transit_asns.stop
+        return range(start, start + self.num_ixps)
+
+    @property
+    def edge_asns(self) -> range:
+        """Stubs and multihomed ASes"""
+
+        return range(self.ixp_asns.stop, self.num_ases + 1)
+
+    ####################
+    # Generation funcs #
+    ####################
+
+    @cached_property
+    def _links(self) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        """Returns the (provider, customer) and (peer, peer) links"""
+
+        rng = random.Random(self.seed)  # noqa: S311
+        # Every pair of linked ASNs (smaller ASN first), to not link twice
+        linked: set[tuple[int, int]] = set()
+        cp_links: list[tuple[int, int]] = list()
+        # Every possible provider once, plus once more per customer, so that
+        # picking uniformly from this is preferential attachment
+        provider_pool: list[int] = list(self.input_clique_asns)
+        # Transit ASes become possible providers for the ones after them
+        self._add_customer_provider_links(
+            rng,
+            self.transit_asns,
+            TRANSIT_NUM_PROVIDERS_WEIGHTS,
+            provider_pool,
+            linked,
+            cp_links,
+            customers_are_providers=True,
+        )
+        self._add_customer_provider_links(
+            rng,
+            self.edge_asns,
+            STUB_NUM_PROVIDERS_WEIGHTS,
+            provider_pool,
+            linked,
+            cp_links,
+            customers_are_providers=False,
+        )
+
+        peer_links = [
+            (x, y)
+            for x in self.input_clique_asns
+            for y in self.input_clique_asns
+            if x < y
+        ]
+        linked.update(peer_links)
+        self._add_transit_peer_links(rng, provider_pool, linked, peer_links)
+        self._add_ixp_peer_links(rng, linked, peer_links)
+        return cp_links, peer_links
+
+    def _add_customer_provider_links(
+        self,
+        rng: random.Random,
+        customer_asns: range,
+        num_providers_weights: tuple[float, ...],
+        provider_pool: list[int],
+        linked: set[tuple[int, int]],
+        cp_links: list[tuple[int, int]],
+        *,
+        customers_are_providers: bool,
+    ) -> None:
+        """Picks providers by preferential attachment, adding them to the pool"""
+
+        all_num_providers = rng.choices(
+            range(1, len(num_providers_weights) + 1),
+            weights=num_providers_weights,
+            k=len(customer_asns),
+        )
+        num_possible_providers = len(set(provider_pool))
+        random_ = rng.random
+        for customer_asn, num_providers in zip(
+            customer_asns, all_num_providers, strict=True
+        ):
+            providers: set[int] = set()
+            # There may not be enough providers yet at the top
+            for _ in range(min(num_providers, num_possible_providers)):
+                # Retry duplicates, since each AS needs distinct providers
+                provider_asn = provider_pool[int(random_() * len(provider_pool))]
+                while provider_asn in providers:
+                    provider_asn = provider_pool[int(random_() * len(provider_pool))]
+                providers.add(provider_asn)
+                cp_links.append((provider_asn, customer_asn))
+                linked.add((provider_asn, customer_asn))
+            provider_pool.extend(providers)
+            if customers_are_providers:
+                provider_pool.append(customer_asn)
+                num_possible_providers += 1
+
+    def _add_transit_peer_links(
+        self,
+        rng: random.Random,
+        provider_pool: list[int],
+        linked: set[tuple[int, int]],
+        peer_links: list[tuple[int, int]],
+    ) -> None:
+        """Peers transit ASes, preferring the ones with more customers"""
+
+        transit_asns = self.transit_asns
+        if len(transit_asns) < 2:
+            return
+        # Only the transit ASes of the pool, weighted by their customers
+        transit_pool = [x for x in provider_pool if x in transit_asns]
+        # Each link adds a peer to two ASes
+        for _ in range(round(len(transit_asns) * self.peer_density / 2)):
+            link = (rng.choice(transit_asns), rng.choice(transit_pool))
+            link = (min(link), max(link))
+            if link[0] != link[1] and link not in linked:
+                linked.add(link)
+                peer_links.append(link)
+
+    def _add_ixp_peer_links(
+        self,
+        rng: random.Random,
+        linked: set[tuple[int, int]],
+        peer_links: list[tuple[int, int]],
+    ) -> None:
+        """Peers each IXP with its members, mostly transit ASes"""
+
+        transit_asns = self.transit_asns
+        edge_asns = self.edge_asns
+        for ixp_asn in self.ixp_asns:
+            # Heavy tailed, with most IXPs being small
+            num_members = min(len(transit_asns), int(5 * rng.paretovariate(1.2)))
+            members = set(rng.sample(transit_asns, num_members))
+            # Some edge ASes join IXPs as well
+            members.update(rng.sample(edge_asns, min(len(edge_asns), num_members // 4)))
+            for member_asn in sorted(members):
+                link = (min(ixp_asn, member_asn), max(ixp_asn, member_asn))
+                if link not in linked:
+                    linked.add(link)
+                    peer_links.append(link)
@@ -17,3 +17,18 @@ class AnnouncementNotFoundError(RuntimeError):
     """
 
     pass
+
+
+class CustomerProviderCycleError(RuntimeError):
+    """Exception for when customer-provider links form a cycle
+
+    Then ASes can't be ranked for propagation
+    """
+
+    def __init__(self, cycle_asns: tuple[int, ...]) -> None:
+        # Each AS is a provider of the next, and the last a provider of the first
+        self.cycle_asns: tuple[int, ...] = cycle_asns
+        super().__init__(
+            "Customer-provider cycle (each AS is a provider of the next): "
+            + " -> ".join(str(x) for x in (*cycle_asns, cycle_asns[0]))
+        )
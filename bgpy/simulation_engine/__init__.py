@@ -1,5 +1,7 @@
 # Skip isort formatting due to circular imports if Announcement isn't first
 from .announcement import Announcement  # isort: skip
+from .adoption_index import AdoptionIndex, VerdictCache
+from .announcement_pool import AnnouncementPool, PooledAnnouncement
 from .ann_containers import LocalRIB, RecvQueue, RIBsIn, RIBsOut, SendQueue
 
 # Custom attacker policies
@@ -50,10 +52,21 @@ from .policies import (
     ROVPPV2LiteFull,
     ShortestPathPrefixASPAAttacker,
 )
-from .simulation_engines import BaseSimulationEngine, SimulationEngine
+from .instrumentation import Instrumentation
+from .simulation_engines import (
+    BaseSimulationEngine,
+    SimulationEngine,
+    FrontierCounter,
+    CSRGraph,
+    CSRSimulationEngine,
+)
 
 __all__ = [
     "Announcement",
+    "AdoptionIndex",
+    "VerdictCache",
+    "AnnouncementPool",
+    "PooledAnnouncement",
     "LocalRIB",
     "RIBsIn",
     "RIBsOut",
@@ -106,4 +119,8 @@ __all__ = [
     "FirstASNStrippingPrefixASPAAttacker",
     "BaseSimulationEngine",
     "SimulationEngine",
+    "FrontierCounter",
+    "Instrumentation",
+    "CSRGraph",
+    "CSRSimulationEngine",
 ]
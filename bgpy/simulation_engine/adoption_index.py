@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING, Any, Hashable, Iterable
+
+if TYPE_CHECKING:
+    from bgpy.as_graphs import AS
+
+    from .policies import Policy
+
+
+class VerdictCache:
+    """Memoized verdicts of a check, with counters for the hit rate"""
+
+    __slots__ = ("hits", "misses", "verdicts")
+
+    def __init__(self) -> None:
+        self.verdicts: dict[Hashable, Any] = dict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+class AdoptionIndex:
+    """ASNs of the ASes that run each policy class
+
+    Path validating policies check whether every ASN in an AS path runs some
+    policy. Rather than looking up each AS and checking isinstance on its
+    policy, they check if the ASN is in get_asns(PolicyCls), which is just a
+    set membership test. get_asns includes ASes running subclasses of
+    PolicyCls (just like isinstance), and is cached per PolicyCls.
+
+    The engine rebuilds this whenever it sets the policies of the ASes,
+    so it also holds the verdict caches of checks that depend only on the
+    AS path and on which ASes adopt (see get_verdict_cache)
+    """
+
+    __slots__ = ("_asns_cache", "_policy_cls_asns", "_verdict_caches")
+
+    def __init__(self, policy_cls_asns: dict[type["Policy"], list[int]]) -> None:
+        # ASNs of the ASes running exactly each policy class
+        self._policy_cls_asns: dict[type[Policy], list[int]] = policy_cls_asns
+        self._asns_cache: dict[type[Policy], frozenset[int]] = dict()
+        self._verdict_caches: dict[Hashable, VerdictCache] = dict()
+
+    @classmethod
+    def from_ases(cls, ases: Iterable["AS"]) -> "AdoptionIndex":
+        """Builds the index from the current policies of the ASes"""
+
+        policy_cls_asns: dict[type[Policy], list[int]] = dict()
+        for as_obj in ases:
+            policy_cls_asns.setdefault(as_obj.policy.__class__, []).append(as_obj.asn)
+        return cls(policy_cls_asns)
+
+    def get_asns(self, PolicyCls: type["Policy"]) -> frozenset[int]:
+        """Returns the ASNs of the ASes whose policy is an instance of PolicyCls"""
+
+        try:
+            return self._asns_cache[PolicyCls]
+        except KeyError:
+            asns = frozenset(
+                asn
+                for Cls, cls_asns in self._policy_cls_asns.items()
+                if issubclass(Cls, PolicyCls)
+                for asn in cls_asns
+            )
+            self._asns_cache[PolicyCls] = asns
+            return asns
+
+    def get_verdict_cache(self, check: Hashable) -> VerdictCache:
+        """Returns the VerdictCache for a check, shared by every AS
+
+        Since the index is rebuilt for every scenario, so are the caches
+        """
+
+        try:
+            return self._verdict_caches[check]
+        except KeyError:
+            verdict_cache = self._verdict_caches[check] = VerdictCache()
+            return verdict_cache
+
+    @property
+    def verdict_caches(self) -> dict[Hashable, VerdictCache]:
+        return self._verdict_caches
@@ -13,3 +13,19 @@ class LocalRIB(AnnContainer[str, "Ann"]):
         """Adds an announcement to local rib with prefix as key"""
 
         self.data[ann.prefix] = ann
+
+    def snapshot(self) -> dict[str, "Ann"]:
+        """Returns a copy of the anns by prefix, to check changed_since later"""
+
+        return self.data.copy()
+
+    def changed_since(self, snapshot: dict[str, "Ann"]) -> bool:
+        """Returns True if any ann was added, removed, or replaced since snapshot
+
+        Anns are frozen, so they are compared by identity
+        """
+
+        data = self.data
+        return len(data) != len(snapshot) or any(
+            snapshot.get(prefix) is not ann for prefix, ann in data.items()
+        )
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, replace
+from dataclasses import dataclass, fields, replace
 from typing import Any, Optional
 
 from yamlable import YamlAble, yaml_info
@@ -97,9 +97,12 @@ class Announcement(YamlAble):
     ##############
 
     def __to_yaml_dict__(self) -> dict[str, Any]:
-        """This optional method is called when you call yaml.dump()"""
+        """This optional method is called when you call yaml.dump()
 
-        return asdict(self)
+        Anns are frozen, so unlike asdict, this doesn't deep copy the attrs
+        """
+
+        return {field.name: getattr(self, field.name) for field in fields(self)}
 
     @classmethod
     def __from_yaml_dict__(
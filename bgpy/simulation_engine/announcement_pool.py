@@ -0,0 +1,243 @@
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from bgpy.shared.enums import Relationships
+
+if TYPE_CHECKING:
+    from .announcement import Announcement as Ann
+
+
+# Parent index of announcements that were added with add_root
+NO_PARENT = -1
+# Relationships by value, since calling Relationships(value) is slow
+_RELATIONSHIPS: dict[int, Relationships] = {x.value: x for x in Relationships}
+
+
+class AnnouncementPool:
+    """Interned announcements whose AS paths are stored as parent pointers
+
+    Copying announcements is the bottleneck for propagation. Rather than
+    creating a new AS path tuple and Announcement every time an AS processes
+    an announcement, the pool appends a single node (the ASN that was prepended
+    and the index of the announcement it was received from).
+
+    Root announcements (typically seeded announcements, or announcements already
+    in a local RIB) are stored in full, and every other field of a node
+    (prefix, timestamp, etc) comes from its root. Path lengths are stored per
+    node, and loop checks and tiebreakers walk the parent pointers, so the
+    AS path tuple is only built when an announcement is materialized
+    (i.e. written to a local RIB).
+
+    Only the CSRSimulationEngine propagates with the pool. The policies of the
+    SimulationEngine still copy announcements. Sending and processing
+    PooledAnnouncements there only avoids the copies of announcements that
+    lose to the current best (about half of them), and the best still has to
+    be materialized for the local RIB. The extra work per view made it no
+    faster, so it isn't worth views ending up in recv_qs, RIBsIn, etc.
+    """
+
+    __slots__ = (
+        "asns",
+        "next_hop_asns",
+        "parents",
+        "path_lens",
+        "recv_rels",
+        "root_anns",
+        "roots",
+    )
+
+    def __init__(self) -> None:
+        # ASN at the front of the AS path for each node
+        self.asns: array[int] = array("q")
+        # ASN of the AS that sent the announcement
+        # Not always the parent's ASN, since seeded AS paths can be forged
+        self.next_hop_asns: array[int] = array("q")
+        # Index of the node that this node was received from
+        self.parents: array[int] = array("i")
+        # Index of the root node, which stores all other fields
+        self.roots: array[int] = array("i")
+        self.path_lens: array[int] = array("i")
+        # recv_relationship.value for each node
+        self.recv_rels: bytearray = bytearray()
+        # Root index to the root announcement
+        self.root_anns: dict[int, Ann] = dict()
+
+    def __len__(self) -> int:
+        return len(self.asns)
+
+    def add_root(self, ann: "Ann") -> int:
+        """Interns a full announcement and returns its index"""
+
+        index = len(self.asns)
+        self.asns.append(ann.as_path[0])
+        self.next_hop_asns.append(ann.next_hop_asn)
+        self.parents.append(NO_PARENT)
+        self.roots.append(index)
+        self.path_lens.append(len(ann.as_path))
+        self.recv_rels.append(ann.recv_relationship.value)
+        self.root_anns[index] = ann
+        return index
+
+    def append(
+        self,
+        parent: int,
+        asn: int,
+        next_hop_asn: int,
+        recv_relationship_value: int,
+    ) -> int:
+        """Adds an announcement that asn received from parent, returns its index
+
+        Equivalent to parent.copy() with asn prepended to the AS path,
+        the next_hop_asn of the sender, and seed_asn of None
+        """
+
+        index = len(self.asns)
+        self.asns.append(asn)
+        self.next_hop_asns.append(next_hop_asn)
+        self.parents.append(parent)
+        self.roots.append(self.roots[parent])
+        self.path_lens.append(self.path_lens[parent] + 1)
+        self.recv_rels.append(recv_relationship_value)
+        return index
+
+    def as_path(self, index: int) -> tuple[int, ...]:
+        """Returns the AS path of a node, built from its parents
+
+        This isn't memoized, so that only materialized AS paths are stored
+        """
+
+        parent = self.parents[index]
+        if parent == NO_PARENT:
+            return self.root_anns[index].as_path
+        # Most nodes were received directly from a root, so skip the walk
+        elif self.parents[parent] == NO_PARENT:
+            return (self.asns[index], *self.root_anns[parent].as_path)
+        return (*self._get_prepended_asns(index), *self._get_root_as_path(index))
+
+    def path_asns(self, index: int) -> set[int]:
+        """Returns the ASNs on the AS path of a node, for loop checks"""
+
+        path_asns = set(self._get_root_as_path(index))
+        path_asns.update(self._get_prepended_asns(index))
+        return path_asns
+
+    def asn_at(self, index: int, position: int) -> int:
+        """Returns as_path[position] of a node by walking up its parents"""
+
+        parents = self.parents
+        while position and parents[index] != NO_PARENT:
+            index = parents[index]
+            position -= 1
+        if parents[index] == NO_PARENT:
+            return self.root_anns[index].as_path[position]
+        else:
+            return self.asns[index]
+
+    def _get_prepended_asns(self, index: int) -> list[int]:
+        """Returns the ASNs prepended after the root, in AS path order"""
+
+        asns = self.asns
+        parents = self.parents
+        prepended_asns: list[int] = list()
+        while parents[index] != NO_PARENT:
+            prepended_asns.append(asns[index])
+            index = parents[index]
+        return prepended_asns
+
+    def _get_root_as_path(self, index: int) -> tuple[int, ...]:
+        return self.root_anns[self.roots[index]].as_path
+
+    def next_hop_asn(self, index: int) -> int:
+        """Returns the ASN of the neighbor the announcement was received from"""
+
+        return self.next_hop_asns[index]
+
+    def origin(self, index: int) -> int:
+        """Returns the origin of the announcement"""
+
+        return self.root_anns[self.roots[index]].origin
+
+    def seed_asn(self, index: int) -> int | None:
+        if self.parents[index] == NO_PARENT:
+            return self.root_anns[index].seed_asn
+        else:
+            return None
+
+    def root_ann(self, index: int) -> "Ann":
+        """Returns the root announcement that all other fields come from"""
+
+        return self.root_anns[self.roots[index]]
+
+    def get_view(self, index: int) -> "PooledAnnouncement":
+        return PooledAnnouncement(self, index)
+
+    def materialize(
+        self, index: int, overwrite_default_kwargs: dict[Any, Any] | None = None
+    ) -> "Ann":
+        """Returns a full announcement for a node
+
+        overwrite_default_kwargs are applied in the same copy, like Ann.copy
+        """
+
+        root_ann = self.root_anns[self.roots[index]]
+        kwargs: dict[str, Any] = dict()
+        if self.parents[index] != NO_PARENT:
+            kwargs = {
+                "as_path": self.as_path(index),
+                "next_hop_asn": self.next_hop_asns[index],
+                "recv_relationship": _RELATIONSHIPS[self.recv_rels[index]],
+                "seed_asn": None,
+            }
+        if overwrite_default_kwargs:
+            kwargs.update(overwrite_default_kwargs)
+        return root_ann.copy(kwargs) if kwargs else root_ann
+
+
+class PooledAnnouncement:
+    """Read only view of an announcement within an AnnouncementPool
+
+    Behaves like an Announcement for reading, so that policy funcs that only
+    read announcements (i.e. ASPA._get_max_up_ramp_length) work with it
+    """
+
+    __slots__ = ("index", "pool")
+
+    def __init__(self, pool: AnnouncementPool, index: int) -> None:
+        self.pool: AnnouncementPool = pool
+        self.index: int = index
+
+    @property
+    def as_path(self) -> tuple[int, ...]:
+        return self.pool.as_path(self.index)
+
+    @property
+    def next_hop_asn(self) -> int:
+        return self.pool.next_hop_asn(self.index)
+
+    @property
+    def origin(self) -> int:
+        return self.pool.origin(self.index)
+
+    @property
+    def seed_asn(self) -> int | None:
+        return self.pool.seed_asn(self.index)
+
+    @property
+    def recv_relationship(self) -> Relationships:
+        return _RELATIONSHIPS[self.pool.recv_rels[self.index]]
+
+    def __getattr__(self, name: str) -> Any:
+        """All other fields come from the root announcement"""
+
+        return getattr(self.pool.root_ann(self.index), name)
+
+    def materialize(self) -> "Ann":
+        return self.pool.materialize(self.index)
+
+    def copy(self, overwrite_default_kwargs: dict[Any, Any] | None = None) -> "Ann":
+        """Materializes and copies the announcement in a single copy"""
+
+        return self.pool.materialize(self.index, overwrite_default_kwargs)
+
+    def __str__(self) -> str:
+        return f"{self.prefix} {self.as_path} {self.recv_relationship}"
@@ -0,0 +1,169 @@
+import json
+import time
+from collections import Counter
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from types import FunctionType
+from typing import Any, Callable, Iterator
+
+from .policies import Policy
+
+# Policy methods that count_policy_calls counts, and the event each counts
+POLICY_EVENTS: dict[str, str] = {
+    "receive_ann": "anns_received",
+    "_copy_and_process": "anns_copied",
+    "_valid_ann": "anns_validated",
+    "_get_best_ann_by_gao_rexford": "gao_rexford_comparisons",
+}
+
+_NULL_CONTEXT: AbstractContextManager[None] = nullcontext()
+
+
+class Instrumentation:
+    """Opt in wall time per phase and counts of hot path events
+
+    When disabled, time_phase returns a null context and count returns
+    immediately, so they're only called once per phase and cost nothing
+    next to the phase itself. The hot paths (receiving, validating,
+    copying, and comparing anns) aren't touched at all unless enabled,
+    in which case count_policy_calls wraps those Policy methods
+    (unless count_hot_paths is False, i.e. to time the phases without them).
+
+    Instrumentations from different workers are merged with +
+    """
+
+    __slots__ = (
+        "count_hot_paths",
+        "counts",
+        "enabled",
+        "phase_calls",
+        "phase_seconds",
+    )
+
+    def __init__(self, enabled: bool = False, count_hot_paths: bool = True) -> None:
+        self.enabled: bool = enabled
+        self.count_hot_paths: bool = count_hot_paths
+        self.phase_seconds: Counter[str] = Counter()
+        self.phase_calls: Counter[str] = Counter()
+        self.counts: Counter[str] = Counter()
+
+    def __add__(self, other: object) -> "Instrumentation":
+        if isinstance(other, Instrumentation):
+            instrumentation = Instrumentation(
+                enabled=self.enabled or other.enabled,
+                count_hot_paths=self.count_hot_paths or other.count_hot_paths,
+            )
+            instrumentation.phase_seconds = self.phase_seconds + other.phase_seconds
+            instrumentation.phase_calls = self.phase_calls + other.phase_calls
+            instrumentation.counts = self.counts + other.counts
+            return instrumentation
+        else:
+            return NotImplemented
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {x: getattr(self, x) for x in self.__slots__}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    ###########
+    # Timings #
+    ###########
+
+    def time_phase(self, phase: str) -> AbstractContextManager[None]:
+        """Returns a context manager that adds its wall time to the phase"""
+
+        return self._time_phase(phase) if self.enabled else _NULL_CONTEXT
+
+    @contextmanager
+    def _time_phase(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[phase] += time.perf_counter() - start
+            self.phase_calls[phase] += 1
+
+    ##########
+    # Counts #
+    ##########
+
+    def count(self, event: str, num: int = 1) -> None:
+        if self.enabled:
+            self.counts[event] += num
+
+    @contextmanager
+    def count_policy_calls(self) -> Iterator[None]:
+        """Counts calls to the POLICY_EVENTS methods of every policy class
+
+        Each policy class that defines one of the methods gets a counting
+        wrapper of it until the context exits. A call is only counted once,
+        even when subclasses call the super method. anns_rejected counts
+        the anns that _valid_ann returned False for
+        """
+
+        if not (self.enabled and self.count_hot_paths):
+            yield
+            return
+
+        # Whether a call of each method is already being counted
+        counting: dict[str, bool] = dict.fromkeys(POLICY_EVENTS, False)
+        originals: list[tuple[type[Policy], str, FunctionType]] = list()
+        for PolicyCls in (Policy, *Policy.subclass_to_name_dict):
+            for attr, func in vars(PolicyCls).items():
+                if attr in POLICY_EVENTS and isinstance(func, FunctionType):
+                    originals.append((PolicyCls, attr, func))
+                    setattr(
+                        PolicyCls, attr, self._get_counting_func(func, attr, counting)
+                    )
+        try:
+            yield
+        finally:
+            for PolicyCls, attr, func in originals:
+                setattr(PolicyCls, attr, func)
+
+    def _get_counting_func(
+        self, func: FunctionType, attr: str, counting: dict[str, bool]
+    ) -> Callable[..., Any]:
+        """Wraps a policy method to count it in the POLICY_EVENTS event"""
+
+        event = POLICY_EVENTS[attr]
+        counts = self.counts
+
+        @wraps(func)
+        def counting_func(*args, **kwargs):
+            # Called through super() from a call that's already being counted
+            if counting[attr]:
+                return func(*args, **kwargs)
+            counting[attr] = True
+            try:
+                rv = func(*args, **kwargs)
+            finally:
+                counting[attr] = False
+            counts[event] += 1
+            if attr == "_valid_ann" and not rv:
+                counts["anns_rejected"] += 1
+            return rv
+
+        return counting_func
+
+    ##########
+    # Output #
+    ##########
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "phases": {
+                phase: {
+                    "seconds": self.phase_seconds[phase],
+                    "calls": self.phase_calls[phase],
+                }
+                for phase in sorted(self.phase_seconds)
+            },
+            "counts": dict(sorted(self.counts.items())),
+        }
+
+    def write_json(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_dict(), indent=4))
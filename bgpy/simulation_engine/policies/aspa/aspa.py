@@ -13,7 +13,8 @@ class ASPA(ROV):
     We adopt from ROV since deploying ASPA makes no sense without ROV
 
     We experimented with adding a cache to the provider_check
-    but this has a negligible impact on performance
+    but this has a negligible impact on performance. Rather, the up-ramp and
+    down-ramp lengths are memoized per AS path (see _get_ramp_lengths)
 
     Removing the path reversals sped up performance by about 5%
     but made the code a lot less readable and deviated from the RFC,
@@ -81,12 +82,7 @@ class ASPA(ROV):
         Customer and Provider peering relationship. [i.e they reverse the path]
         """
 
-        reversed_path = ann.as_path[::-1]
-
-        for i in range(len(reversed_path) - 1):
-            if not self._provider_check(reversed_path[i], reversed_path[i + 1]):
-                return i + 1
-        return len(ann.as_path)
+        return self._get_ramp_lengths(ann.as_path)[0]
 
     def _downstream_check(self, ann: "Ann", from_rel: "Relationships") -> bool:
         """ASPA downstream check"""
@@ -114,16 +110,63 @@ class ASPA(ROV):
         AS(j-1) represents Customer and Provider peering relationship
         """
 
-        reversed_path = ann.as_path[::-1]
+        return self._get_ramp_lengths(ann.as_path)[1]
+
+    def _get_ramp_lengths(self, as_path: tuple[int, ...]) -> tuple[int, int]:
+        """Returns the max up-ramp and max down-ramp lengths of the AS path
+
+        These depend only on the AS path and on which ASes adopt ASPA, so the
+        same path doesn't need to be checked again by every AS that receives it.
+        They're memoized per scenario in the AS graph's AdoptionIndex.
 
-        # We want the max J, so start at the end of the reversed Path
-        # This is the most efficient way to traverse this
-        for i in range(len(reversed_path) - 1, 0, -1):
-            if not self._provider_check(reversed_path[i], reversed_path[i - 1]):
-                # Must add one due to zero indexing in python, vs 1 indexing in RFC
-                J = i + 1
-                return len(reversed_path) - J + 1
-        return len(ann.as_path)
+        Every AS prepends to the path it received, so the lengths are computed
+        from those of the longest known tail of the path, one hop at a time:
+        (with path = (A, *tail) and N = len(path))
+        max_up_ramp(path) = max_up_ramp(tail) if that's < N - 1 (the up-ramp
+        already ended in the tail), else N if authorized(tail[0], A) else N - 1
+        max_down_ramp(path) = 1 + max_down_ramp(tail) if authorized(A, tail[0])
+        else 1
+        """
+
+        # Keyed on the class, since subclasses could override the provider check
+        verdict_cache = self.as_.as_graph.adoption_index.get_verdict_cache(
+            self.__class__
+        )
+        verdicts = verdict_cache.verdicts
+        ramp_lengths = verdicts.get(as_path)
+        if ramp_lengths is not None:
+            verdict_cache.hits += 1
+            return ramp_lengths
+        verdict_cache.misses += 1
+
+        # Find the longest tail of the path with known ramp lengths
+        path_len = len(as_path)
+        for tail_start in range(1, path_len):
+            ramp_lengths = verdicts.get(as_path[tail_start:])
+            if ramp_lengths is not None:
+                break
+        else:
+            # A path of a single AS
+            tail_start = path_len - 1
+            ramp_lengths = (1, 1)
+
+        # Prepend the rest of the path one hop at a time
+        for i in range(tail_start - 1, -1, -1):
+            max_up_ramp, max_down_ramp = ramp_lengths
+            tail_len = path_len - i - 1
+            # The up-ramp only grows if it spans the whole tail
+            if max_up_ramp == tail_len and self._provider_check(
+                as_path[i + 1], as_path[i]
+            ):
+                max_up_ramp += 1
+            if self._provider_check(as_path[i], as_path[i + 1]):
+                max_down_ramp += 1
+            else:
+                max_down_ramp = 1
+            ramp_lengths = (max_up_ramp, max_down_ramp)
+            verdicts[as_path[i:]] = ramp_lengths
+        assert ramp_lengths is not None, "for mypy"
+        return ramp_lengths
 
     def _provider_check(self, asn1: int, asn2: int) -> bool:
         """Returns False if asn2 is not in asn1's provider_asns, AND asn1 adopts ASPA
@@ -136,9 +179,8 @@ class ASPA(ROV):
         True indicates No Attestation or Provider+
         """
 
-        cur_as_obj = self.as_.as_graph.as_dict[asn1]
-        if isinstance(cur_as_obj.policy, ASPA):
-            next_as_obj = self.as_.as_graph.as_dict[asn2]
-            if next_as_obj.asn not in cur_as_obj.provider_asns:
-                return False
-        return True
+        as_graph = self.as_.as_graph
+        return (
+            asn1 not in as_graph.adoption_index.get_asns(ASPA)
+            or asn2 in as_graph.as_dict[asn1].provider_asns
+        )
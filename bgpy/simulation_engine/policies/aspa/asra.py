@@ -32,12 +32,12 @@ class ASRA(ASPA):
         """Combines ASPA valid and checking neighbors at every AS"""
 
         as_path = ann.as_path
-        as_dict = self.as_.as_graph.as_dict
+        as_graph = self.as_.as_graph
+        asra_asns = as_graph.adoption_index.get_asns(ASRA)
         for i, asn in enumerate(as_path):
-            # Get the AS object for the current AS in the AS Path
-            asra_as_obj = as_dict[asn]
             # If the AS is an ASRA AS
-            if isinstance(asra_as_obj.policy, ASRA):
+            if asn in asra_asns:
+                asra_as_obj = as_graph.as_dict[asn]
                 # Check that both of it's neighbors are in the valid next hops
                 for neighbor_index in (i - 1, i + 1):
                     # Can't use try except IndexError here, since -1 is a valid index
@@ -17,6 +17,7 @@ from .process_incoming_funcs import (
     _copy_and_process,
     _reset_q,
     _valid_ann,
+    has_anns_to_process,
     process_incoming_anns,
     receive_ann,
     seed_ann,
@@ -28,6 +29,7 @@ from .propagate_funcs import (
     _prev_sent,
     _process_outgoing_ann,
     _propagate,
+    has_anns_to_send,
     propagate_to_customers,
     propagate_to_peers,
     propagate_to_providers,
@@ -61,10 +63,21 @@ class BGP(Policy):
         # This gets set within the AS class so it's fine
         self.as_: CallableProxyType[AS] = as_  # type: ignore
 
+    def reset(self) -> None:
+        """Clears all routing state in place so the policy can be reused
+
+        Subclasses that store additional state in __init__ must override this,
+        otherwise the engine will create a new policy instead of resetting it
+        """
+
+        self.local_rib.clear()
+        self.recv_q.clear()
+
     # Propagation functionality
     propagate_to_providers = propagate_to_providers
     propagate_to_customers = propagate_to_customers
     propagate_to_peers = propagate_to_peers
+    has_anns_to_send = has_anns_to_send
     _propagate = _propagate
     _policy_propagate = _policy_propagate
     _process_outgoing_ann = _process_outgoing_ann
@@ -74,6 +87,7 @@ class BGP(Policy):
     seed_ann = seed_ann
     receive_ann = receive_ann
     process_incoming_anns = process_incoming_anns
+    has_anns_to_process = has_anns_to_process
     _valid_ann = _valid_ann
     _copy_and_process = _copy_and_process
     _reset_q = _reset_q
@@ -26,6 +26,7 @@ class BGP(Policy):
         recv_q: RecvQueue | None = None,
         as_: AS | None = None,
     ) -> None: ...
+    def reset(self) -> None: ...
     def _get_best_ann_by_gao_rexford(
         self, current_ann: Ann | None, new_ann: Ann
     ) -> Ann: ...
@@ -48,6 +49,7 @@ class BGP(Policy):
         scenario: Scenario,
         reset_q: bool = True,
     ) -> None: ...
+    def has_anns_to_process(self) -> bool: ...
     def _valid_ann(self, ann: Ann, recv_relationship: Relationships) -> bool: ...
     def _copy_and_process(
         self,
@@ -59,6 +61,7 @@ class BGP(Policy):
     def propagate_to_providers(self) -> None: ...
     def propagate_to_customers(self) -> None: ...
     def propagate_to_peers(self) -> None: ...
+    def has_anns_to_send(self) -> bool: ...
     def _propagate(
         self, propagate_to: Relationships, send_rels: set[Relationships]
     ) -> None: ...
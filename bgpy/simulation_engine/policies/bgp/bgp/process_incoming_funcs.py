@@ -107,6 +107,12 @@ def _copy_and_process(
     return ann.copy(overwrite_default_kwargs=kwargs)
 
 
+def has_anns_to_process(self: "BGP") -> bool:
+    """Only anns in the recv_q are processed"""
+
+    return bool(self.recv_q)
+
+
 def _reset_q(self: "BGP", reset_q: bool) -> None:
     """Resets the recieve q"""
 
@@ -46,6 +46,12 @@ def propagate_to_peers(self) -> None:
     self._propagate(Relationships.PEERS, send_rels)
 
 
+def has_anns_to_send(self: "BGP") -> bool:
+    """Only anns in the local RIB are sent"""
+
+    return bool(self.local_rib)
+
+
 def _propagate(
     self: "BGP",
     propagate_to: Relationships,
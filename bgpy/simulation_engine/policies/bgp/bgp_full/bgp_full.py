@@ -13,7 +13,13 @@ from .process_incoming_funcs import (
     _withdraw_ann_from_neighbors,
     process_incoming_anns,
 )
-from .propagate_funcs import _prev_sent, _process_outgoing_ann, _propagate, _send_anns
+from .propagate_funcs import (
+    _prev_sent,
+    _process_outgoing_ann,
+    _propagate,
+    _send_anns,
+    has_anns_to_send,
+)
 
 if TYPE_CHECKING:
     from bgpy.shared.enums import Relationships
@@ -36,6 +42,14 @@ class BGPFull(BGP):
         self.ribs_out: RIBsOut = ribs_out if ribs_out else RIBsOut()
         self.send_q: SendQueue = send_q if send_q else SendQueue()
 
+    def reset(self) -> None:
+        """Clears all routing state in place so the policy can be reused"""
+
+        super(BGPFull, self).reset()
+        self.ribs_in.clear()
+        self.ribs_out.clear()
+        self.send_q.clear()
+
     @property
     def _ribs_in(self) -> RIBsIn:
         warn(
@@ -67,6 +81,7 @@ class BGPFull(BGP):
         return self.send_q
 
     # Propagation functions
+    has_anns_to_send = has_anns_to_send
     _propagate = _propagate
     _process_outgoing_ann = _process_outgoing_ann
     _prev_sent = _prev_sent
@@ -33,12 +33,14 @@ class BGPFull(BGP):
         send_q: SendQueue | None = None,
         **kwargs,
     ) -> None: ...
+    def reset(self) -> None: ...
     @property
     def _ribs_in(self) -> RIBsIn: ...
     @property
     def _ribs_out(self) -> RIBsOut: ...
     @property
     def _send_q(self) -> SendQueue: ...
+    def has_anns_to_send(self) -> bool: ...
     def process_incoming_anns(
         self,
         *,
@@ -27,6 +27,12 @@ def _propagate(
     self._send_anns(propagate_to)
 
 
+def has_anns_to_send(self: "BGPFull") -> bool:
+    """Withdrawals in the send_q are sent even if the local RIB is empty"""
+
+    return bool(self.local_rib) or bool(self.send_q)
+
+
 def _prev_sent(self: "BGPFull", neighbor: "AS", ann: "Ann") -> bool:
     """Don't send what we've already sent"""
     ribs_out_ann: Ann | None = self.ribs_out.get_ann(neighbor.asn, ann.prefix)
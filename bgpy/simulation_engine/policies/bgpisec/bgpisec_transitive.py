@@ -77,11 +77,9 @@ class BGPiSecTransitive(BGPSec):
         signatures and should be dropped
         """
 
-        as_graph = self.as_.as_graph
+        adopting_asns = self.as_.as_graph.adoption_index.get_asns(BGPiSecTransitive)
         bgpsec_signatures = ann.bgpsec_as_path
         for asn in ann.as_path:
-            if asn not in bgpsec_signatures and isinstance(
-                as_graph.as_dict[asn].policy, BGPiSecTransitive
-            ):
+            if asn not in bgpsec_signatures and asn in adopting_asns:
                 return False
         return True
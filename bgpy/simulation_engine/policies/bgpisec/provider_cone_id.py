@@ -4,6 +4,8 @@ from bgpy.shared.enums import Relationships
 from bgpy.simulation_engine.policies.rov import ROV
 
 if TYPE_CHECKING:
+    from collections.abc import Container
+
     from bgpy.simulation_engine.announcement import Announcement as Ann
 
 
@@ -35,21 +37,22 @@ class ProviderConeID(ROV):
         """Determines provider cone validity from customers"""
 
         if from_rel == Relationships.CUSTOMERS:
-            as_dict = self.as_.as_graph.as_dict
-            provider_cone_asns = as_dict[ann.origin].provider_cone_asns
-            Cls = self.__class__
-            if provider_cone_asns is None:
-                raise ValueError(
-                    "Provider cones must be set for this policy to work, see params "
-                    "to simulation.py in the simulation_framework of bgpy"
+            as_graph = self.as_.as_graph
+            adopting_asns = as_graph.adoption_index.get_asns(self.__class__)
+            origin_as_obj = as_graph.as_dict[ann.origin]
+            provider_cone_asns: Container[int]
+            if origin_as_obj.provider_cone_asns is not None:
+                provider_cone_asns = origin_as_obj.provider_cone_asns
+            else:
+                # Provider cones weren't stored, so query the reachability index
+                provider_cone_asns = as_graph.reachability_index.get_provider_cone(
+                    ann.origin
                 )
             # We don't look at the last ASN in the path, since that's the origin
             # The ASes ASN is also not yet in the announcement, so we add it here
             for asn in (self.as_.asn, *ann.as_path[:-1]):
                 # not in provider cone of the origin, and is adopting
-                if asn not in provider_cone_asns and isinstance(
-                    as_dict[asn].policy, Cls
-                ):
+                if asn not in provider_cone_asns and asn in adopting_asns:
                     return False
 
             return True
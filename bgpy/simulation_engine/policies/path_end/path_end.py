@@ -16,9 +16,13 @@ class PathEnd(ROV):
         """Returns announcement validity by checking pathend records"""
 
         origin_asn = ann.origin
-        origin_as_obj = self.as_.as_graph.as_dict[origin_asn]
+        as_graph = self.as_.as_graph
         # If the origin is deploying pathend and the path is longer than 1
-        if isinstance(origin_as_obj.policy, PathEnd) and len(ann.as_path) > 1:
+        if (
+            origin_asn in as_graph.adoption_index.get_asns(PathEnd)
+            and len(ann.as_path) > 1
+        ):
+            origin_as_obj = as_graph.as_dict[origin_asn]
             # If the provider is real, do the loop check
             # Mypy thinks this is unreachable for some reason, even tho tests pass
             for neighbor in origin_as_obj.neighbors:
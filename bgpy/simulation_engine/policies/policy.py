@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
 from ipaddress import ip_network
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable
 
 from roa_checker import ROAChecker, ROAOutcome, ROARouted, ROAValidity
 from yamlable import YamlAble, yaml_info_decorate
@@ -11,12 +12,51 @@ if TYPE_CHECKING:
     from bgpy.simulation_framework import Scenario
 
 
+@dataclass(frozen=True, slots=True)
+class ROAInfo:
+    """ROA outcome of a prefix origin pair, and what policies check about it"""
+
+    roa_outcome: ROAOutcome
+    valid: bool
+    invalid: bool
+    unknown: bool
+    # Invalid and covered by a non routed ROA
+    non_routed: bool
+
+    @classmethod
+    def from_roa_checker(
+        cls, roa_checker: ROAChecker, prefix: str, origin: int
+    ) -> "ROAInfo":
+        """Looks up the prefix origin pair in the roa_checker"""
+
+        roa_outcome = roa_checker.get_roa_outcome_w_prefix_str_cached(prefix, origin)
+        invalid = ROAValidity.is_invalid(roa_outcome.validity)
+        return cls(
+            roa_outcome=roa_outcome,
+            valid=ROAValidity.is_valid(roa_outcome.validity),
+            invalid=invalid,
+            unknown=ROAValidity.is_unknown(roa_outcome.validity),
+            non_routed=invalid
+            and any(
+                roa.routed_status == ROARouted.NON_ROUTED
+                for roa in roa_checker.get_relevant_roas(ip_network(prefix))
+            ),
+        )
+
+
 class Policy(YamlAble, metaclass=ABCMeta):
     name: str = "AbstractPolicy"
     subclass_to_name_dict: ClassVar[dict[type["Policy"], str]] = dict()
     name_to_subclass_dict: ClassVar[dict[str, type["Policy"]]] = dict()
     # Simulates RPKI and something like routinator that is globally available
     roa_checker: ROAChecker = ROAChecker()
+    # ROAInfo of each prefix origin pair in the scenario, so that policies don't
+    # query the roa_checker for every announcement they process. There's a table
+    # per roa_checker (by id, stored with the roa_checker to keep the id from
+    # being reused), so policies with their own roa_checker get their own table
+    _roa_info_tables: ClassVar[
+        dict[int, tuple[ROAChecker, dict[tuple[str, int], ROAInfo]]]
+    ] = dict()
 
     def __init_subclass__(cls: type["Policy"], *args, **kwargs) -> None:
         """This method essentially creates a list of all subclasses
@@ -67,6 +107,24 @@ class Policy(YamlAble, metaclass=ABCMeta):
 
         raise NotImplementedError
 
+    def reset(self) -> None:
+        """Clears all routing state in place so the policy can be reused
+
+        Policies that don't implement this are recreated between scenarios
+        instead (see SimulationEngine._policy_cls_resettable)
+        """
+
+        raise NotImplementedError
+
+    def has_anns_to_process(self) -> bool:
+        """Returns True if process_incoming_anns may change anything
+
+        The engine skips processing ASes where this is False. Defaults to True,
+        so that policies that don't override it are always processed
+        """
+
+        return True
+
     #####################
     # Propagation funcs #
     #####################
@@ -92,14 +150,59 @@ class Policy(YamlAble, metaclass=ABCMeta):
 
         raise NotImplementedError
 
+    def has_anns_to_send(self) -> bool:
+        """Returns True if propagating may send anything
+
+        The engine skips propagating from ASes where this is False. Defaults to
+        True, so that policies that don't override it always propagate
+        """
+
+        return True
+
     #############
     # ROA Funcs #
     #############
 
+    @classmethod
+    def reset_roa_info_table(cls, prefix_origins: Iterable[tuple[str, int]]) -> None:
+        """Fills the roa_info_table of cls.roa_checker for these pairs
+
+        Must be called again whenever the roa_checker changes
+        """
+
+        roa_checker = cls.roa_checker
+        roa_info_table = {
+            (prefix, origin): ROAInfo.from_roa_checker(roa_checker, prefix, origin)
+            for prefix, origin in prefix_origins
+        }
+        Policy._roa_info_tables[id(roa_checker)] = (roa_checker, roa_info_table)
+
+    @classmethod
+    def get_roa_info_table(cls) -> dict[tuple[str, int], ROAInfo]:
+        """Returns the roa_info_table of cls.roa_checker (empty if never reset)"""
+
+        roa_checker_and_table = Policy._roa_info_tables.get(id(cls.roa_checker))
+        return {} if roa_checker_and_table is None else roa_checker_and_table[1]
+
+    @classmethod
+    def get_prefix_origin_roa_info(cls, prefix: str, origin: int) -> ROAInfo:
+        """Returns the ROAInfo for the prefix and origin
+
+        Falls back to the roa_checker for pairs that aren't in the roa_info_table
+        """
+
+        roa_info = cls.get_roa_info_table().get((prefix, origin))
+        if roa_info is None:
+            roa_info = ROAInfo.from_roa_checker(cls.roa_checker, prefix, origin)
+        return roa_info
+
+    def get_roa_info(self, ann: "Ann") -> ROAInfo:
+        """Returns the ROAInfo for the ann's prefix and origin"""
+
+        return self.get_prefix_origin_roa_info(ann.prefix, ann.origin)
+
     def get_roa_outcome(self, ann: "Ann") -> ROAOutcome:
-        return self.roa_checker.get_roa_outcome_w_prefix_str_cached(
-            ann.prefix, ann.origin
-        )
+        return self.get_roa_info(ann).roa_outcome
 
     def ann_is_invalid_by_roa(self, ann: "Ann") -> bool:
         """Returns True if Ann is invalid by ROA
@@ -107,10 +210,7 @@ class Policy(YamlAble, metaclass=ABCMeta):
         False means ann is either valid or unknown
         """
 
-        roa_outcome = self.roa_checker.get_roa_outcome_w_prefix_str_cached(
-            ann.prefix, ann.origin
-        )
-        return ROAValidity.is_invalid(roa_outcome.validity)
+        return self.get_roa_info(ann).invalid
 
     def ann_is_valid_by_roa(self, ann: "Ann") -> bool:
         """Returns True if Ann is valid by ROA
@@ -118,18 +218,12 @@ class Policy(YamlAble, metaclass=ABCMeta):
         False means ann is either invalid or unknown
         """
 
-        roa_outcome = self.roa_checker.get_roa_outcome_w_prefix_str_cached(
-            ann.prefix, ann.origin
-        )
-        return ROAValidity.is_valid(roa_outcome.validity)
+        return self.get_roa_info(ann).valid
 
     def ann_is_unknown_by_roa(self, ann: "Ann") -> bool:
         """Returns True if ann is not covered by roa"""
 
-        roa_outcome = self.roa_checker.get_roa_outcome_w_prefix_str_cached(
-            ann.prefix, ann.origin
-        )
-        return ROAValidity.is_unknown(roa_outcome.validity)
+        return self.get_roa_info(ann).unknown
 
     def ann_is_covered_by_roa(self, ann: "Ann") -> bool:
         """Returns if an announcement has a roa"""
@@ -145,12 +239,7 @@ class Policy(YamlAble, metaclass=ABCMeta):
         so not invalid != valid
         """
 
-        if self.ann_is_invalid_by_roa(ann):
-            relevant_roas = self.roa_checker.get_relevant_roas(ip_network(ann.prefix))
-            return any(
-                roa.routed_status == ROARouted.NON_ROUTED for roa in relevant_roas
-            )
-        return False
+        return self.get_roa_info(ann).non_routed
 
     ##############
     # YAML Funcs #
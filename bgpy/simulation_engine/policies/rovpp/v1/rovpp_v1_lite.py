@@ -54,6 +54,11 @@ class ROVPPV1Lite(ROV):
 
         self._reset_q(reset_q)
 
+    def has_anns_to_process(self) -> bool:
+        """Blackholes for non routed ROAs are added even with no incoming anns"""
+
+        return True
+
     def _add_blackholes(self, from_rel: "Relationships", scenario: "Scenario") -> None:
         """Adds blackhole announcements to the local RIB
 
@@ -1,4 +1,12 @@
 from .base_simulation_engine import BaseSimulationEngine
-from .simulation_engine import SimulationEngine
+from .simulation_engine import FrontierCounter, SimulationEngine
+from .csr_graph import CSRGraph
+from .csr_simulation_engine import CSRSimulationEngine
 
-__all__ = ["BaseSimulationEngine", "SimulationEngine"]
+__all__ = [
+    "BaseSimulationEngine",
+    "SimulationEngine",
+    "FrontierCounter",
+    "CSRGraph",
+    "CSRSimulationEngine",
+]
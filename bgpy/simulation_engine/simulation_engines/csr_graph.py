@@ -0,0 +1,106 @@
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bgpy.as_graphs import AS, ASGraph
+
+# ASNs can be up to 32 bits unsigned, so store them as signed 64 bit ints
+ASN_TYPECODE = "q"
+# Indexes into the CSR arrays, 32 bits is plenty even for synthetic graphs
+INDEX_TYPECODE = "i"
+
+
+@dataclass(frozen=True, slots=True)
+class CSRGraph:
+    """Compressed sparse row (CSR) form of an ASGraph's topology
+
+    ASes are indexed in propagation rank order (ties are broken by ASN), so every
+    propagation rank is a contiguous range of indexes:
+    rank_offsets[rank] <= index < rank_offsets[rank + 1]
+
+    The neighbors of the AS at index i for a relationship are stored as indexes:
+    customer_indexes[customer_offsets[i]:customer_offsets[i + 1]]
+    (and likewise for peers and providers), sorted by ASN
+    """
+
+    asns: array  # type: ignore[type-arg]
+    customer_offsets: array  # type: ignore[type-arg]
+    customer_indexes: array  # type: ignore[type-arg]
+    peer_offsets: array  # type: ignore[type-arg]
+    peer_indexes: array  # type: ignore[type-arg]
+    provider_offsets: array  # type: ignore[type-arg]
+    provider_indexes: array  # type: ignore[type-arg]
+    rank_offsets: array  # type: ignore[type-arg]
+
+    @classmethod
+    def from_as_graph(cls, as_graph: "ASGraph") -> "CSRGraph":
+        """Creates the CSR arrays from an ASGraph's propagation ranks"""
+
+        ordered_ases: list[AS] = list()
+        rank_offsets = array(INDEX_TYPECODE, [0])
+        for rank in as_graph.propagation_ranks:
+            # Ranks are already sorted by ASN
+            ordered_ases.extend(rank)
+            rank_offsets.append(len(ordered_ases))
+
+        asn_to_index = {as_obj.asn: i for i, as_obj in enumerate(ordered_ases)}
+
+        def _get_offsets_and_indexes(
+            rel_attr: str,
+        ) -> tuple[array, array]:  # type: ignore[type-arg]
+            offsets = array(INDEX_TYPECODE, [0])
+            indexes = array(INDEX_TYPECODE)
+            for as_obj in ordered_ases:
+                indexes.extend(
+                    sorted(asn_to_index[x.asn] for x in getattr(as_obj, rel_attr))
+                )
+                offsets.append(len(indexes))
+            return offsets, indexes
+
+        customer_offsets, customer_indexes = _get_offsets_and_indexes("customers")
+        peer_offsets, peer_indexes = _get_offsets_and_indexes("peers")
+        provider_offsets, provider_indexes = _get_offsets_and_indexes("providers")
+
+        return cls(
+            asns=array(ASN_TYPECODE, [x.asn for x in ordered_ases]),
+            customer_offsets=customer_offsets,
+            customer_indexes=customer_indexes,
+            peer_offsets=peer_offsets,
+            peer_indexes=peer_indexes,
+            provider_offsets=provider_offsets,
+            provider_indexes=provider_indexes,
+            rank_offsets=rank_offsets,
+        )
+
+    def __len__(self) -> int:
+        return len(self.asns)
+
+    def get_asn_to_index(self) -> dict[int, int]:
+        """Returns a dict of ASN to the ASN's index in the CSR arrays"""
+
+        return {asn: i for i, asn in enumerate(self.asns)}
+
+    @property
+    def num_ranks(self) -> int:
+        return len(self.rank_offsets) - 1
+
+    def rank_indexes(self, rank: int) -> range:
+        """Returns the indexes of all ASes within a propagation rank"""
+
+        return range(self.rank_offsets[rank], self.rank_offsets[rank + 1])
+
+    def customers(self, index: int) -> array:  # type: ignore[type-arg]
+        return self.customer_indexes[
+            self.customer_offsets[index] : self.customer_offsets[index + 1]
+        ]
+
+    def peers(self, index: int) -> array:  # type: ignore[type-arg]
+        return self.peer_indexes[
+            self.peer_offsets[index] : self.peer_offsets[index + 1]
+        ]
+
+    def providers(self, index: int) -> array:  # type: ignore[type-arg]
+        return self.provider_indexes[
+            self.provider_offsets[index] : self.provider_offsets[index + 1]
+        ]
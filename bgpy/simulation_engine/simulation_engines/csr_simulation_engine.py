@@ -0,0 +1,351 @@
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from bgpy.shared.enums import Relationships
+from bgpy.simulation_engine.announcement_pool import NO_PARENT, AnnouncementPool
+from bgpy.simulation_engine.policies import BGP, ROV
+
+from .csr_graph import CSRGraph
+from .simulation_engine import SimulationEngine
+
+# https://stackoverflow.com/a/57005931/8903959
+if TYPE_CHECKING:
+    from bgpy.as_graphs import AS, ASGraph
+    from bgpy.simulation_engine import Policy
+    from bgpy.simulation_framework import Scenario
+
+
+# Relationships are stored as ints in bytearrays, 0 meaning no route
+_NO_ROUTE = 0
+_PROVIDERS = Relationships.PROVIDERS.value
+_PEERS = Relationships.PEERS.value
+_CUSTOMERS = Relationships.CUSTOMERS.value
+_ORIGIN = Relationships.ORIGIN.value
+
+# Receiver index to the best (sender pool index, sender index) received
+_Candidates = dict[int, tuple[int, int]]
+
+
+class _PrefixState:
+    """Flat per AS best route arrays for a single prefix
+
+    Indexes are the same as the indexes in the CSRGraph
+    """
+
+    __slots__ = (
+        "best",
+        "changed",
+        "pool",
+        "prefix",
+        "rels",
+        "seeded",
+    )
+
+    def __init__(self, prefix: str, num_ases: int) -> None:
+        self.prefix: str = prefix
+        self.pool: AnnouncementPool = AnnouncementPool()
+        # Pool index of the best route at each AS (NO_PARENT if there is no route)
+        self.best: array[int] = array("i", [NO_PARENT]) * num_ases
+        # recv_relationship.value of the best route at each AS
+        self.rels: bytearray = bytearray(num_ases)
+        # Seeded announcements can never be overriden
+        self.seeded: bytearray = bytearray(num_ases)
+        # Only ASes whose best route changed get written back to the local RIB
+        self.changed: bytearray = bytearray(num_ases)
+
+
+class CSRSimulationEngine(SimulationEngine):
+    """Simulation engine that propagates over flat CSR arrays
+
+    The topology is stored as a CSRGraph (integer arrays in propagation rank order)
+    and propagation is done over per AS best route arrays, rather than by copying
+    announcements through every policy's recv_q. The local RIBs at the end of
+    propagation are identical to the SimulationEngine's.
+
+    Only policies in supported_policy_classes (matched by exact type) can use the
+    array path. If any AS has a different policy, this falls back to the
+    SimulationEngine's propagation, so this engine can always be used as a drop in
+    replacement, i.e. Simulation(SimulationEngineCls=CSRSimulationEngine)
+    """
+
+    supported_policy_classes: ClassVar[frozenset[type["Policy"]]] = frozenset(
+        {BGP, ROV}
+    )
+    # Policies that drop announcements that are invalid by ROA
+    rov_policy_classes: ClassVar[frozenset[type["Policy"]]] = frozenset({ROV})
+
+    def __init__(
+        self,
+        as_graph: "ASGraph",
+        cached_as_graph_tsv_path: Path | None = None,
+        ready_to_run_round: int = -1,
+    ) -> None:
+        """Creates the CSR form of the AS graph"""
+
+        super().__init__(
+            as_graph,
+            cached_as_graph_tsv_path=cached_as_graph_tsv_path,
+            ready_to_run_round=ready_to_run_round,
+        )
+        self.csr_graph: CSRGraph = CSRGraph.from_as_graph(as_graph)
+        self.asn_to_index: dict[int, int] = self.csr_graph.get_asn_to_index()
+        self.index_to_as: tuple[AS, ...] = tuple(
+            as_graph.as_dict[asn] for asn in self.csr_graph.asns
+        )
+
+    #####################
+    # Propagation funcs #
+    #####################
+
+    def _propagate(self, propagation_round: int, scenario: "Scenario"):
+        """Propagates over the CSR arrays if all policies are supported"""
+
+        if self._csr_propagation_supported():
+            with self.instrumentation.time_phase("csr_propagate"):
+                self._csr_propagate()
+        else:
+            super()._propagate(propagation_round, scenario)
+
+    def _csr_propagation_supported(self) -> bool:
+        """Returns True if every AS's policy can be run over the CSR arrays"""
+
+        supported = self.supported_policy_classes
+        return all(type(x.policy) in supported for x in self.index_to_as)
+
+    def _csr_propagate(self) -> None:
+        """Propagates every prefix to providers, peers, then customers"""
+
+        rov_classes = self.rov_policy_classes
+        rov_flags = bytearray(type(x.policy) in rov_classes for x in self.index_to_as)
+        roa_invalid_cache: dict[tuple[str, int], bool] = dict()
+
+        for state in self._get_prefix_states():
+            self._csr_propagate_to_providers(state, rov_flags, roa_invalid_cache)
+            self._csr_propagate_to_peers(state, rov_flags, roa_invalid_cache)
+            self._csr_propagate_to_customers(state, rov_flags, roa_invalid_cache)
+            self._write_prefix_state(state)
+
+    def _get_prefix_states(self) -> list[_PrefixState]:
+        """Loads the local RIBs of every AS into per prefix arrays"""
+
+        num_ases = len(self.csr_graph)
+        states: dict[str, _PrefixState] = dict()
+        for i, as_obj in enumerate(self.index_to_as):
+            for prefix, ann in as_obj.policy.local_rib.items():
+                state = states.get(prefix)
+                if state is None:
+                    state = _PrefixState(prefix, num_ases)
+                    states[prefix] = state
+                state.best[i] = state.pool.add_root(ann)
+                state.rels[i] = ann.recv_relationship.value
+                if ann.seed_asn is not None:
+                    state.seeded[i] = 1
+        return list(states.values())
+
+    def _write_prefix_state(self, state: _PrefixState) -> None:
+        """Writes the best routes of ASes that changed back into the local RIBs"""
+
+        best = state.best
+        materialize = state.pool.materialize
+        for i, changed in enumerate(state.changed):
+            if changed:
+                self.index_to_as[i].policy.local_rib.add_ann(materialize(best[i]))
+
+    def _csr_propagate_to_providers(
+        self,
+        state: _PrefixState,
+        rov_flags: bytearray,
+        roa_invalid_cache: dict[tuple[str, int], bool],
+    ) -> None:
+        """Propagates to providers in ascending propagation rank order
+
+        Providers are always in a higher rank than their customers,
+        so every AS has received from all of its customers before sending
+        """
+
+        csr = self.csr_graph
+        candidates: _Candidates = dict()
+        for i in range(len(csr)):
+            if i in candidates:
+                self._process_candidate(state, i, candidates.pop(i), _CUSTOMERS)
+            if state.rels[i] in (_ORIGIN, _CUSTOMERS):
+                self._send(
+                    state,
+                    i,
+                    csr.providers(i),
+                    candidates,
+                    rov_flags,
+                    roa_invalid_cache,
+                )
+
+    def _csr_propagate_to_peers(
+        self,
+        state: _PrefixState,
+        rov_flags: bytearray,
+        roa_invalid_cache: dict[tuple[str, int], bool],
+    ) -> None:
+        """Every AS sends to peers before any AS processes from peers"""
+
+        csr = self.csr_graph
+        candidates: _Candidates = dict()
+        for i in range(len(csr)):
+            if state.rels[i] in (_ORIGIN, _CUSTOMERS):
+                self._send(
+                    state,
+                    i,
+                    csr.peers(i),
+                    candidates,
+                    rov_flags,
+                    roa_invalid_cache,
+                )
+        for i, candidate in candidates.items():
+            self._process_candidate(state, i, candidate, _PEERS)
+
+    def _csr_propagate_to_customers(
+        self,
+        state: _PrefixState,
+        rov_flags: bytearray,
+        roa_invalid_cache: dict[tuple[str, int], bool],
+    ) -> None:
+        """Propagates to customers in descending propagation rank order"""
+
+        csr = self.csr_graph
+        candidates: _Candidates = dict()
+        for i in reversed(range(len(csr))):
+            if i in candidates:
+                self._process_candidate(state, i, candidates.pop(i), _PROVIDERS)
+            if state.rels[i] != _NO_ROUTE:
+                self._send(
+                    state,
+                    i,
+                    csr.customers(i),
+                    candidates,
+                    rov_flags,
+                    roa_invalid_cache,
+                )
+
+    def _send(
+        self,
+        state: _PrefixState,
+        sender: int,
+        neighbors,
+        candidates: _Candidates,
+        rov_flags: bytearray,
+        roa_invalid_cache: dict[tuple[str, int], bool],
+    ) -> None:
+        """Sends the sender's best route to neighbors
+
+        Rather than queueing every announcement, each neighbor only keeps the
+        best valid route it has received so far for the current phase. Since
+        every route within a phase has the same recv_relationship, this only
+        needs the AS path length and the lowest neighbor ASN tiebreaker
+        """
+
+        if not neighbors:
+            return
+
+        pool = state.pool
+        pool_index = state.best[sender]
+        # Walks the parents once for the loop checks of every neighbor,
+        # rather than building the AS path
+        path_asns = pool.path_asns(pool_index)
+        asns = self.csr_graph.asns
+        sender_asn = asns[sender]
+        path_lens = pool.path_lens
+        path_len = path_lens[pool_index]
+        # BGP Loop Prevention Check for AS 0
+        if 0 in path_asns:
+            return
+        roa_invalid = self._roa_invalid(
+            state.prefix, pool.origin(pool_index), roa_invalid_cache
+        )
+
+        for neighbor in neighbors:
+            # BGP Loop Prevention Check
+            if asns[neighbor] in path_asns:
+                continue
+            # Invalid by ROA is not valid by ROV
+            if roa_invalid and rov_flags[neighbor]:
+                continue
+            candidate = candidates.get(neighbor)
+            if candidate is None:
+                candidates[neighbor] = (pool_index, sender)
+            else:
+                candidate_len = path_lens[candidate[0]]
+                if path_len < candidate_len or (
+                    path_len == candidate_len and sender_asn < asns[candidate[1]]
+                ):
+                    candidates[neighbor] = (pool_index, sender)
+
+    def _process_candidate(
+        self,
+        state: _PrefixState,
+        receiver: int,
+        candidate: tuple[int, int],
+        recv_rel_value: int,
+    ) -> None:
+        """Replaces the receiver's best route if the candidate is better"""
+
+        # Seeded Ann will never be overriden
+        if state.seeded[receiver]:
+            return
+
+        sender_pool_index, sender = candidate
+        pool = state.pool
+        asns = self.csr_graph.asns
+        current_rel = state.rels[receiver]
+        if current_rel != _NO_ROUTE:
+            if current_rel > recv_rel_value:
+                return
+            elif current_rel == recv_rel_value:
+                current_pool_index = state.best[receiver]
+                current_len = pool.path_lens[current_pool_index]
+                new_len = pool.path_lens[sender_pool_index] + 1
+                if current_len < new_len:
+                    return
+                elif current_len == new_len and (
+                    pool.asn_at(current_pool_index, min(current_len, 1)) <= asns[sender]
+                ):
+                    return
+
+        # Appends a single node to the pool rather than copying the announcement
+        state.best[receiver] = pool.append(
+            sender_pool_index, asns[receiver], asns[sender], recv_rel_value
+        )
+        state.rels[receiver] = recv_rel_value
+        state.changed[receiver] = 1
+
+    def _roa_invalid(
+        self,
+        prefix: str,
+        origin: int,
+        roa_invalid_cache: dict[tuple[str, int], bool],
+    ) -> bool:
+        """Returns True if the prefix origin pair is invalid by ROA
+
+        Looked up in ROV's roa_info_table, like the policies of SimulationEngine
+        """
+
+        key = (prefix, origin)
+        rv = roa_invalid_cache.get(key)
+        if rv is None:
+            rv = ROV.get_prefix_origin_roa_info(prefix, origin).invalid
+            roa_invalid_cache[key] = rv
+        return rv
+
+    ##############
+    # Yaml funcs #
+    ##############
+
+    def __to_yaml_dict__(self) -> dict[str, Any]:
+        """This optional method is called when you call yaml.dump()
+
+        The CSR arrays are derived from the AS graph, so they aren't stored
+        """
+
+        return {
+            "as_graph": self.as_graph,
+            "cached_as_graph_tsv_path": self.cached_as_graph_tsv_path,
+            "ready_to_run_round": self.ready_to_run_round,
+        }
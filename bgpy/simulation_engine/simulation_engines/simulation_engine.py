@@ -1,17 +1,74 @@
+from functools import cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 from bgpy.shared.enums import Relationships
+from bgpy.simulation_engine.adoption_index import AdoptionIndex
+from bgpy.simulation_engine.instrumentation import Instrumentation
+from bgpy.simulation_engine.policies.policy import Policy
 
 from .base_simulation_engine import BaseSimulationEngine
 
 # https://stackoverflow.com/a/57005931/8903959
 if TYPE_CHECKING:
+    from bgpy.as_graphs import AS, ASGraph
     from bgpy.simulation_engine import Announcement as Ann
     from bgpy.simulation_framework import Scenario
 
 
+class FrontierCounter:
+    """Counts the ASes visited by a propagation phase out of all the ASes"""
+
+    __slots__ = ("total", "visited")
+
+    def __init__(self) -> None:
+        self.visited: int = 0
+        self.total: int = 0
+
+    def add(self, visited: int, total: int) -> None:
+        self.visited += visited
+        self.total += total
+
+    @property
+    def visited_fraction(self) -> float:
+        return self.visited / self.total if self.total else 0
+
+
 class SimulationEngine(BaseSimulationEngine):
-    """Python simulation engine representation"""
+    """Python simulation engine representation
+
+    Rather than calling every policy for every phase, propagation tracks
+    a frontier of the ASes with anns to send or process, and only visits
+    those (in the same order as visiting every AS). frontier_counters has
+    the ASes visited per phase since setup
+
+    When a scenario has multiple propagation rounds, the local RIBs are
+    snapshotted after each round, and the next round only starts from the
+    ASes whose local RIBs changed in between (i.e. in post_propagation_hook)
+
+    instrumentation times setup and each propagation phase, and counts
+    the ASes they visit, when it's enabled (see Simulation)
+    """
+
+    def __init__(
+        self,
+        as_graph: "ASGraph",
+        cached_as_graph_tsv_path: Path | None = None,
+        ready_to_run_round: int = -1,
+    ) -> None:
+        super().__init__(
+            as_graph,
+            cached_as_graph_tsv_path=cached_as_graph_tsv_path,
+            ready_to_run_round=ready_to_run_round,
+        )
+        self.frontier_counters: dict[Relationships, FrontierCounter] = (
+            self._get_frontier_counters()
+        )
+        # Local RIBs (by ASN) at the end of the last round, if there's another
+        self._local_rib_snapshots: dict[int, dict[str, Ann]] | None = None
+        # ASNs that resend their whole local RIB this round, changed or not
+        self._resend_asns: set[int] = set()
+        self.instrumentation: Instrumentation = Instrumentation()
 
     ###############
     # Setup funcs #
@@ -20,9 +77,25 @@ class SimulationEngine(BaseSimulationEngine):
     def setup(self, scenario: "Scenario") -> None:
         """Sets AS classes and seeds announcements"""
 
-        self._set_as_classes(scenario)
-        self._seed_announcements(scenario.announcements)
+        with self.instrumentation.time_phase("set_as_classes"):
+            self._set_as_classes(scenario)
+        with self.instrumentation.time_phase("seed_announcements"):
+            self._seed_announcements(scenario.announcements)
         self.ready_to_run_round = 0
+        self.frontier_counters = self._get_frontier_counters()
+        # Every RIB was reset, so the next round starts from the seeded ASes
+        self._local_rib_snapshots = None
+
+    @staticmethod
+    def _get_frontier_counters() -> dict[Relationships, FrontierCounter]:
+        return {
+            rel: FrontierCounter()
+            for rel in (
+                Relationships.PROVIDERS,
+                Relationships.PEERS,
+                Relationships.CUSTOMERS,
+            )
+        }
 
     def _set_as_classes(self, scenario: "Scenario") -> None:
         """Resets Engine ASes and changes their AS class
@@ -33,13 +106,43 @@ class SimulationEngine(BaseSimulationEngine):
         and have each do half and half
         """
 
+        # ASNs running each policy class, for the AdoptionIndex
+        policy_cls_asns: dict[type[Policy], list[int]] = dict()
         # Done here to save as much time  as possible
         for as_obj in self.as_graph:
-            # Delete the old policy and remove references so that RAM can be reclaimed
-            del as_obj.policy.as_
-            # set the AS class to be the proper type of AS
             Cls = scenario.get_policy_cls(as_obj)
-            as_obj.policy = Cls(as_=as_obj)
+            policy_cls_asns.setdefault(Cls, []).append(as_obj.asn)
+            policy = as_obj.policy
+            # Between scenarios most ASes keep the same policy class
+            # (i.e. only the adopting set differs), so just clear their RIBs
+            if policy.__class__ is Cls and self._policy_cls_resettable(Cls):
+                policy.reset()
+            else:
+                # Delete the old policy and remove references
+                # so that RAM can be reclaimed
+                del policy.as_
+                # set the AS class to be the proper type of AS
+                as_obj.policy = Cls(as_=as_obj)
+        self.as_graph.adoption_index = AdoptionIndex(policy_cls_asns)
+
+    @staticmethod
+    @cache
+    def _policy_cls_resettable(PolicyCls: type["Policy"]) -> bool:
+        """Returns True if a policy can be reset in place rather than recreated
+
+        The reset func must be defined at least as low in the MRO as __init__,
+        otherwise a subclass may store state in __init__ that reset won't clear.
+        Policy.reset only declares it, so it doesn't count
+        """
+
+        for Cls in PolicyCls.__mro__:
+            if Cls is Policy:
+                return False
+            elif "reset" in vars(Cls):
+                return True
+            elif "__init__" in vars(Cls):
+                return False
+        return False
 
     def _seed_announcements(self, announcements: tuple["Ann", ...] = ()) -> None:
         """Seeds announcement at the proper AS
@@ -72,6 +175,14 @@ class SimulationEngine(BaseSimulationEngine):
         self._propagate(propagation_round, scenario)
         # Increment the ready to run round
         self.ready_to_run_round += 1
+        if propagation_round + 1 < scenario.scenario_config.propagation_rounds:
+            self._local_rib_snapshots = {
+                as_obj.asn: as_obj.policy.local_rib.snapshot()
+                for as_obj in self.as_graph.ases
+                if as_obj.policy.local_rib
+            }
+        else:
+            self._local_rib_snapshots = None
 
     def _propagate(self, propagation_round: int, scenario: "Scenario"):
         """Propogates announcements
@@ -80,76 +191,214 @@ class SimulationEngine(BaseSimulationEngine):
         0. providers
         2. peers
         3. customers
+
+        Only ASes with anns to send or process are visited (see
+        _get_active_ases). Each phase adds the neighbors that were
+        propagated to, so later phases visit them as well
         """
 
-        self._propagate_to_providers(propagation_round, scenario)
-        self._propagate_to_peers(propagation_round, scenario)
-        self._propagate_to_customers(propagation_round, scenario)
+        instrumentation = self.instrumentation
+        active_ases = self._get_active_ases()
+        with instrumentation.time_phase("propagate_to_providers"):
+            self._propagate_to_providers(propagation_round, scenario, active_ases)
+        with instrumentation.time_phase("propagate_to_peers"):
+            self._propagate_to_peers(propagation_round, scenario, active_ases)
+        with instrumentation.time_phase("propagate_to_customers"):
+            self._propagate_to_customers(propagation_round, scenario, active_ases)
+
+    def _get_active_ases(self) -> dict[int, "AS"]:
+        """Returns the ASes that have anns to send or process, by ASN
+
+        In the first round these are just the seeded ASes. Any other AS can
+        only receive anns from a neighbor that propagates, which adds it.
+
+        In later rounds, every AS already sent its local RIB last round, so
+        only ASes whose local RIB changed since then have anns to send
+        (see _has_anns_to_send). Resending the rest can't change anything,
+        since each AS only replaces its anns with better ones (and BGPFull
+        doesn't resend at all). The exception is an AS whose anns were removed
+        or replaced by worse ones, which would get the better anns from its
+        neighbors again, so its neighbors resend as well
+        """
 
-    def _propagate_to_providers(self, propagation_round: int, scenario: "Scenario"):
+        snapshots = self._local_rib_snapshots
+        if snapshots is None:
+            return {
+                as_obj.asn: as_obj
+                for as_obj in self.as_graph.ases
+                if as_obj.policy.has_anns_to_send()
+                or as_obj.policy.has_anns_to_process()
+            }
+
+        active_ases: dict[int, AS] = dict()
+        self._resend_asns = set()
+        for as_obj in self.as_graph.ases:
+            if as_obj.policy.local_rib.changed_since(snapshots.get(as_obj.asn, {})):
+                active_ases[as_obj.asn] = as_obj
+                for neighbor in as_obj.neighbors:
+                    active_ases[neighbor.asn] = neighbor
+                    self._resend_asns.add(neighbor.asn)
+            elif as_obj.policy.has_anns_to_process():
+                active_ases[as_obj.asn] = as_obj
+        return active_ases
+
+    def _has_anns_to_send(self, as_obj: "AS") -> bool:
+        """Returns True if the AS has anns to send that it didn't last round"""
+
+        if not as_obj.policy.has_anns_to_send():
+            return False
+        snapshots = self._local_rib_snapshots
+        return (
+            snapshots is None
+            or as_obj.asn in self._resend_asns
+            or as_obj.policy.local_rib.changed_since(snapshots.get(as_obj.asn, {}))
+        )
+
+    def _propagate_to_providers(
+        self,
+        propagation_round: int,
+        scenario: "Scenario",
+        active_ases: dict[int, "AS"] | None = None,
+    ):
         """Propogate to providers"""
 
+        if active_ases is None:
+            active_ases = self._get_active_ases()
         # Propogation ranks go from stubs to input_clique in ascending order
         # By customer provider pairs (peers are ignored for the ranks)
-        for i, rank in enumerate(self.as_graph.propagation_ranks):
+        frontier = self._get_rank_frontier(active_ases)
+        num_visited = 0
+        for i, rank_frontier in enumerate(frontier):
+            # Ranks are sorted by ASN, so visit in that order
+            rank = [rank_frontier[asn] for asn in sorted(rank_frontier)]
+            num_visited += len(rank)
             # Nothing to process at the start
             if i > 0:
                 # Process first because maybe it recv from lower ranks
                 for as_obj in rank:
-                    as_obj.policy.process_incoming_anns(
-                        from_rel=Relationships.CUSTOMERS,
-                        propagation_round=propagation_round,
-                        scenario=scenario,
-                    )
+                    if as_obj.policy.has_anns_to_process():
+                        as_obj.policy.process_incoming_anns(
+                            from_rel=Relationships.CUSTOMERS,
+                            propagation_round=propagation_round,
+                            scenario=scenario,
+                        )
             # Send to the higher ranks
             for as_obj in rank:
-                as_obj.policy.propagate_to_providers()
+                if self._has_anns_to_send(as_obj):
+                    as_obj.policy.propagate_to_providers()
+                    for provider in as_obj.providers:
+                        frontier[provider.propagation_rank][provider.asn] = provider
+                        active_ases[provider.asn] = provider
+        self._count_visited(Relationships.PROVIDERS, num_visited)
 
     def _propagate_to_peers(
-        self, propagation_round: int, scenario: Optional["Scenario"]
+        self,
+        propagation_round: int,
+        scenario: Optional["Scenario"],
+        active_ases: dict[int, "AS"] | None = None,
     ):
         """Propagate to peers"""
 
+        if active_ases is None:
+            active_ases = self._get_active_ases()
         # The reason you must separate this for loop here
         # is because propagation ranks do not take into account peering
         # It'd be impossible to take into account peering
         # since different customers peer to different ranks
         # So first do customer to provider propagation, then peer propagation
-        for as_obj in self.as_graph:
-            as_obj.policy.propagate_to_peers()
-        for as_obj in self.as_graph:
-            as_obj.policy.process_incoming_anns(
-                from_rel=Relationships.PEERS,
-                propagation_round=propagation_round,
-                scenario=scenario,
-            )
-
-    def _propagate_to_customers(self, propagation_round: int, scenario: "Scenario"):
+        for as_obj in self._get_graph_ordered_ases(active_ases):
+            if self._has_anns_to_send(as_obj):
+                as_obj.policy.propagate_to_peers()
+                for peer in as_obj.peers:
+                    active_ases[peer.asn] = peer
+        ases = self._get_graph_ordered_ases(active_ases)
+        for as_obj in ases:
+            if as_obj.policy.has_anns_to_process():
+                as_obj.policy.process_incoming_anns(
+                    from_rel=Relationships.PEERS,
+                    propagation_round=propagation_round,
+                    scenario=scenario,
+                )
+        self._count_visited(Relationships.PEERS, len(ases))
+
+    def _propagate_to_customers(
+        self,
+        propagation_round: int,
+        scenario: "Scenario",
+        active_ases: dict[int, "AS"] | None = None,
+    ):
         """Propagate to customers"""
 
+        if active_ases is None:
+            active_ases = self._get_active_ases()
         # Propogation ranks go from stubs to input_clique in ascending order
         # By customer provider pairs (peers are ignored for the ranks)
         # So here we start at the highest rank(input_clique) and propagate down
-        for i, rank in enumerate(reversed(self.as_graph.propagation_ranks)):
+        frontier = self._get_rank_frontier(active_ases)
+        num_visited = 0
+        for i, rank_frontier in enumerate(reversed(frontier)):
+            rank = [rank_frontier[asn] for asn in sorted(rank_frontier)]
+            num_visited += len(rank)
             # There are no incomming Anns at the top
             if i > 0:
                 for as_obj in rank:
-                    as_obj.policy.process_incoming_anns(
-                        from_rel=Relationships.PROVIDERS,
-                        propagation_round=propagation_round,
-                        scenario=scenario,
-                    )
+                    if as_obj.policy.has_anns_to_process():
+                        as_obj.policy.process_incoming_anns(
+                            from_rel=Relationships.PROVIDERS,
+                            propagation_round=propagation_round,
+                            scenario=scenario,
+                        )
             for as_obj in rank:
-                as_obj.policy.propagate_to_customers()
+                if self._has_anns_to_send(as_obj):
+                    as_obj.policy.propagate_to_customers()
+                    for customer in as_obj.customers:
+                        frontier[customer.propagation_rank][customer.asn] = customer
+                        active_ases[customer.asn] = customer
+        self._count_visited(Relationships.CUSTOMERS, num_visited)
+
+    def _count_visited(self, rel: Relationships, num_visited: int) -> None:
+        """Adds the ASes a phase visited to the frontier counters"""
+
+        num_ases = len(self.as_graph.ases)
+        self.frontier_counters[rel].add(num_visited, num_ases)
+        self.instrumentation.count(
+            f"{rel.name.lower()}_phase_visited_ases", num_visited
+        )
+        self.instrumentation.count(f"{rel.name.lower()}_phase_ases", num_ases)
+
+    def _get_rank_frontier(self, active_ases: dict[int, "AS"]) -> list[dict[int, "AS"]]:
+        """Returns the active ASes in each propagation rank, by ASN"""
+
+        frontier: list[dict[int, AS]] = [
+            dict() for _ in self.as_graph.propagation_ranks
+        ]
+        for asn, as_obj in active_ases.items():
+            frontier[as_obj.propagation_rank][asn] = as_obj  # type: ignore
+        return frontier
+
+    def _get_graph_ordered_ases(self, active_ases: dict[int, "AS"]) -> list["AS"]:
+        """Returns the active ASes in the same order as the AS graph"""
+
+        if len(active_ases) == len(self.as_graph.ases):
+            return list(self.as_graph.ases)
+        return [x for x in self.as_graph.ases if x.asn in active_ases]
 
     ##############
     # Yaml funcs #
     ##############
 
     def __to_yaml_dict__(self) -> dict[str, Any]:
-        """This optional method is called when you call yaml.dump()"""
+        """This optional method is called when you call yaml.dump()
+
+        The frontier counters and instrumentation are only stats,
+        so they aren't stored
+        """
 
-        return dict(vars(self))
+        return {
+            "as_graph": self.as_graph,
+            "cached_as_graph_tsv_path": self.cached_as_graph_tsv_path,
+            "ready_to_run_round": self.ready_to_run_round,
+        }
 
     @classmethod
     def __from_yaml_dict__(
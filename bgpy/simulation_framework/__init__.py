@@ -1,6 +1,8 @@
 from .as_graph_analyzers import (
+    ArrayASGraphAnalyzer,
     ASGraphAnalyzer,
     BaseASGraphAnalyzer,
+    InterceptionArrayASGraphAnalyzer,
     InterceptionASGraphAnalyzer,
 )
 from .graph_data_aggregator import (
@@ -27,11 +29,14 @@ from .scenarios import (
     VictimsPrefix,
 )
 from .simulation import Simulation
+from .worker_checkpoint import WorkerCheckpoint
 
 __all__ = [
     "ASGraphAnalyzer",
     "BaseASGraphAnalyzer",
     "InterceptionASGraphAnalyzer",
+    "ArrayASGraphAnalyzer",
+    "InterceptionArrayASGraphAnalyzer",
     "GraphFactory",
     "LineData",
     "LineInfo",
@@ -43,6 +48,7 @@ __all__ = [
     "ScenarioConfig",
     "Scenario",
     "Simulation",
+    "WorkerCheckpoint",
     "GraphCategory",
     "AccidentalRouteLeak",
     "PrefixHijack",
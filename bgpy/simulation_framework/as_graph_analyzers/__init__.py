@@ -1,5 +1,13 @@
+from .array_as_graph_analyzer import ArrayASGraphAnalyzer
 from .as_graph_analyzer import ASGraphAnalyzer
 from .base_as_graph_analyzer import BaseASGraphAnalyzer
+from .interception_array_as_graph_analyzer import InterceptionArrayASGraphAnalyzer
 from .interception_as_graph_analyzer import InterceptionASGraphAnalyzer
 
-__all__ = ["BaseASGraphAnalyzer", "ASGraphAnalyzer", "InterceptionASGraphAnalyzer"]
+__all__ = [
+    "BaseASGraphAnalyzer",
+    "ASGraphAnalyzer",
+    "InterceptionASGraphAnalyzer",
+    "ArrayASGraphAnalyzer",
+    "InterceptionArrayASGraphAnalyzer",
+]
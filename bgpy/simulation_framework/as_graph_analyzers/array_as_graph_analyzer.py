@@ -0,0 +1,123 @@
+from typing import TYPE_CHECKING, Optional
+
+from bgpy.as_graphs import AS
+from bgpy.shared.enums import Outcomes
+
+from .as_graph_analyzer import ASGraphAnalyzer
+
+if TYPE_CHECKING:
+    from bgpy.simulation_engine import Announcement as Ann
+
+
+class ArrayASGraphAnalyzer(ASGraphAnalyzer):
+    """ASGraphAnalyzer that resolves the data plane without recursion
+
+    Rather than recursing along next hops per AS, this builds an array of
+    next hop indexes once per trial, where ASes at which the traceback ends
+    point to themselves. Every AS is then resolved at once with pointer
+    jumping (each pass, every AS jumps to its next hop's next hop), which
+    takes O(log(longest chain)) passes and never hits the recursion limit.
+
+    The outcomes are the same as the ASGraphAnalyzer. ASes that forward
+    in a loop (which the ASGraphAnalyzer recurses on forever) are disconnected
+    """
+
+    def analyze(self) -> dict[int, dict[int, int]]:
+        """Takes in engine and outputs traceback for ctrl + data plane data"""
+
+        if self.data_plane_tracking:
+            self._data_plane_outcomes.update(self._get_data_plane_outcomes())
+        for as_obj in self.engine.as_graph:
+            if self.control_plane_tracking:
+                self._get_as_outcome_ctrl_plane(as_obj)
+            self._get_other_as_outcome_hook(as_obj)
+        return self.outcomes
+
+    ####################
+    # Data plane funcs #
+    ####################
+
+    def _get_as_outcome_data_plane(self, as_obj: AS) -> int:
+        """Returns the as outcome, resolving all ASes at once if needed"""
+
+        if as_obj.asn not in self._data_plane_outcomes:
+            self._data_plane_outcomes.update(self._get_data_plane_outcomes())
+        return self._data_plane_outcomes[as_obj.asn]
+
+    def _get_data_plane_outcomes(self) -> dict[int, int]:
+        """Returns the data plane outcomes of all ASes"""
+
+        # Enum lookups are slow, so get these values once
+        undetermined = Outcomes.UNDETERMINED.value
+        disconnected = Outcomes.DISCONNECTED.value
+        victim_success = Outcomes.VICTIM_SUCCESS.value
+        attacker_success = Outcomes.ATTACKER_SUCCESS.value
+
+        ases = self.engine.as_graph.ases
+        asn_to_index = {as_obj.asn: i for i, as_obj in enumerate(ases)}
+        # Index of the next hop for each AS. Where the traceback ends, the AS
+        # points to itself and its outcome is stored in end_outcomes
+        next_hops: list[int] = list(range(len(ases)))
+        end_outcomes: list[int] = [undetermined] * len(ases)
+        # Whether traffic passing through each AS is intercepted by it
+        intercepted: list[bool] = [False] * len(ases)
+        for i, as_obj in enumerate(ases):
+            most_specific_ann = self._most_specific_ann_dict[as_obj]
+            outcome_int, intercepted[i] = self._get_as_end_outcome_data_plane(
+                as_obj, most_specific_ann
+            )
+            if outcome_int == undetermined:
+                assert most_specific_ann, "If not disconnected, ann must exist"
+                # NOTE: Starting in v4, this is the next hop,
+                # not the next ASN in the AS PATH
+                next_hops[i] = asn_to_index[most_specific_ann.next_hop_asn]
+            else:
+                end_outcomes[i] = outcome_int
+
+        ends, intercepted = self._jump_pointers(next_hops, intercepted)
+
+        outcomes: dict[int, int] = dict()
+        for as_obj, end, as_intercepted in zip(ases, ends, intercepted, strict=True):
+            outcome_int = end_outcomes[end]
+            # Never reached the end of the traceback, so it's a forwarding loop
+            if outcome_int == undetermined:
+                outcome_int = disconnected
+            # Attacker intercepted traffic that still made it to the victim
+            elif outcome_int == victim_success and as_intercepted:
+                outcome_int = attacker_success
+            outcomes[as_obj.asn] = outcome_int
+        return outcomes
+
+    def _get_as_end_outcome_data_plane(
+        self, as_obj: AS, most_specific_ann: Optional["Ann"]
+    ) -> tuple[int, bool]:
+        """Returns the outcome if the traceback ends here and if AS intercepts
+
+        The outcome is UNDETERMINED if the traceback continues to the next hop
+        """
+
+        return self._determine_as_outcome_data_plane(as_obj, most_specific_ann), False
+
+    @staticmethod
+    def _jump_pointers(
+        next_hops: list[int], intercepted: list[bool]
+    ) -> tuple[list[int], list[bool]]:
+        """Jumps every pointer to the end of its chain of next hops
+
+        Also ORs together the intercepted flags along each chain.
+        Chains that are loops never reach an end, so stop once every chain
+        that isn't a loop must have reached its end
+        """
+
+        # After k passes, each AS has jumped 2^k next hops. The extra pass
+        # ORs in the flag at the end of the chain
+        for _ in range(len(next_hops).bit_length() + 1):
+            intercepted = [
+                as_intercepted or intercepted[next_hop]
+                for as_intercepted, next_hop in zip(intercepted, next_hops, strict=True)
+            ]
+            jumped_next_hops = [next_hops[next_hop] for next_hop in next_hops]
+            if jumped_next_hops == next_hops:
+                break
+            next_hops = jumped_next_hops
+        return next_hops, intercepted
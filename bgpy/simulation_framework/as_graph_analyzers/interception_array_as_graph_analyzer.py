@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING, Optional
+
+from bgpy.as_graphs import AS
+from bgpy.shared.enums import Outcomes
+
+from .array_as_graph_analyzer import ArrayASGraphAnalyzer
+from .interception_as_graph_analyzer import InterceptionASGraphAnalyzer
+
+if TYPE_CHECKING:
+    from bgpy.simulation_engine import Announcement as Ann
+
+
+class InterceptionArrayASGraphAnalyzer(
+    ArrayASGraphAnalyzer, InterceptionASGraphAnalyzer
+):
+    """InterceptionASGraphAnalyzer that resolves the data plane without recursion
+
+    The attacker ONLY succeeds if they are able to perform an interception
+    attack and keep the original connection alive. Rather than ending the
+    traceback, attackers mark the traffic as intercepted and forward it on,
+    so it is an attacker success if it then reaches the victim
+    """
+
+    def _get_as_end_outcome_data_plane(
+        self, as_obj: AS, most_specific_ann: Optional["Ann"]
+    ) -> tuple[int, bool]:
+        """Returns the outcome if the traceback ends here and if AS intercepts
+
+        The outcome is UNDETERMINED if the traceback continues to the next hop
+        """
+
+        outcome_int = self._determine_as_outcome_data_plane(as_obj, most_specific_ann)
+        if outcome_int == Outcomes.ATTACKER_SUCCESS.value:
+            # If next hop is this AS, it's disconnected since we didn't
+            # get back to the victim
+            if (
+                most_specific_ann is None
+                or most_specific_ann.next_hop_asn == as_obj.asn
+            ):
+                return Outcomes.DISCONNECTED.value, True
+            else:
+                return Outcomes.UNDETERMINED.value, True
+        else:
+            return outcome_int, False
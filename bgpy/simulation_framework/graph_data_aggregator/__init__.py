@@ -2,6 +2,7 @@ from .data_point_agg_data import DataPointAggData
 from .data_point_key import DataPointKey
 from .graph_category import GraphCategory
 from .graph_data_aggregator import GraphDataAggregator
+from .running_stats import RunningStats
 from .trial_data import TrialData
 
 __all__ = [
@@ -9,5 +10,6 @@ __all__ = [
     "DataPointKey",
     "GraphCategory",
     "GraphDataAggregator",
+    "RunningStats",
     "TrialData",
 ]
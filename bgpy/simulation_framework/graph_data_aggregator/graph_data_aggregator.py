@@ -4,10 +4,11 @@ from collections import defaultdict
 from math import sqrt
 from pathlib import Path
 from statistics import mean, stdev
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 from warnings import warn
+from weakref import ReferenceType, ref
 
-from bgpy.shared.enums import Outcomes, Plane, SpecialPercentAdoptions
+from bgpy.shared.enums import InAdoptingASNs, Outcomes, Plane, SpecialPercentAdoptions
 from bgpy.simulation_engine import BaseSimulationEngine
 from bgpy.simulation_framework.scenarios import Scenario
 from bgpy.simulation_framework.utils import get_all_graph_categories
@@ -15,10 +16,34 @@ from bgpy.simulation_framework.utils import get_all_graph_categories
 from .data_point_agg_data import DataPointAggData
 from .data_point_key import DataPointKey
 from .graph_category import GraphCategory
+from .running_stats import RunningStats
 from .trial_data import TrialData
 
-DATA_TYPE = dict[GraphCategory, defaultdict[DataPointKey, list[float]]]
+if TYPE_CHECKING:
+    from bgpy.as_graphs import ASGraph
+
+# Either the list of all the percents, or just their RunningStats
+PERCENTS_TYPE = list[float] | RunningStats
+DATA_TYPE = dict[GraphCategory, defaultdict[DataPointKey, PERCENTS_TYPE]]
 PICKLE_DATA_TYPE = dict[GraphCategory, dict[DataPointKey, DataPointAggData]]
+# Translates bytes of 0s and 1s into the ASCII digits that int(x, 2) parses
+_BITS_TRANSLATION = bytes.maketrans(b"\x00\x01", b"01")
+# TrialData's own funcs, to tell if they've been replaced (_trial_data_customized)
+_TRIAL_DATA_FUNCS: dict[str, Any] = {
+    name: getattr(TrialData, name)
+    for name in ("get_percent", "add_data", "_add_denominator", "_add_numerator")
+}
+
+
+def _get_bitmask(flags: list[bool]) -> int:
+    """Returns an int where bit i is set if flags[i] is True
+
+    Python ints work as bitsets of any size, and & | ~ and int.bit_count
+    are all done in C, so these serve as boolean masks over the ASes
+    """
+
+    # The last flag is the most significant bit. The leading 0 is for no flags
+    return int(b"0" + bytes(flags[::-1]).translate(_BITS_TRANSLATION), 2)
 
 
 class GraphDataAggregator:
@@ -28,8 +53,22 @@ class GraphDataAggregator:
         self,
         data: DATA_TYPE | None = None,
         graph_categories: tuple[GraphCategory, ...] = tuple(get_all_graph_categories()),
+        running_stats: bool = False,
+        trial_records_path: Path | None = None,
     ) -> None:
-        """Inits data"""
+        """Inits data
+
+        running_stats stores RunningStats rather than a list of every percent,
+        so that memory doesn't grow with the number of trials and merging is
+        O(number of data points). The CSV and pickle are identical either way
+
+        trial_records_path is a file that the percents of each trial are
+        appended to as they are aggregated (see from_trial_records), so that
+        the trials that finished aren't lost if the run crashes
+        """
+
+        self.running_stats: bool = running_stats
+        self._PercentsCls: type[PERCENTS_TYPE] = RunningStats if running_stats else list
 
         # Data is the key for single data point on a graph
         # key DataKey (prop_round, percent_adopt, scenario_label, MetricKey)
@@ -37,9 +76,21 @@ class GraphDataAggregator:
         if data:
             self.data: DATA_TYPE = data
         else:
-            self.data = {x: defaultdict(list) for x in graph_categories}
+            self.data = {x: defaultdict(self._PercentsCls) for x in graph_categories}
 
         self.graph_categories: tuple[GraphCategory, ...] = graph_categories
+        self.trial_records_path: Path | None = trial_records_path
+        # The AS graph that the AS group bitmasks were built for, and the masks
+        self._as_group_masks_as_graph: ReferenceType[ASGraph] | None = None
+        self._as_group_masks: tuple[tuple[int, ...], dict[str, int]] = ((), {})
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Don't pickle the AS group bitmasks (or the weakref to their graph)"""
+
+        state = self.__dict__.copy()
+        state["_as_group_masks_as_graph"] = None
+        state["_as_group_masks"] = ((), {})
+        return state
 
     #############
     # Add Funcs #
@@ -55,19 +106,44 @@ class GraphDataAggregator:
         if isinstance(other, GraphDataAggregator):
             err = "All processes should use the same graph categories?"
             assert other.graph_categories == self.graph_categories, err
+            err = "All processes should use running_stats or not"
+            assert other.running_stats == self.running_stats, err
             # Time trials show that building a new dict here makes the most sense
-            new_data: DATA_TYPE = {x: defaultdict(list) for x in self.graph_categories}
+            new_data: DATA_TYPE = {
+                x: defaultdict(self._PercentsCls) for x in self.graph_categories
+            }
             for obj in (self, other):
                 for graph_category, data_dict in obj.data.items():
                     for data_point_key, percents in data_dict.items():
+                        # With RunningStats, this is O(1) rather than O(trials)
                         new_data[graph_category][data_point_key].extend(percents)
-            return self.__class__(data=new_data)
+            return self.__class__(
+                data=new_data,
+                graph_categories=self.graph_categories,
+                running_stats=self.running_stats,
+            )
         else:
             return NotImplemented
 
     def __radd__(self, other):
         return self.__add__(other)
 
+    def order_data_point_keys(self, data_point_keys: Iterable[DataPointKey]) -> None:
+        """Orders the data points of every graph category like data_point_keys
+
+        The data points are in the order they were first added, which depends on
+        the order that trials were run in (and merged). Ordering them keeps the
+        CSV and pickle the same no matter how the trials were run.
+        Data points that aren't in data_point_keys go last
+        """
+
+        order = {x: i for i, x in enumerate(data_point_keys)}
+        for graph_category, data_dict in self.data.items():
+            self.data[graph_category] = defaultdict(
+                self._PercentsCls,
+                sorted(data_dict.items(), key=lambda x: order.get(x[0], len(order))),
+            )
+
     ######################
     # Track Metric Funcs #
     ######################
@@ -95,11 +171,22 @@ class GraphDataAggregator:
         is because the engines are very large and this would take a lot longer
         """
 
-        # Each tracks trial data for a single graph category
-        trial_datas = [TrialData(x) for x in self.graph_categories]
-        self._aggregate_trial_data(
-            trial_datas=trial_datas, engine=engine, scenario=scenario, outcomes=outcomes
-        )
+        if self._trial_data_customized():
+            # Each tracks trial data for a single graph category
+            trial_datas = [TrialData(x) for x in self.graph_categories]
+            self._aggregate_trial_data(
+                trial_datas=trial_datas,
+                engine=engine,
+                scenario=scenario,
+                outcomes=outcomes,
+            )
+            # Convert trial data as a percent
+            # Ex: # of ASes attacker success and adopting / adopting
+            percents = {x.graph_category: x.get_percent() for x in trial_datas}
+        else:
+            percents = self._get_trial_percents(
+                engine=engine, scenario=scenario, outcomes=outcomes
+            )
 
         data_point_key = DataPointKey(
             propagation_round=propagation_round,
@@ -107,14 +194,173 @@ class GraphDataAggregator:
             scenario_config=scenario.scenario_config,
         )
 
-        for trial_data in trial_datas:
-            # Cpmvert trial data as a percent
-            # Ex: # of ASes attacker success and adopting / adopting
-            percent = trial_data.get_percent()
+        if self.trial_records_path is not None:
+            self._write_trial_record(trial, data_point_key, percents)
+        self.store_trial_percents(data_point_key, percents)
+
+    def store_trial_percents(
+        self,
+        data_point_key: DataPointKey,
+        percents: dict[GraphCategory, float | None],
+    ) -> None:
+        """Stores the percents of a single trial (i.e. from the trial records)"""
+
+        for graph_category, percent in percents.items():
             # If there are no ASes tracked in this graph category,
             # percent is None, and there's nothing to track
             if percent is not None:
-                self.data[trial_data.graph_category][data_point_key].append(percent)
+                self.data[graph_category][data_point_key].append(percent)
+
+    def _write_trial_record(
+        self,
+        trial: int,
+        data_point_key: DataPointKey,
+        percents: dict[GraphCategory, float | None],
+    ) -> None:
+        """Appends the percents of a single trial to the trial records
+
+        Opened for each trial so that every finished trial is on disk
+        """
+
+        assert self.trial_records_path is not None, "for mypy"
+        with self.trial_records_path.open("ab") as f:
+            pickle.dump((trial, data_point_key, percents), f)
+
+    @classmethod
+    def from_trial_records(
+        cls, trial_records_paths: Iterable[Path], **kwargs
+    ) -> "GraphDataAggregator":
+        """Aggregates the trials recorded in trial_records_paths
+
+        kwargs are passed to the GraphDataAggregator. If the run crashed mid
+        write, the partially written record at the end of a file is skipped
+        """
+
+        graph_data_aggregator = cls(**kwargs)
+        for _, data_point_key, percents in cls.read_trial_records(trial_records_paths):
+            graph_data_aggregator.store_trial_percents(data_point_key, percents)
+        return graph_data_aggregator
+
+    @staticmethod
+    def read_trial_records(
+        trial_records_paths: Iterable[Path],
+    ) -> Iterator[tuple[int, DataPointKey, dict[GraphCategory, float | None]]]:
+        """Yields (trial, data_point_key, percents) from the trial records"""
+
+        for trial_records_path in trial_records_paths:
+            with trial_records_path.open("rb") as f:
+                while True:
+                    try:
+                        yield pickle.load(f)  # noqa: S301
+                    # End of the file, or a partially written record
+                    except (EOFError, pickle.UnpicklingError):
+                        break
+
+    def _trial_data_customized(self) -> bool:
+        """Returns True if _aggregate_trial_data or TrialData's funcs are replaced
+
+        _get_trial_percents gets the same percents as the defaults much faster,
+        but can't know about custom ones, so those still use TrialData
+        """
+
+        aggregate_trial_data = self._aggregate_trial_data.__func__  # type: ignore
+        if aggregate_trial_data is not GraphDataAggregator._aggregate_trial_data:
+            return True
+        return any(
+            getattr(TrialData, name) is not func
+            for name, func in _TRIAL_DATA_FUNCS.items()
+        )
+
+    def _get_trial_percents(
+        self,
+        *,
+        engine: BaseSimulationEngine,
+        scenario: Scenario,
+        outcomes: dict[int, dict[int, int]],
+    ) -> dict[GraphCategory, float | None]:
+        """Returns the percent for every graph category for a single trial
+
+        Ex: # of ASes attacker success and adopting / adopting
+
+        Rather than checking every AS against every graph category, this builds
+        bitmasks over the ASes for each AS group, adopting set, and outcome,
+        so that the numerator and denominator of each graph category are
+        just the bit counts of the masks ANDed together.
+        The percents are identical to those of TrialData
+        """
+
+        asns, as_group_masks = self._get_as_group_masks(engine.as_graph)
+
+        # Don't count these!
+        uncountable_asns = scenario.untracked_asns
+        tracked_mask = _get_bitmask([asn not in uncountable_asns for asn in asns])
+        adopting_asns = scenario.adopting_asns
+        adopting_mask = _get_bitmask([asn in adopting_asns for asn in asns])
+        in_adopting_asns_masks = {
+            InAdoptingASNs.ANY: tracked_mask,
+            InAdoptingASNs.TRUE: tracked_mask & adopting_mask,
+            InAdoptingASNs.FALSE: tracked_mask & ~adopting_mask,
+        }
+
+        plane_outcome_dicts = {
+            Plane.DATA: outcomes[Plane.DATA.value],
+            Plane.CTRL: outcomes[Plane.CTRL.value],
+        }
+        plane_outcome_lists: dict[Plane, list[int]] = dict()
+        outcome_masks: dict[tuple[Plane, Outcomes], int] = dict()
+
+        percents: dict[GraphCategory, float | None] = dict()
+        for graph_category in self.graph_categories:
+            plane = graph_category.plane
+            outcome_mask_key = (plane, graph_category.outcome)
+            if outcome_mask_key not in outcome_masks:
+                if plane not in plane_outcome_lists:
+                    if plane not in plane_outcome_dicts:
+                        raise NotImplementedError
+                    # Must use .get, since if this tracking is turned off,
+                    # this will be an empty dict
+                    plane_outcome_dict = plane_outcome_dicts[plane]
+                    undetermined = Outcomes.UNDETERMINED.value
+                    plane_outcome_lists[plane] = [
+                        plane_outcome_dict.get(asn, undetermined) for asn in asns
+                    ]
+                outcome_value = graph_category.outcome.value
+                outcome_masks[outcome_mask_key] = _get_bitmask(
+                    [x == outcome_value for x in plane_outcome_lists[plane]]
+                )
+
+            denominator_mask = (
+                as_group_masks[graph_category.as_group.value]
+                & in_adopting_asns_masks[graph_category.in_adopting_asns]
+            )
+            denominator = denominator_mask.bit_count()
+            numerator = (denominator_mask & outcome_masks[outcome_mask_key]).bit_count()
+            if numerator == 0 and denominator == 0:
+                percents[graph_category] = None
+            else:
+                percents[graph_category] = numerator * 100 / denominator
+        return percents
+
+    def _get_as_group_masks(
+        self, as_graph: "ASGraph"
+    ) -> tuple[tuple[int, ...], dict[str, int]]:
+        """Returns the ASNs and a bitmask over them for each AS group
+
+        These only depend on the AS graph, so they are reused between trials
+        """
+
+        if (
+            self._as_group_masks_as_graph is None
+            or self._as_group_masks_as_graph() is not as_graph
+        ):
+            asns = tuple([as_obj.asn for as_obj in as_graph])
+            as_group_masks = {
+                as_group: _get_bitmask([asn in group_asns for asn in asns])
+                for as_group, group_asns in as_graph.asn_groups.items()
+            }
+            self._as_group_masks_as_graph = ref(as_graph)
+            self._as_group_masks = (asns, as_group_masks)
+        return self._as_group_masks
 
     def _aggregate_trial_data(
         self,
@@ -124,7 +370,11 @@ class GraphDataAggregator:
         scenario: Scenario,
         outcomes: dict[int, dict[int, int]],
     ) -> None:
-        """Gets data from every AS and stores it in the trial datas"""
+        """Gets data from every AS and stores it in the trial datas
+
+        NOTE: aggregate_and_store_trial_data only uses this if it, or
+        TrialData, is customized (see _trial_data_customized)
+        """
 
         ctrl_plane_outcomes = outcomes[Plane.CTRL.value]
         data_plane_outcomes = outcomes[Plane.DATA.value]
@@ -206,7 +456,7 @@ class GraphDataAggregator:
                         # This is the proper way to do it,
                         # rather than defaulting trial_data
                         # to [0], which skews results when aggregating trials
-                        "value": mean(percent_list) if percent_list else None,
+                        "value": self._get_mean(percent_list) if percent_list else None,
                         "yerr": self._get_yerr(percent_list),
                         "scenario_config_label": (
                             data_point_key.scenario_config.csv_label
@@ -224,7 +474,7 @@ class GraphDataAggregator:
                 # data point and we shouldn't store it at all, lest it mess us up later
                 if self._data_is_storable(percent_list, data_point_key, graph_category):
                     agg_data[graph_category][data_point_key] = DataPointAggData(
-                        value=mean(percent_list),
+                        value=self._get_mean(percent_list),
                         yerr=self._get_yerr(percent_list),
                         data_point_key=data_point_key,
                     )
@@ -232,7 +482,7 @@ class GraphDataAggregator:
 
     def _data_is_storable(
         self,
-        percent_list: list[float],
+        percent_list: PERCENTS_TYPE,
         data_point_key: DataPointKey,
         graph_category: GraphCategory,
     ) -> bool:
@@ -256,11 +506,23 @@ class GraphDataAggregator:
             )
             return False
 
-    def _get_yerr(self, percent_list: list[float]) -> float:
+    def _get_mean(self, percent_list: PERCENTS_TYPE) -> float:
+        """Returns the mean of the percents"""
+
+        if isinstance(percent_list, RunningStats):
+            return percent_list.get_mean()
+        else:
+            return mean(percent_list)
+
+    def _get_yerr(self, percent_list: PERCENTS_TYPE) -> float:
         """Returns 90% confidence interval for graphing"""
 
         if len(percent_list) > 1:
-            yerr_num = 1.645 * 2 * stdev(percent_list)
+            if isinstance(percent_list, RunningStats):
+                percents_stdev = percent_list.get_stdev()
+            else:
+                percents_stdev = stdev(percent_list)
+            yerr_num = 1.645 * 2 * percents_stdev
             yerr_denom = sqrt(len(percent_list))
             return float(yerr_num / yerr_denom)
         else:
@@ -0,0 +1,116 @@
+import sys
+from fractions import Fraction
+from math import isqrt, sqrt
+from typing import Iterable, Union
+
+# Bits needed so that rounding to odd, then to a float, rounds correctly
+_SQRT_BIT_WIDTH = 2 * sys.float_info.mant_dig + 3
+
+
+class RunningStats:
+    """Running count, mean, and sum of squared deviations (M2) of percents
+
+    This is Welford's algorithm, so percents can be added one at a time
+    without storing them, and two RunningStats merge in O(1) (Chan et al.).
+
+    Unlike the usual Welford's algorithm, the mean and M2 are exact fractions.
+    Floats are exact fractions, and the statistics module computes the mean
+    and variance exactly before rounding, so doing the same here gives
+    results identical to statistics.mean and statistics.stdev over the same
+    percents. As of Python 3.11 statistics.stdev is correctly rounded, but
+    before that (i.e. on Python and PyPy 3.10) it takes math.sqrt of the
+    variance rounded to a float, so get_stdev does whichever this
+    interpreter's statistics module does.
+
+    This supports append, extend, and len like the list of percents it replaces
+    """
+
+    __slots__ = ("count", "m2", "mean")
+
+    def __init__(self, percents: Iterable[float] = ()) -> None:
+        self.count: int = 0
+        self.mean: Fraction = Fraction(0)
+        self.m2: Fraction = Fraction(0)
+        self.extend(percents)
+
+    def append(self, percent: float) -> None:
+        """Adds a single percent"""
+
+        value = Fraction(percent)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def extend(self, percents: Union["RunningStats", Iterable[float]]) -> None:
+        """Adds many percents, or merges in another RunningStats in O(1)"""
+
+        if isinstance(percents, RunningStats):
+            count = self.count + percents.count
+            if count:
+                delta = percents.mean - self.mean
+                self.mean += delta * percents.count / count
+                self.m2 += (
+                    percents.m2 + delta * delta * self.count * percents.count / count
+                )
+                self.count = count
+        else:
+            for percent in percents:
+                self.append(percent)
+
+    def get_mean(self) -> float:
+        """Returns the mean, identical to statistics.mean"""
+
+        assert self.count, "Mean requires at least one data point"
+        return float(self.mean)
+
+    def get_stdev(self) -> float:
+        """Returns the sample standard deviation, identical to statistics.stdev
+
+        As of Python 3.11, the square root is correctly rounded, the same way
+        as the statistics module: take the integer square root at twice the
+        float precision, round to odd to keep track of inexactness, then round
+        once to a float
+        """
+
+        assert self.count > 1, "Stdev requires at least two data points"
+        variance = self.m2 / (self.count - 1)
+        # Rounds twice, like statistics.stdev before Python 3.11
+        if sys.version_info < (3, 11):
+            return sqrt(float(variance))
+        numerator, denominator = variance.numerator, variance.denominator
+        shift = (
+            numerator.bit_length() - denominator.bit_length() - _SQRT_BIT_WIDTH
+        ) // 2
+        if shift >= 0:
+            root = self._isqrt_round_to_odd(numerator, denominator << 2 * shift)
+            return (root << shift) / 1
+        else:
+            root = self._isqrt_round_to_odd(numerator << -2 * shift, denominator)
+            return root / (1 << -shift)
+
+    @staticmethod
+    def _isqrt_round_to_odd(numerator: int, denominator: int) -> int:
+        """Square root of numerator / denominator rounded to an int (to odd)"""
+
+        root = isqrt(numerator // denominator)
+        return root | (root * root * denominator != numerator)
+
+    def __len__(self) -> int:
+        return self.count
+
+    # Mutable, so not hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RunningStats):
+            return (self.count, self.mean, self.m2) == (
+                other.count,
+                other.mean,
+                other.m2,
+            )
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self.count}, mean={float(self.mean)})"
@@ -1,9 +1,6 @@
 import gc
 from statistics import mean
 
-import matplotlib.pyplot as plt
-from matplotlib.container import ErrorbarContainer
-
 
 def _add_legends_and_save(
     self,
@@ -87,6 +84,10 @@ def _add_strongest_attacker_legend(
 ):
     """Add second legend for strongest attacker"""
 
+    # matplotlib is slow to import, so it's only imported when graphing
+    import matplotlib.pyplot as plt
+    from matplotlib.container import ErrorbarContainer
+
     # Only run if there is a secondary strongest attacker
     if not self.strongest_attacker_dict:
         return
@@ -147,6 +148,8 @@ def _add_strongest_attacker_legend(
 def _save_and_close_graph(self, fig, ax, graph_name):
     """Saves and closes the graph"""
 
+    import matplotlib.pyplot as plt
+
     path = self.graph_dir / graph_name
     path.parent.mkdir(parents=True, exist_ok=True)
     plt.savefig(path)
@@ -3,9 +3,6 @@ from dataclasses import replace
 from statistics import mean
 from typing import TYPE_CHECKING
 
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-
 from bgpy.simulation_framework.graphing.line_data import LineData
 from bgpy.simulation_framework.graphing.line_info import LineInfo
 from bgpy.simulation_framework.graphing.line_properties_generator import (
@@ -25,6 +22,10 @@ def _preprocessing_steps(
     graph_category: "GraphCategory",
     data_dict: dict["DataPointKey", "DataPointAggData"],
 ):
+    # matplotlib is slow to import, so it's only imported when graphing
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
     graph_name = self._get_graph_name(graph_category)
 
     label_rows_dict: defaultdict[str, list[DataPointAggData]] = defaultdict(list)
@@ -53,6 +54,8 @@ def _get_graph_name(self, graph_category: "GraphCategory") -> str:
 def _customize_graph(self, fig, ax, graph_category: "GraphCategory") -> None:
     """Customizes graph properties"""
 
+    import matplotlib.pyplot as plt
+
     fig.set_dpi(300)
     plt.rcParams.update({"font.size": 14, "lines.markersize": 10})
     # Set X and Y axis size
@@ -1,7 +1,6 @@
 import warnings
 from typing import TYPE_CHECKING, Optional
 
-from bgpy.as_graphs.base.as_graph.customer_cone_funcs import _get_cone_size_helper
 from bgpy.shared.constants import bgpy_logger
 from bgpy.shared.enums import (
     ASGroups,
@@ -34,7 +33,6 @@ class AccidentalRouteLeak(VictimsPrefix):
         adopting_asns: frozenset[int] | None = None,
     ):
         assert engine, "Need engine for customer cones"
-        self._attackers_customer_cones_asns: set[int] = set()
         super().__init__(
             scenario_config=scenario_config,
             percent_adoption=percent_adoption,
@@ -65,9 +63,6 @@ class AccidentalRouteLeak(VictimsPrefix):
             )
             warnings.warn(msg, RuntimeWarning, stacklevel=2)
 
-    # Just returns customer cone
-    _get_cone_size_helper = _get_cone_size_helper
-
     def post_propagation_hook(
         self,
         engine: "BaseSimulationEngine",
@@ -155,12 +150,11 @@ class AccidentalRouteLeak(VictimsPrefix):
         )
         # Stores customer cones of attacker ASNs
         # used in untrackable func and when selecting victims
+        # (set here rather than in __init__ for get_attacker_and_victim_asns)
+        self._attackers_customer_cones_asns: set[int] = set()
         for attacker_asn in attacker_asns:
             self._attackers_customer_cones_asns.update(
-                self._get_cone_size_helper(
-                    engine.as_graph.as_dict[attacker_asn],
-                    dict(),
-                ),
+                engine.as_graph.reachability_index.get_customer_cone_asns(attacker_asn)
             )
         return attacker_asns
 
@@ -55,15 +55,7 @@ class Scenario:
         self.scenario_config: ScenarioConfig = scenario_config
         self.percent_adoption: float | SpecialPercentAdoptions = percent_adoption
 
-        self.attacker_asns: frozenset[int] = self._get_attacker_asns(
-            scenario_config.override_attacker_asns,
-            attacker_asns,
-            engine,
-        )
-
-        self.victim_asns: frozenset[int] = self._get_victim_asns(
-            scenario_config.override_victim_asns, victim_asns, engine
-        )
+        self._set_attacker_and_victim_asns(attacker_asns, victim_asns, engine)
         self.adopting_asns: frozenset[int] = self._get_adopting_asns(
             scenario_config.override_adopting_asns,
             adopting_asns,
@@ -88,11 +80,56 @@ class Scenario:
         )
 
     def _reset_and_add_roas_to_roa_checker(self) -> None:
-        """Clears & adds ROAs to roa_checker which serves as RPKI+Routinator combo"""
+        """Clears & adds ROAs to roa_checker which serves as RPKI+Routinator combo
+
+        Also looks up the validity of every announcement's prefix and origin
+        once, rather than policies doing so for every announcement they process
+        """
 
         Policy.roa_checker.clear()
         for roa in self.roas:
             Policy.roa_checker.insert(roa.prefix, roa)
+        Policy.reset_roa_info_table((x.prefix, x.origin) for x in self.announcements)
+
+    @classmethod
+    def get_attacker_and_victim_asns(
+        cls,
+        *,
+        scenario_config: ScenarioConfig,
+        percent_adoption: float | SpecialPercentAdoptions = 0,
+        engine: BaseSimulationEngine | None = None,
+    ) -> tuple[frozenset[int], frozenset[int]]:
+        """Returns the attackers and victims that a new scenario would draw
+
+        Only the attackers and victims are drawn, so unlike creating the
+        scenario, this doesn't draw the adopting ASNs, create announcements or
+        ROAs, or reset the ROA checker. Attacker and victim selection must only
+        depend on the config, percent adoption, and engine, not on __init__
+        """
+
+        scenario = cls.__new__(cls)
+        scenario.scenario_config = scenario_config
+        scenario.percent_adoption = percent_adoption
+        scenario._set_attacker_and_victim_asns(None, None, engine)  # noqa: SLF001
+        return scenario.attacker_asns, scenario.victim_asns
+
+    def _set_attacker_and_victim_asns(
+        self,
+        prev_attacker_asns: frozenset[int] | None,
+        prev_victim_asns: frozenset[int] | None,
+        engine: BaseSimulationEngine | None,
+    ) -> None:
+        """Sets the attacker ASNs, and then the victim ASNs (excluding attackers)"""
+
+        self.attacker_asns: frozenset[int] = self._get_attacker_asns(
+            self.scenario_config.override_attacker_asns,
+            prev_attacker_asns,
+            engine,
+        )
+
+        self.victim_asns: frozenset[int] = self._get_victim_asns(
+            self.scenario_config.override_victim_asns, prev_victim_asns, engine
+        )
 
     #################
     # Get attackers #
@@ -4,18 +4,25 @@ import os
 import random
 import shutil
 import time
+import traceback
 from copy import deepcopy
-from multiprocessing import Pool, cpu_count
+from multiprocessing import Process, Queue, cpu_count
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Iterable
+from queue import Empty
+from typing import TYPE_CHECKING, Iterable, Iterator
 from warnings import warn
 
 import psutil
 from frozendict import frozendict
 from tqdm import tqdm
 
-from bgpy.as_graphs.base import ASGraph, ASGraphConstructor
+from bgpy.as_graphs.base import (
+    ASGraph,
+    ASGraphAttrs,
+    ASGraphConstructor,
+    ColumnarASGraphInfo,
+    SharedASGraphInfo,
+)
 from bgpy.as_graphs.caida_as_graph import CAIDAASGraphConstructor
 from bgpy.shared.constants import DIRS, SINGLE_DAY_CACHE_DIR, bgpy_logger
 from bgpy.shared.enums import SpecialPercentAdoptions
@@ -24,17 +31,22 @@ from bgpy.simulation_engine import (
     ROV,
     BaseSimulationEngine,
     BGPFull,
+    Instrumentation,
     SimulationEngine,
 )
 
 from .as_graph_analyzers import ASGraphAnalyzer, BaseASGraphAnalyzer
-from .graph_data_aggregator import GraphCategory, GraphDataAggregator
+from .graph_data_aggregator import DataPointKey, GraphCategory, GraphDataAggregator
 from .graphing import GraphFactory
 from .scenarios import Scenario, ScenarioConfig, SubprefixHijack
 from .utils import get_all_graph_categories
+from .worker_checkpoint import WorkerCheckpoint, WorkUnit
 
 if TYPE_CHECKING:
-    from multiprocessing.pool import ApplyResult
+    from multiprocessing import queues
+
+    # What each worker sends back once it's done
+    WorkerResult = tuple[GraphDataAggregator, Instrumentation]
 
 parser = argparse.ArgumentParser(description="Runs BGPy simulations")
 parser.add_argument(
@@ -106,6 +118,18 @@ class Simulation:
         # Control plane trackign for traceback and GraphDataAggregatorCls
         control_plane_tracking: bool = False,
         graph_categories: tuple[GraphCategory, ...] = tuple(get_all_graph_categories()),
+        # Keep running stats of the trials rather than every trial's percent
+        running_stats: bool = False,
+        # Append each trial's percents to files in trial_records_dir
+        write_trial_records: bool = False,
+        # Periodically save each worker's progress to files in checkpoints_dir
+        write_checkpoints: bool = False,
+        # Minimum number of seconds between a worker's checkpoints
+        checkpoint_interval: float = 60,
+        # Skip the trials saved in the checkpoints of a previous run
+        resume: bool = False,
+        # Time each phase and count hot path events into instrumentation.json
+        write_instrumentation: bool = False,
     ) -> None:
         """Downloads relationship data, runs simulation
 
@@ -113,6 +137,23 @@ class Simulation:
         graph_path: Where to store the graphs. Should be a .tar.gz file
         assert_pypy: Ensures you are using pypy if true
         mp_method: Multiprocessing method
+        running_stats: see GraphDataAggregator, doesn't change the output
+        write_trial_records: if the run crashes, the finished trials can be
+        aggregated with GraphDataAggregator.from_trial_records
+        write_checkpoints: each worker saves its aggregated data and completed
+        work units after a work unit if checkpoint_interval seconds have
+        passed since its last checkpoint, and once it's done
+        resume: only runs the work units that aren't in the checkpoints.
+        Since every work unit is seeded on its own, the results are identical
+        to an uninterrupted run when python_hash_seed is set. Requires the
+        same num_trials, percent_adoptions, and scenario_configs
+        write_instrumentation: writes the wall time of each phase (graph
+        building, each work unit, and within those setting AS classes,
+        seeding, each propagation direction, analysis, and aggregation) and
+        counts of anns received, copied, validated and rejected, and of Gao
+        Rexford comparisons, summed across workers, to instrumentation_path.
+        This slows down the hot paths, so don't compare its times to runs
+        without it
         """
 
         self.percent_adoptions: tuple[float | SpecialPercentAdoptions, ...] = (
@@ -125,6 +166,10 @@ class Simulation:
         )
 
         self.python_hash_seed: int | None = python_hash_seed
+        # Every work unit is seeded with this plus its trial and percent adoption
+        self._random_seed: str = str(
+            random.getrandbits(64) if python_hash_seed is None else python_hash_seed
+        )
         self._seed_random()
 
         self.sim_name: str = sim_name if sim_name else self.default_sim_name
@@ -149,13 +194,20 @@ class Simulation:
         self.control_plane_tracking: bool = control_plane_tracking
 
         self.graph_categories: tuple[GraphCategory, ...] = graph_categories
+        self.running_stats: bool = running_stats
+        self.write_trial_records: bool = write_trial_records
+        # Keep checkpointing when resuming, in case it crashes again
+        self.write_checkpoints: bool = write_checkpoints or resume
+        self.checkpoint_interval: float = checkpoint_interval
+        self.resume: bool = resume
+        # Summed across workers once they're done
+        self.instrumentation: Instrumentation = Instrumentation(
+            enabled=write_instrumentation
+        )
 
-        # Can't delete this since it gets deleted in multiprocessing for some reason
-        # NOTE: Once pypy gets to 3.12, just pass delete=False to this
-        with TemporaryDirectory() as tmp_dir:
-            tmp_dir_str = tmp_dir
-        self._tqdm_tracking_dir: Path = Path(tmp_dir_str)
-        self._tqdm_tracking_dir.mkdir(parents=True)
+        # Name of the shared memory block that multiprocessing workers build
+        # their AS graph from (set only while the workers are running)
+        self._shared_as_graph_info_name: str | None = None
 
     @property
     def default_sim_name(self) -> str:
@@ -215,6 +267,10 @@ class Simulation:
         """Validates that the RAM will not run out of bounds
 
         NOTE: all these values where obtained using pypy3.10 on a laptop
+
+        Workers only share the parsed AS graph info, ranks, and cone sizes
+        (see SharedASGraphInfo). Each one still builds a full AS graph, so
+        the whole graph is counted once per core
         """
 
         graph_kwargs = self.as_graph_constructor_kwargs.get("as_graph_kwargs", {})
@@ -226,9 +282,9 @@ class Simulation:
         if store_customer_cone_asns and store_provider_cone_asns:
             total_gb_ram_per_core = 2.3
         # How much RAM for storing either provider or customer cone
-        elif store_customer_cone_asns and store_provider_cone_asns:
+        elif store_customer_cone_asns or store_provider_cone_asns:
             total_gb_ram_per_core = 1.6
-        # By default sims take ~1gb/core
+        # By default sims take ~.9gb/core
         else:
             total_gb_ram_per_core = 0.9
 
@@ -259,14 +315,20 @@ class Simulation:
         graph_data_aggregator.write_data(
             csv_path=self.csv_path, pickle_path=self.pickle_path
         )
+        if self.instrumentation.enabled:
+            self.instrumentation.write_json(self.instrumentation_path)
         self._graph_data(GraphFactoryCls, graph_factory_kwargs)
         # This object holds a lot of memory, good to get rid of it
         del graph_data_aggregator
         gc.collect()
-        shutil.rmtree(self._tqdm_tracking_dir)
 
     def _seed_random(self, seed_suffix: str = "") -> None:
-        """Seeds randomness"""
+        """Seeds randomness
+
+        Without a python_hash_seed, the seed is random for each simulation
+        (or restored from the checkpoints when resuming), so that every
+        work unit of a trial draws the same attackers and victims
+        """
 
         if self.python_hash_seed is not None:
             msg = (
@@ -277,157 +339,363 @@ class Simulation:
             )
             if os.environ.get("PYTHONHASHSEED") != str(self.python_hash_seed):
                 raise RuntimeError(msg)
-            random.seed(str(self.python_hash_seed) + seed_suffix)
+        random.seed(self._random_seed + seed_suffix)
 
-    def _get_data(self):
+    def _get_data(self) -> GraphDataAggregator:
         """Runs trials for graph and aggregates data"""
 
+        graph_data_aggregator, work_units, first_worker_id = self._get_resumed_data()
+
+        # Every work unit was in the checkpoints
+        if not work_units:
+            results: list[GraphDataAggregator] = list()
         # Single process
-        if self.parse_cpus == 1:
-            # Results are a list of lists of metric trackers that we then sum
-            return sum(
-                self._get_single_process_results(), start=self.GraphDataAggregatorCls()
+        elif self.parse_cpus == 1:
+            work_units_iter = tqdm(
+                work_units, desc=f"Simulating {self.output_dir.name}"
             )
+            results = [self._run_work_units(first_worker_id, work_units_iter)]
         # Multiprocess
         else:
-            # Results are a list of lists of metric trackers that we then sum
-            return sum(self._get_mp_results(), start=self.GraphDataAggregatorCls())
+            results = self._get_mp_results(work_units, first_worker_id)
+        # Results are a list of the workers' GraphDataAggregators that we then sum
+        graph_data_aggregator = sum(results, start=graph_data_aggregator)
+        # Workers run work units in any order, so put the data in the order
+        # that running the trials one after another would have
+        graph_data_aggregator.order_data_point_keys(self._get_data_point_keys())
+        return graph_data_aggregator
+
+    def _get_data_point_keys(self) -> Iterator[DataPointKey]:
+        """Yields every DataPointKey in the order of a single process run"""
+
+        for percent_adopt in self.percent_adoptions:
+            for scenario_config in self.scenario_configs:
+                for propagation_round in range(scenario_config.propagation_rounds):
+                    yield DataPointKey(
+                        propagation_round=propagation_round,
+                        percent_adopt=percent_adopt,
+                        scenario_config=scenario_config,
+                    )
+
+    def _get_empty_graph_data_aggregator(self) -> GraphDataAggregator:
+        """Returns the GraphDataAggregator that all the results are summed into"""
+
+        return self.GraphDataAggregatorCls(
+            graph_categories=self.graph_categories, running_stats=self.running_stats
+        )
+
+    def _get_work_units(self) -> list[WorkUnit]:
+        """Returns every (trial, percent adoption index) to run
+
+        Rather than splitting these up into one static chunk per CPU (where
+        one slow chunk leaves the other CPUs idle at the end), workers pull
+        work units one at a time, so they all finish at about the same time
+        """
+
+        return [
+            (trial, percent_adopt_index)
+            for trial in range(self.num_trials)
+            for percent_adopt_index in range(len(self.percent_adoptions))
+        ]
 
     ###########################
     # Multiprocessing Methods #
     ###########################
 
-    def _get_chunks(self, cpus: int) -> list[list[int]]:
-        """Returns chunks of trial inputs based on number of CPUs running
+    def _get_mp_results(
+        self, work_units: list[WorkUnit], first_worker_id: int
+    ) -> list[GraphDataAggregator]:
+        """Get results from multiprocessing"""
 
-        Not a generator since we need this for multiprocessing
+        # Parse the topology once, rather than once per worker
+        with self._get_shared_as_graph_info() as shared_as_graph_info:
+            # Set before the workers start so that they get the name
+            self._shared_as_graph_info_name = shared_as_graph_info.name
+            try:
+                completed = self._get_worker_results(work_units, first_worker_id)
+            finally:
+                self._shared_as_graph_info_name = None
+        return completed
 
-        We also don't multiprocess one by one because the start up cost of
-        each process is huge (since each process must generate it's own engine
-        ) so we must divy up the work beforehand
+    def _get_worker_results(
+        self, work_units: list[WorkUnit], first_worker_id: int
+    ) -> list[GraphDataAggregator]:
+        """Runs the work units in long lived workers with a progress bar
+
+        Each worker builds its engine once, then pulls work units from the
+        work queue until it gets None. Workers put a None on the results
+        queue for every completed work unit (for the progress bar), and
+        their GraphDataAggregator and Instrumentation (or traceback)
+        once they're done
         """
 
-        trials_list = list(range(self.num_trials))
-        return [trials_list[i::cpus] for i in range(cpus)]
+        work_queue: queues.Queue[WorkUnit | None] = Queue()
+        results_queue: queues.Queue[tuple[int, WorkerResult | str | None]] = Queue()
+        worker_ids = range(
+            first_worker_id, first_worker_id + min(self.parse_cpus, len(work_units))
+        )
+        for work_unit in work_units:
+            work_queue.put(work_unit)
+        for _ in worker_ids:
+            work_queue.put(None)
+
+        workers = {
+            worker_id: Process(
+                target=self._run_worker, args=(worker_id, work_queue, results_queue)
+            )
+            for worker_id in worker_ids
+        }
+        for worker in workers.values():
+            worker.start()
+
+        completed: dict[int, GraphDataAggregator] = dict()
+        desc = f"Simulating {self.output_dir.name}"
+        try:
+            with tqdm(total=len(work_units), desc=desc) as pbar:
+                while len(completed) < len(workers):
+                    try:
+                        worker_id, result = results_queue.get(timeout=1)
+                    except Empty:
+                        self._check_workers_alive(workers, completed)
+                        continue
+                    if result is None:
+                        pbar.update()
+                    elif isinstance(result, str):
+                        raise RuntimeError(f"Worker {worker_id} failed:\n{result}")
+                    else:
+                        completed[worker_id], instrumentation = result
+                        self.instrumentation += instrumentation
+            for worker in workers.values():
+                worker.join()
+        finally:
+            for worker in workers.values():
+                if worker.is_alive():
+                    worker.terminate()
+        return list(completed.values())
+
+    def _check_workers_alive(
+        self,
+        workers: dict[int, Process],
+        completed: dict[int, GraphDataAggregator],
+    ) -> None:
+        """Raises if a worker exited without sending its results
 
-    def _get_single_process_results(self) -> list[GraphDataAggregator]:
-        """Get all results when using single processing"""
+        Workers send their traceback if they raise, but not if they're killed
+        (for example, by running out of RAM), which would otherwise hang
+        """
+
+        for worker_id, worker in workers.items():
+            if worker_id not in completed and worker.exitcode not in (None, 0):
+                raise RuntimeError(
+                    f"Worker {worker_id} exited with code {worker.exitcode}"
+                )
 
-        return [self._run_chunk(i, x) for i, x in enumerate(self._get_chunks(1))]
+    def _run_worker(
+        self,
+        worker_id: int,
+        work_queue: "queues.Queue[WorkUnit | None]",
+        results_queue: "queues.Queue[tuple[int, WorkerResult | str | None]]",
+    ) -> None:
+        """Runs work units from the work queue, and puts the results on the queue"""
 
-    def _get_mp_results(self) -> list[GraphDataAggregator]:
-        """Get results from multiprocessing
+        # Only this worker's instrumentation is sent back to be summed
+        self.instrumentation = Instrumentation(
+            enabled=self.instrumentation.enabled,
+            count_hot_paths=self.instrumentation.count_hot_paths,
+        )
+        try:
+            graph_data_aggregator = self._run_work_units(
+                worker_id,
+                self._get_queued_work_units(worker_id, work_queue, results_queue),
+            )
+        # Send the traceback to the main process, since the worker can't raise there
+        except Exception:  # noqa: BLE001
+            results_queue.put((worker_id, traceback.format_exc()))
+        else:
+            results_queue.put(
+                (worker_id, (graph_data_aggregator, self.instrumentation))
+            )
 
-        Previously used starmap, but now we have tqdm
+    def _get_queued_work_units(
+        self,
+        worker_id: int,
+        work_queue: "queues.Queue[WorkUnit | None]",
+        results_queue: "queues.Queue[tuple[int, WorkerResult | str | None]]",
+    ) -> Iterator[WorkUnit]:
+        """Yields work units from the work queue until it gets None
+
+        Once the next work unit is requested, the last one is done,
+        so that's reported on the results queue for the progress bar
         """
 
-        # Pool is much faster than ProcessPoolExecutor
-        with Pool(self.parse_cpus) as p:
-            # return p.starmap(self._run_chunk, enumerate(self._get_chunks(parse_cpus)))
-            chunks = self._get_chunks(self.parse_cpus)
-            desc = f"Simulating {self.output_dir.name}"
-            total = sum(len(x) for x in chunks) * len(self.percent_adoptions)
-            with tqdm(total=total, desc=desc) as pbar:
-                tasks: list[ApplyResult[GraphDataAggregator]] = [
-                    p.apply_async(self._run_chunk, x) for x in enumerate(chunks)
-                ]
-                completed: list[GraphDataAggregator] = []
-                while tasks:
-                    completed, tasks = self._get_completed_and_tasks(completed, tasks)
-                    self._update_tqdm_progress_bar(pbar)
-                    time.sleep(0.5)
-        return completed
+        while (work_unit := work_queue.get()) is not None:
+            yield work_unit
+            results_queue.put((worker_id, None))
 
-    def _get_completed_and_tasks(self, completed, tasks):
-        """Moves completed tasks into completed"""
-        new_tasks = list()
-        for task in tasks:
-            if task.ready():
-                completed.append(task.get())
-            else:
-                new_tasks.append(task)
-        return completed, new_tasks
-
-    def _update_tqdm_progress_bar(self, pbar: tqdm) -> None:  # type: ignore
-        """Updates tqdm progress bar"""
-
-        total_completed = 0
-        for file_path in self._tqdm_tracking_dir.iterdir():
-            try:
-                total_completed += int(file_path.read_text())
-            # Can happen write when file is being written when it's empty
-            except ValueError:
-                pass
-        pbar.n = total_completed
-        pbar.refresh()
+    def _get_shared_as_graph_info(self) -> SharedASGraphInfo:
+        """Packs the AS graph info into shared memory for workers
+
+        The ranks and cone sizes are packed too, since run already cached them
+        """
+
+        constructor_kwargs = dict(self.as_graph_constructor_kwargs)
+        constructor_kwargs["tsv_path"] = None
+        as_graph_info, as_graph_attrs = self.ASGraphConstructorCls(
+            **constructor_kwargs
+        ).get_as_graph_info_and_attrs()
+        return SharedASGraphInfo.from_as_graph_info(as_graph_info, as_graph_attrs)
 
     ############################
     # Data Aggregation Methods #
     ############################
 
-    def _run_chunk(self, chunk_id: int, trials: list[int]) -> GraphDataAggregator:
-        """Runs a chunk of trial inputs"""
+    def _run_work_units(
+        self, worker_id: int, work_units: Iterable[WorkUnit]
+    ) -> GraphDataAggregator:
+        """Runs work units with a single engine and aggregates their data"""
 
-        # Must also seed randomness here since we don't want multiproc to be the same
-        self._seed_random(seed_suffix=str(chunk_id))
-
-        engine = self._get_engine_for_run_chunk()
+        engine = self._get_engine_for_worker()
 
         graph_data_aggregator = self.GraphDataAggregatorCls(
-            graph_categories=self.graph_categories
+            graph_categories=self.graph_categories,
+            running_stats=self.running_stats,
+            trial_records_path=self._get_trial_records_path(worker_id),
         )
 
+        completed_work_units: list[WorkUnit] = list()
+        last_checkpoint_time = time.monotonic()
+        with self.instrumentation.count_policy_calls():
+            for trial, percent_adopt_index in work_units:
+                with self.instrumentation.time_phase("work_unit"):
+                    self._run_work_unit(
+                        engine=engine,
+                        trial=trial,
+                        percent_adopt_index=percent_adopt_index,
+                        graph_data_aggregator=graph_data_aggregator,
+                    )
+                completed_work_units.append((trial, percent_adopt_index))
+
+                if (
+                    self.write_checkpoints
+                    and time.monotonic() - last_checkpoint_time
+                    >= self.checkpoint_interval
+                ):
+                    self._write_checkpoint(
+                        worker_id, completed_work_units, graph_data_aggregator
+                    )
+                    last_checkpoint_time = time.monotonic()
+
+        if self.write_checkpoints:
+            self._write_checkpoint(
+                worker_id, completed_work_units, graph_data_aggregator
+            )
+
+        return graph_data_aggregator
+
+    def _run_work_unit(
+        self,
+        *,
+        engine: BaseSimulationEngine,
+        trial: int,
+        percent_adopt_index: int,
+        graph_data_aggregator: GraphDataAggregator,
+    ) -> None:
+        """Runs every scenario config for a single trial and percent adoption
+
+        Each work unit seeds randomness on its own, so that the results don't
+        depend on which worker runs it, or in what order
+        """
+
+        percent_adopt = self.percent_adoptions[percent_adopt_index]
+        # Use the same attacker victim pairs across all percent adoptions
+        trial_attacker_asns, trial_victim_asns = self._get_trial_attacker_victim_asns(
+            engine, trial
+        )
+        self._seed_random(seed_suffix=f"{trial}_{percent_adopt_index}")
+
         reuse_attacker_asns = self._get_reuse_attacker_asns()
         reuse_victim_asns = self._get_reuse_victim_asns()
         reuse_adopting_asns = self._get_reuse_adopting_asns()
 
-        for trial_index, trial in self._get_run_chunk_iter(trials):
-            # Use the same attacker victim pairs across all percent adoptions
-            trial_attacker_asns = None
-            trial_victim_asns = None
-            for percent_adopt_index, percent_adopt in enumerate(self.percent_adoptions):
-                # Use the same adopting asns across all scenarios configs
-                adopting_asns = None
-                for scenario_config in self.scenario_configs:
-                    # Create the scenario for this trial
-                    assert scenario_config.ScenarioCls, "ScenarioCls is None"
-                    scenario = scenario_config.ScenarioCls(
-                        scenario_config=scenario_config,
-                        percent_adoption=percent_adopt,
-                        engine=engine,
-                        attacker_asns=trial_attacker_asns,
-                        victim_asns=trial_victim_asns,
-                        adopting_asns=adopting_asns,
-                    )
+        # Use the same adopting asns across all scenarios configs
+        adopting_asns = None
+        for scenario_config in self.scenario_configs:
+            # Create the scenario for this trial
+            assert scenario_config.ScenarioCls, "ScenarioCls is None"
+            scenario = scenario_config.ScenarioCls(
+                scenario_config=scenario_config,
+                percent_adoption=percent_adopt,
+                engine=engine,
+                attacker_asns=trial_attacker_asns,
+                victim_asns=trial_victim_asns,
+                adopting_asns=adopting_asns,
+            )
 
-                    # Change AS Classes, seed announcements before propagation
-                    scenario.setup_engine(engine)
-                    # For each round of propagation run the engine
-                    for propagation_round in range(scenario_config.propagation_rounds):
-                        self._single_engine_run(
-                            engine=engine,
-                            percent_adopt=percent_adopt,
-                            trial=trial,
-                            scenario=scenario,
-                            propagation_round=propagation_round,
-                            graph_data_aggregator=graph_data_aggregator,
-                        )
-
-                    if reuse_attacker_asns:
-                        trial_attacker_asns = scenario.attacker_asns
-                    if reuse_victim_asns:
-                        trial_victim_asns = scenario.victim_asns
-                    if reuse_adopting_asns:
-                        adopting_asns = scenario.adopting_asns
-                # Used to track progress with tqdm
-                total_completed = (
-                    trial_index * len(self.percent_adoptions) + percent_adopt_index + 1
+            # Change AS Classes, seed announcements before propagation
+            scenario.setup_engine(engine)
+            # For each round of propagation run the engine
+            for propagation_round in range(scenario_config.propagation_rounds):
+                self._single_engine_run(
+                    engine=engine,
+                    percent_adopt=percent_adopt,
+                    trial=trial,
+                    scenario=scenario,
+                    propagation_round=propagation_round,
+                    graph_data_aggregator=graph_data_aggregator,
                 )
-                self._write_tqdm_progress(chunk_id, total_completed)
+            self._count_verdict_caches(engine)
+
+            if reuse_attacker_asns:
+                trial_attacker_asns = scenario.attacker_asns
+            if reuse_victim_asns:
+                trial_victim_asns = scenario.victim_asns
+            if reuse_adopting_asns:
+                adopting_asns = scenario.adopting_asns
+
+    def _count_verdict_caches(self, engine: BaseSimulationEngine) -> None:
+        """Counts the verdict cache hits and misses of the scenario"""
+
+        if not self.instrumentation.enabled:
+            return
+        adoption_index = getattr(engine.as_graph, "adoption_index", None)
+        if adoption_index is None:
+            return
+        for check, verdict_cache in adoption_index.verdict_caches.items():
+            name = getattr(check, "__name__", str(check))
+            self.instrumentation.count(f"verdict_cache_{name}_hits", verdict_cache.hits)
+            self.instrumentation.count(
+                f"verdict_cache_{name}_misses", verdict_cache.misses
+            )
 
-        self._write_tqdm_progress(chunk_id, len(trials) * len(self.percent_adoptions))
+    def _get_trial_attacker_victim_asns(
+        self, engine: BaseSimulationEngine, trial: int
+    ) -> tuple[frozenset[int] | None, frozenset[int] | None]:
+        """Returns the attackers and victims to reuse for every work unit of a trial
 
-        return graph_data_aggregator
+        They're drawn for the first scenario config at the first percent
+        adoption, from a seed of their own for the trial, so every work unit
+        of the trial gets the same ones without creating a scenario
+        """
+
+        reuse_attacker_asns = self._get_reuse_attacker_asns()
+        reuse_victim_asns = self._get_reuse_victim_asns()
+        if not (reuse_attacker_asns or reuse_victim_asns):
+            return None, None
+
+        self._seed_random(seed_suffix=f"{trial}_attackers_victims")
+        scenario_config = self.scenario_configs[0]
+        assert scenario_config.ScenarioCls, "ScenarioCls is None"
+        attacker_asns, victim_asns = (
+            scenario_config.ScenarioCls.get_attacker_and_victim_asns(
+                scenario_config=scenario_config,
+                percent_adoption=self.percent_adoptions[0],
+                engine=engine,
+            )
+        )
+        return (
+            attacker_asns if reuse_attacker_asns else None,
+            victim_asns if reuse_victim_asns else None,
+        )
 
     def _get_reuse_attacker_asns(self) -> bool:
         num_attackers_set = {x.num_attackers for x in self.scenario_configs}
@@ -449,43 +717,37 @@ class Simulation:
         }
         return len(adoption_categories_set) == 1
 
-    def _get_engine_for_run_chunk(self) -> BaseSimulationEngine:
-        """Returns SimulationEngine for the _run_chunk method
+    def _get_engine_for_worker(self) -> BaseSimulationEngine:
+        """Returns SimulationEngine for a worker
 
         engine isn't picklable or dillable, as it has weakrefs, which
         will deserialize to dead refs
+
+        When multiprocessing, the AS graph info, ranks, and cones are read from
+        shared memory rather than re-parsing the AS graph file and recomputing
+        them in every worker. Each worker still builds its own AS objects,
+        since the engine's policies (and their RIBs) hang off of them
         """
         constructor_kwargs = dict(self.as_graph_constructor_kwargs)
         constructor_kwargs["tsv_path"] = None
-        as_graph: ASGraph = self.ASGraphConstructorCls(**constructor_kwargs).run()
-        engine = self.SimulationEngineCls(
-            as_graph,
-            cached_as_graph_tsv_path=self.as_graph_constructor_kwargs.get("tsv_path"),
-        )
-        return engine
-
-    def _get_run_chunk_iter(self, trials: list[int]) -> Iterable[tuple[int, int]]:
-        """Returns iterator for trials with or without progress bar
-
-        If there's only 1 cpu, run the progress bar here, else we run it elsewhere
-        """
-
-        if self.parse_cpus == 1:
-            return tqdm(
-                enumerate(trials),
-                total=len(trials),
-                desc=f"Simulating {self.output_dir.name}",
+        as_graph_info: ColumnarASGraphInfo | None = None
+        as_graph_attrs: ASGraphAttrs | None = None
+        if self._shared_as_graph_info_name is not None:
+            with SharedASGraphInfo(self._shared_as_graph_info_name) as shared_info:
+                as_graph_info, as_graph_attrs = shared_info.read()
+        with self.instrumentation.time_phase("graph_build"):
+            as_graph: ASGraph = self.ASGraphConstructorCls(**constructor_kwargs).run(
+                as_graph_info=as_graph_info, as_graph_attrs=as_graph_attrs
             )
-        else:
-            return enumerate(trials)
-
-    def _write_tqdm_progress(self, chunk_id: int, completed: int) -> None:
-        """Writes total number of percent adoption trial pairs to file"""
-
-        # If self.parse_cpus == 1, then no multiprocessing is used
-        if self.parse_cpus > 1:
-            with (self._tqdm_tracking_dir / f"{chunk_id}.txt").open("w") as f:
-                f.write(str(completed))
+            engine = self.SimulationEngineCls(
+                as_graph,
+                cached_as_graph_tsv_path=self.as_graph_constructor_kwargs.get(
+                    "tsv_path"
+                ),
+            )
+        if isinstance(engine, SimulationEngine):
+            engine.instrumentation = self.instrumentation
+        return engine
 
     def _single_engine_run(
         self,
@@ -540,21 +802,23 @@ class Simulation:
         # The reason we aggregate info right now, instead of saving
         # the engine and doing it later, is because doing it all
         # in RAM is MUCH faster, and speed is important
-        outcomes = self.ASGraphAnalyzerCls(
-            engine=engine,
-            scenario=scenario,
-            data_plane_tracking=self.data_plane_tracking,
-            control_plane_tracking=self.control_plane_tracking,
-        ).analyze()
-
-        graph_data_aggregator.aggregate_and_store_trial_data(
-            engine=engine,
-            percent_adopt=percent_adopt,
-            trial=trial,
-            scenario=scenario,
-            propagation_round=propagation_round,
-            outcomes=outcomes,
-        )
+        with self.instrumentation.time_phase("analysis"):
+            outcomes = self.ASGraphAnalyzerCls(
+                engine=engine,
+                scenario=scenario,
+                data_plane_tracking=self.data_plane_tracking,
+                control_plane_tracking=self.control_plane_tracking,
+            ).analyze()
+
+        with self.instrumentation.time_phase("aggregation"):
+            graph_data_aggregator.aggregate_and_store_trial_data(
+                engine=engine,
+                percent_adopt=percent_adopt,
+                trial=trial,
+                scenario=scenario,
+                propagation_round=propagation_round,
+                outcomes=outcomes,
+            )
         return outcomes
 
     ######################
@@ -569,6 +833,124 @@ class Simulation:
     def pickle_path(self) -> Path:
         return self.output_dir / "data.pickle"
 
+    @property
+    def instrumentation_path(self) -> Path:
+        return self.output_dir / "instrumentation.json"
+
+    @property
+    def trial_records_dir(self) -> Path:
+        return self.output_dir / "trial_records"
+
+    def _get_trial_records_path(self, worker_id: int) -> Path | None:
+        """Returns the trial records file for a worker, if writing them"""
+
+        if not self.write_trial_records:
+            return None
+
+        self.trial_records_dir.mkdir(parents=True, exist_ok=True)
+        return self.trial_records_dir / f"worker_{worker_id}.pickle"
+
+    @property
+    def checkpoints_dir(self) -> Path:
+        return self.output_dir / "checkpoints"
+
+    def _get_checkpoint_path(self, worker_id: int) -> Path:
+        return self.checkpoints_dir / f"worker_{worker_id}.pickle"
+
+    def _get_resumed_data(
+        self,
+    ) -> tuple[GraphDataAggregator, list[WorkUnit], int]:
+        """Returns the data from previous runs, work units left, and next worker id
+
+        When not resuming, this clears the checkpoints and trial records of
+        previous runs. When resuming, the data of every checkpoint is merged
+        and the trial records are truncated to what the checkpoints contain.
+        The checkpoints are left in place (and new workers get new ids),
+        so that if this run also crashes, it can be resumed again
+        """
+
+        graph_data_aggregator = self._get_empty_graph_data_aggregator()
+        if not self.resume:
+            for dir_ in (self.checkpoints_dir, self.trial_records_dir):
+                shutil.rmtree(dir_, ignore_errors=True)
+            return graph_data_aggregator, self._get_work_units(), 0
+
+        completed_work_units: set[WorkUnit] = set()
+        trial_records_sizes: dict[str, int] = dict()
+        worker_ids = [-1]
+        for checkpoint_path in sorted(self.checkpoints_dir.glob("worker_*.pickle")):
+            checkpoint = WorkerCheckpoint.read(checkpoint_path)
+            self._validate_checkpoint(checkpoint, checkpoint_path)
+            # Without a python_hash_seed, continue with the previous random seed
+            self._random_seed = checkpoint.random_seed
+            completed_work_units.update(checkpoint.work_units)
+            graph_data_aggregator += checkpoint.graph_data_aggregator
+            trial_records_sizes[checkpoint_path.name] = checkpoint.trial_records_size
+            worker_ids.append(int(checkpoint_path.stem.removeprefix("worker_")))
+
+        # Drop the records of work units that will be run again
+        if self.trial_records_dir.exists():
+            for trial_records_path in self.trial_records_dir.iterdir():
+                with trial_records_path.open("r+b") as f:
+                    f.truncate(trial_records_sizes.get(trial_records_path.name, 0))
+
+        work_units = [
+            x for x in self._get_work_units() if x not in completed_work_units
+        ]
+        return graph_data_aggregator, work_units, max(worker_ids) + 1
+
+    def _validate_checkpoint(
+        self, checkpoint: WorkerCheckpoint, checkpoint_path: Path
+    ) -> None:
+        """Ensures that a checkpoint is from a simulation with the same settings"""
+
+        if (
+            checkpoint.num_trials,
+            checkpoint.percent_adoptions,
+            checkpoint.scenario_labels,
+        ) != (
+            self.num_trials,
+            self.percent_adoptions,
+            self._get_scenario_labels(),
+        ) or (
+            self.python_hash_seed is not None
+            and checkpoint.random_seed != self._random_seed
+        ):
+            raise ValueError(
+                f"{checkpoint_path} is from a simulation with different trials or "
+                "settings. To resume, use the same num_trials, percent_adoptions, "
+                "scenario_configs, and python_hash_seed, "
+                "or delete the checkpoints to start over"
+            )
+
+    def _write_checkpoint(
+        self,
+        worker_id: int,
+        work_units: list[WorkUnit],
+        graph_data_aggregator: GraphDataAggregator,
+    ) -> None:
+        """Saves the worker's progress after the work units it completed"""
+
+        trial_records_path = graph_data_aggregator.trial_records_path
+        if trial_records_path is not None and trial_records_path.exists():
+            trial_records_size = trial_records_path.stat().st_size
+        else:
+            trial_records_size = 0
+
+        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        WorkerCheckpoint(
+            num_trials=self.num_trials,
+            percent_adoptions=self.percent_adoptions,
+            scenario_labels=self._get_scenario_labels(),
+            random_seed=self._random_seed,
+            work_units=tuple(work_units),
+            graph_data_aggregator=graph_data_aggregator,
+            trial_records_size=trial_records_size,
+        ).write(self._get_checkpoint_path(worker_id))
+
+    def _get_scenario_labels(self) -> tuple[str, ...]:
+        return tuple(x.scenario_label for x in self.scenario_configs)
+
     #######################
     # Graph Writing Funcs #
     #######################
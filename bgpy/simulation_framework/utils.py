@@ -2,8 +2,6 @@ import re
 from pathlib import Path
 from typing import Iterable
 
-from requests_cache import CachedSession
-
 from bgpy.shared.constants import SINGLE_DAY_CACHE_DIR
 from bgpy.shared.enums import ASGroups, InAdoptingASNs, Outcomes, Plane
 from bgpy.simulation_framework.graph_data_aggregator.graph_category import GraphCategory
@@ -34,6 +32,9 @@ def get_country_asns(
     country codes can be found here: https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2.
     """
 
+    # Slow to import, and only needed here
+    from requests_cache import CachedSession
+
     with CachedSession(str(requests_cache_path)) as session:
         response = session.get(
             "https://stat.ripe.net/data/country-asns/"
@@ -0,0 +1,54 @@
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+
+from bgpy.shared.enums import SpecialPercentAdoptions
+
+from .graph_data_aggregator import GraphDataAggregator
+
+# (trial, index of the percent adoption)
+WorkUnit = tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerCheckpoint:
+    """Progress of a single simulation worker, so that it can be resumed
+
+    Every work unit is seeded on its own, so the work units that weren't
+    completed can be run by any worker and the results are identical
+    """
+
+    # These identify the simulation, so that a checkpoint is never resumed
+    # by a simulation with different trials or settings
+    num_trials: int
+    percent_adoptions: tuple[float | SpecialPercentAdoptions, ...]
+    scenario_labels: tuple[str, ...]
+    random_seed: str
+    # Work units that the worker completed
+    work_units: tuple[WorkUnit, ...]
+    # Aggregated data of the completed work units
+    graph_data_aggregator: GraphDataAggregator
+    # Size of the worker's trial records file after the last completed work unit
+    trial_records_size: int
+
+    @classmethod
+    def read(cls, path: Path) -> "WorkerCheckpoint":
+        """Returns the checkpoint stored at path"""
+
+        with path.open("rb") as f:
+            checkpoint = pickle.load(f)  # noqa: S301
+        assert isinstance(checkpoint, cls), f"{path} is not a {cls.__name__}"
+        return checkpoint
+
+    def write(self, path: Path) -> None:
+        """Writes the checkpoint to path
+
+        Written to a temporary file first and then moved into place,
+        so that a crash mid write never corrupts the previous checkpoint
+        """
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(self, f)
+        tmp_path.replace(path)
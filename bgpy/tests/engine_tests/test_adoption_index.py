@@ -0,0 +1,74 @@
+import pytest
+
+from bgpy.as_graphs import ASGraph
+from bgpy.shared.enums import ASNs
+from bgpy.simulation_engine import ASPA, ASRA, BGP, ROV, Policy, SimulationEngine
+from bgpy.simulation_framework import ScenarioConfig, SubprefixHijack
+
+from .engine_test_configs.examples.as_graph_info_000 import as_graph_info_000
+
+
+@pytest.mark.engine
+def test_adoption_index():
+    """Tests that the adoption index matches isinstance checks on the policies"""
+
+    engine = SimulationEngine(ASGraph(as_graph_info=as_graph_info_000))
+    for adopting_asns in ({1, 2, 9}, {2, 8, 10}):
+        scenario_config = ScenarioConfig(
+            ScenarioCls=SubprefixHijack,
+            AdoptPolicyCls=ASRA,
+            override_attacker_asns=frozenset({ASNs.ATTACKER.value}),
+            override_victim_asns=frozenset({ASNs.VICTIM.value}),
+            override_adopting_asns=frozenset(adopting_asns),
+        )
+        scenario = SubprefixHijack(scenario_config=scenario_config, engine=engine)
+        scenario.setup_engine(engine)
+
+        adoption_index = engine.as_graph.adoption_index
+        # Subclasses of the policy class count as adopting, like with isinstance
+        assert adoption_index.get_asns(ASRA) == adoption_index.get_asns(ASPA)
+        for PolicyCls in (Policy, BGP, ROV, ASPA, ASRA):
+            assert adoption_index.get_asns(PolicyCls) == {
+                x.asn for x in engine.as_graph if isinstance(x.policy, PolicyCls)
+            }
+
+
+@pytest.mark.engine
+def test_aspa_ramp_lengths():
+    """Tests the memoized ASPA ramp lengths against checking every hop"""
+
+    engine = SimulationEngine(ASGraph(as_graph_info=as_graph_info_000))
+    scenario_config = ScenarioConfig(
+        ScenarioCls=SubprefixHijack,
+        AdoptPolicyCls=ASPA,
+        override_attacker_asns=frozenset({ASNs.ATTACKER.value}),
+        override_victim_asns=frozenset({ASNs.VICTIM.value}),
+        override_adopting_asns=frozenset({1, 2, 4, 8, 9, 10}),
+    )
+    scenario = SubprefixHijack(scenario_config=scenario_config, engine=engine)
+    scenario.setup_engine(engine)
+    engine.run(propagation_round=0, scenario=scenario)
+
+    as_paths = {
+        ann.as_path
+        for as_obj in engine.as_graph
+        for ann in as_obj.policy.local_rib.values()
+    }
+    policy = engine.as_graph.as_dict[1].policy
+    assert isinstance(policy, ASPA)
+    for as_path in as_paths:
+        reversed_path = as_path[::-1]
+        max_up_ramp = max_down_ramp = len(as_path)
+        for i in range(len(reversed_path) - 1):
+            if not policy._provider_check(reversed_path[i], reversed_path[i + 1]):
+                max_up_ramp = i + 1
+                break
+        for i in range(len(reversed_path) - 1, 0, -1):
+            if not policy._provider_check(reversed_path[i], reversed_path[i - 1]):
+                max_down_ramp = len(reversed_path) - i
+                break
+        assert policy._get_ramp_lengths(as_path) == (max_up_ramp, max_down_ramp)
+
+    verdict_cache = engine.as_graph.adoption_index.get_verdict_cache(ASPA)
+    assert verdict_cache.hits > 0
+    assert 0 < verdict_cache.hit_rate <= 1
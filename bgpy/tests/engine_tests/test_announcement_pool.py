@@ -0,0 +1,80 @@
+import pytest
+
+from bgpy.as_graphs import ASGraph
+from bgpy.shared.enums import ASNs, Prefixes, Relationships
+from bgpy.simulation_engine import ASPA, Announcement, AnnouncementPool
+
+from .engine_test_configs.examples.as_graph_info_000 import as_graph_info_000
+
+
+@pytest.mark.engine
+class TestAnnouncementPool:
+    """Tests that pooled announcements match copied announcements"""
+
+    def _get_pool_and_anns(
+        self,
+    ) -> tuple[AnnouncementPool, list[int], list[Announcement]]:
+        """Propagates victim -> 2 -> 8 -> 11 both with the pool and by copying"""
+
+        seed_ann = Announcement(
+            prefix=Prefixes.PREFIX.value,
+            as_path=(ASNs.VICTIM.value,),
+            timestamp=0,
+        )
+        pool = AnnouncementPool()
+        indexes = [pool.add_root(seed_ann)]
+        anns = [seed_ann]
+        for asn, rel in (
+            (2, Relationships.CUSTOMERS),
+            (8, Relationships.CUSTOMERS),
+            (11, Relationships.CUSTOMERS),
+        ):
+            prev_ann = anns[-1]
+            indexes.append(
+                pool.append(indexes[-1], asn, prev_ann.as_path[0], rel.value)
+            )
+            anns.append(
+                prev_ann.copy(
+                    {
+                        "as_path": (asn, *prev_ann.as_path),
+                        "next_hop_asn": prev_ann.as_path[0],
+                        "recv_relationship": rel,
+                        "seed_asn": None,
+                    }
+                )
+            )
+        return pool, indexes, anns
+
+    def test_views(self):
+        """Tests the lazily materialized attributes"""
+
+        pool, indexes, anns = self._get_pool_and_anns()
+        for index, ann in zip(indexes, anns, strict=True):
+            view = pool.get_view(index)
+            assert view.as_path == ann.as_path
+            assert view.next_hop_asn == ann.next_hop_asn
+            assert view.origin == ann.origin
+            assert view.seed_asn == ann.seed_asn
+            assert view.recv_relationship == ann.recv_relationship
+            assert view.prefix == ann.prefix
+            assert view.materialize() == ann
+            assert view.copy({"timestamp": 1}) == ann.copy({"timestamp": 1})
+            assert pool.path_lens[index] == len(ann.as_path)
+            assert pool.path_asns(index) == set(ann.as_path)
+            for position, asn in enumerate(ann.as_path):
+                assert pool.asn_at(index, position) == asn
+
+    def test_aspa_up_ramp(self):
+        """Tests that ASPA can read pooled announcements"""
+
+        as_graph = ASGraph(as_graph_info=as_graph_info_000, BasePolicyCls=ASPA)
+        policy = as_graph.as_dict[12].policy
+        pool, indexes, anns = self._get_pool_and_anns()
+        for index, ann in zip(indexes, anns, strict=True):
+            view = pool.get_view(index)
+            assert policy._get_max_up_ramp_length(
+                view  # type: ignore
+            ) == policy._get_max_up_ramp_length(ann)
+            assert policy._get_max_down_ramp_length(
+                view  # type: ignore
+            ) == policy._get_max_down_ramp_length(ann)
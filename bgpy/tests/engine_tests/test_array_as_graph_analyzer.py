@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from bgpy.simulation_framework import (
+    ArrayASGraphAnalyzer,
+    ASGraphAnalyzer,
+    InterceptionArrayASGraphAnalyzer,
+    InterceptionASGraphAnalyzer,
+)
+from bgpy.utils import EngineRunner
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+
+
+@pytest.mark.engine
+class TestArrayASGraphAnalyzer:
+    """Compares the array analyzers against the recursive analyzers"""
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_array_as_graph_analyzer(self, conf: EngineTestConfig, tmp_path: Path):
+        """Runs the engine test config and compares the outcomes"""
+
+        engine_runner = EngineRunner(conf=conf, base_dir=tmp_path)
+        engine, scenario = engine_runner._get_engine_and_scenario()
+        for propagation_round in range(conf.scenario_config.propagation_rounds):
+            engine.run(propagation_round=propagation_round, scenario=scenario)
+
+        for AnalyzerCls, ArrayAnalyzerCls in (
+            (ASGraphAnalyzer, ArrayASGraphAnalyzer),
+            (InterceptionASGraphAnalyzer, InterceptionArrayASGraphAnalyzer),
+        ):
+            kwargs = {
+                "engine": engine,
+                "scenario": scenario,
+                "control_plane_tracking": True,
+            }
+            array_outcomes = ArrayAnalyzerCls(**kwargs).analyze()
+            try:
+                outcomes = AnalyzerCls(**kwargs).analyze()
+            # The InterceptionASGraphAnalyzer can't trace back disconnected ASes
+            except NotImplementedError:
+                assert AnalyzerCls is InterceptionASGraphAnalyzer
+                continue
+            assert array_outcomes == outcomes
@@ -0,0 +1,46 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from bgpy.simulation_engine import BaseSimulationEngine, CSRSimulationEngine
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig, EngineTester
+
+
+class CSREngineTester(EngineTester):
+    """Runs an engine test with the CSRSimulationEngine"""
+
+    def _get_engine(self) -> BaseSimulationEngine:
+        """Creates the CSR engine from the configs AS graph"""
+
+        return CSRSimulationEngine(super()._get_engine().as_graph)
+
+
+@pytest.mark.engine
+class TestCSREngine:
+    """Runs the engine system tests against the CSRSimulationEngine
+
+    The ground truth is the same ground truth as the SimulationEngine's,
+    but the guesses are written to a tmp dir so they don't clobber
+    the SimulationEngine's guesses
+    """
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_csr_engine(self, conf: EngineTestConfig, tmp_path: Path):
+        """Copies the ground truth and compares the CSR engine against it"""
+
+        gt_dir = self.base_dir / conf.name
+        storage_dir = tmp_path / conf.name
+        storage_dir.mkdir(parents=True)
+        for gt_path in gt_dir.glob("*_gt.*"):
+            shutil.copy(gt_path, storage_dir / gt_path.name)
+
+        CSREngineTester(base_dir=tmp_path, conf=conf).test_engine()
+
+    @property
+    def base_dir(self) -> Path:
+        """Returns the SimulationEngine's test output dir"""
+
+        return Path(__file__).parent / "engine_test_outputs"
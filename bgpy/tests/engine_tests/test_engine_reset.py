@@ -0,0 +1,58 @@
+import pytest
+
+from bgpy.as_graphs import ASGraph
+from bgpy.shared.enums import ASNs
+from bgpy.simulation_engine import BGP, ROV, BGPFull, ROVFull, SimulationEngine
+from bgpy.simulation_framework import ScenarioConfig, SubprefixHijack
+
+from .engine_test_configs.examples.as_graph_info_000 import as_graph_info_000
+
+
+@pytest.mark.engine
+class TestEngineReset:
+    """Tests that reusing policies between scenarios matches new policies"""
+
+    def _run(self, engine: SimulationEngine, scenario_config: ScenarioConfig) -> None:
+        scenario = SubprefixHijack(scenario_config=scenario_config, engine=engine)
+        scenario.setup_engine(engine)
+        engine.run(propagation_round=0, scenario=scenario)
+
+    def _get_scenario_config(self, BasePolicyCls, AdoptPolicyCls, adopting_asns):
+        return ScenarioConfig(
+            ScenarioCls=SubprefixHijack,
+            BasePolicyCls=BasePolicyCls,
+            AdoptPolicyCls=AdoptPolicyCls,
+            override_attacker_asns=frozenset({ASNs.ATTACKER.value}),
+            override_victim_asns=frozenset({ASNs.VICTIM.value}),
+            override_adopting_asns=frozenset(adopting_asns),
+        )
+
+    @pytest.mark.parametrize(
+        ("BasePolicyCls", "AdoptPolicyCls"), [(BGP, ROV), (BGPFull, ROVFull)]
+    )
+    def test_reset(self, BasePolicyCls, AdoptPolicyCls):
+        """Runs two scenarios on one engine and compares to a new engine"""
+
+        first_config = self._get_scenario_config(
+            BasePolicyCls, AdoptPolicyCls, {1, 2, 9}
+        )
+        second_config = self._get_scenario_config(
+            BasePolicyCls, AdoptPolicyCls, {2, 8, 10}
+        )
+
+        reused_engine = SimulationEngine(
+            ASGraph(as_graph_info=as_graph_info_000, BasePolicyCls=BasePolicyCls)
+        )
+        reused_policies = {x.asn: x.policy for x in reused_engine.as_graph}
+        self._run(reused_engine, first_config)
+        self._run(reused_engine, second_config)
+
+        new_engine = SimulationEngine(
+            ASGraph(as_graph_info=as_graph_info_000, BasePolicyCls=BasePolicyCls)
+        )
+        self._run(new_engine, second_config)
+
+        assert reused_engine == new_engine
+        # ASes that never adopted keep the same policy object
+        for asn in (4, 5, 11, 12):
+            assert reused_engine.as_graph.as_dict[asn].policy is reused_policies[asn]
@@ -0,0 +1,101 @@
+import pytest
+
+from bgpy.as_graphs import AS, ASGraph
+from bgpy.shared.enums import ASNs, Relationships
+from bgpy.simulation_engine import (
+    BGP,
+    ROV,
+    BGPFull,
+    ROVFull,
+    ROVPPV1Lite,
+    SimulationEngine,
+)
+from bgpy.simulation_framework import ScenarioConfig, SubprefixHijack
+
+from .engine_test_configs import engine_test_configs
+from .engine_test_configs.examples.as_graph_info_000 import as_graph_info_000
+from .utils import EngineTestConfig
+
+
+class _FullSweepEngine(SimulationEngine):
+    """Visits every AS in every phase and round, like before the frontier"""
+
+    def _get_active_ases(self) -> dict[int, AS]:
+        # Every AS resends its whole local RIB in later rounds as well
+        self._local_rib_snapshots = None
+        return {x.asn: x for x in self.as_graph.ases}
+
+
+@pytest.mark.engine
+class TestFrontier:
+    """Tests that only visiting the frontier matches visiting every AS"""
+
+    def _run(self, EngineCls, BasePolicyCls, AdoptPolicyCls) -> SimulationEngine:
+        engine = EngineCls(
+            ASGraph(as_graph_info=as_graph_info_000, BasePolicyCls=BasePolicyCls)
+        )
+        scenario_config = ScenarioConfig(
+            ScenarioCls=SubprefixHijack,
+            BasePolicyCls=BasePolicyCls,
+            AdoptPolicyCls=AdoptPolicyCls,
+            override_attacker_asns=frozenset({ASNs.ATTACKER.value}),
+            override_victim_asns=frozenset({ASNs.VICTIM.value}),
+            override_adopting_asns=frozenset({1, 2, 9}),
+        )
+        scenario = SubprefixHijack(scenario_config=scenario_config, engine=engine)
+        scenario.setup_engine(engine)
+        engine.run(propagation_round=0, scenario=scenario)
+        return engine
+
+    @pytest.mark.parametrize(
+        ("BasePolicyCls", "AdoptPolicyCls"),
+        [(BGP, ROV), (BGPFull, ROVFull), (BGP, ROVPPV1Lite)],
+    )
+    def test_frontier(self, BasePolicyCls, AdoptPolicyCls):
+        """Compares the local RIBs and checks the frontier counters"""
+
+        engine = self._run(SimulationEngine, BasePolicyCls, AdoptPolicyCls)
+        full_sweep_engine = self._run(_FullSweepEngine, BasePolicyCls, AdoptPolicyCls)
+        assert engine == full_sweep_engine
+
+        num_ases = len(engine.as_graph.ases)
+        for counter in engine.frontier_counters.values():
+            assert counter.total == num_ases
+            assert counter.visited <= num_ases
+        # Only the seeded ASes and their provider cones propagate up
+        assert engine.frontier_counters[Relationships.PROVIDERS].visited < num_ases
+        for counter in full_sweep_engine.frontier_counters.values():
+            assert counter.visited == num_ases
+
+    @pytest.mark.parametrize(
+        "conf",
+        [x for x in engine_test_configs if x.scenario_config.propagation_rounds > 1],
+        ids=lambda x: x.name,
+    )
+    def test_multi_round(self, conf: EngineTestConfig):
+        """Compares only propagating changed RIBs in later rounds to full rounds"""
+
+        engines = list()
+        for EngineCls in (SimulationEngine, _FullSweepEngine):
+            engine = EngineCls(
+                conf.ASGraphCls(
+                    as_graph_info=conf.as_graph_info,
+                    BasePolicyCls=conf.scenario_config.BasePolicyCls,
+                    store_provider_cone_size=conf.requires_provider_cones,
+                    store_provider_cone_asns=conf.requires_provider_cones,
+                )
+            )
+            scenario = conf.scenario_config.ScenarioCls(
+                scenario_config=conf.scenario_config, engine=engine
+            )
+            scenario.setup_engine(engine)
+            for propagation_round in range(conf.scenario_config.propagation_rounds):
+                engine.run(propagation_round=propagation_round, scenario=scenario)
+                scenario.post_propagation_hook(
+                    engine=engine,
+                    propagation_round=propagation_round,
+                    trial=0,
+                    percent_adopt=0,
+                )
+            engines.append(engine)
+        assert engines[0] == engines[1]
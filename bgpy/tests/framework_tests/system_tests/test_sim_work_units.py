@@ -0,0 +1,130 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from bgpy.simulation_engine import BGP, ROV
+from bgpy.simulation_engine.instrumentation import POLICY_EVENTS
+from bgpy.simulation_framework import (
+    GraphDataAggregator,
+    ScenarioConfig,
+    Simulation,
+    SubprefixHijack,
+)
+
+
+class CrashingSimulation(Simulation):
+    """Simulation that crashes partway through its trials"""
+
+    def _single_engine_run(self, *, trial: int, **kwargs) -> None:
+        if trial == 4:
+            raise RuntimeError("Crashed")
+        super()._single_engine_run(trial=trial, **kwargs)
+
+
+@pytest.fixture
+def sim_kwargs(monkeypatch) -> dict:
+    """Kwargs for a short, deterministic simulation"""
+
+    monkeypatch.setenv("PYTHONHASHSEED", "0")
+    return {
+        "percent_adoptions": (0.1, 0.5),
+        "scenario_configs": (
+            ScenarioConfig(
+                ScenarioCls=SubprefixHijack, AdoptPolicyCls=ROV, BasePolicyCls=BGP
+            ),
+        ),
+        "num_trials": 6,
+        "parse_cpus": 1,
+        "python_hash_seed": 0,
+        "write_trial_records": True,
+        "write_checkpoints": True,
+        "checkpoint_interval": 0,
+    }
+
+
+def _read_trial_records(sim: Simulation) -> list:
+    """Returns the trial records of the sim, sorted since workers interleave"""
+
+    trial_records = GraphDataAggregator.read_trial_records(
+        sim.trial_records_dir.iterdir()
+    )
+    return sorted(trial_records, key=lambda x: (x[0], repr(x[1])))
+
+
+@pytest.mark.slow
+@pytest.mark.framework
+def test_sim_parse_cpus(tmp_path: Path, sim_kwargs: dict):
+    """Tests that the results don't depend on how work units are scheduled"""
+
+    single_process_sim = Simulation(output_dir=tmp_path / "single", **sim_kwargs)
+    single_process_sim.run(GraphFactoryCls=None)
+    sim_kwargs["parse_cpus"] = 3
+    mp_sim = Simulation(output_dir=tmp_path / "mp", **sim_kwargs)
+    mp_sim.run(GraphFactoryCls=None)
+
+    assert mp_sim.csv_path.read_text() == single_process_sim.csv_path.read_text()
+    assert _read_trial_records(mp_sim) == _read_trial_records(single_process_sim)
+
+
+@pytest.mark.slow
+@pytest.mark.framework
+@pytest.mark.parametrize(("crashed_parse_cpus", "resumed_parse_cpus"), [(1, 1), (3, 2)])
+def test_sim_resume(
+    tmp_path: Path, sim_kwargs: dict, crashed_parse_cpus: int, resumed_parse_cpus: int
+):
+    """Tests that a resumed simulation has the same results as a full run
+
+    Checkpoints hold completed work units, so resuming doesn't need the
+    same parse_cpus as the run that crashed
+    """
+
+    full_sim = Simulation(output_dir=tmp_path / "full", **sim_kwargs)
+    full_sim.run(GraphFactoryCls=None)
+
+    output_dir = tmp_path / "resumed"
+    sim_kwargs["parse_cpus"] = crashed_parse_cpus
+    crashed_sim = CrashingSimulation(output_dir=output_dir, **sim_kwargs)
+    with pytest.raises(RuntimeError, match="Crashed"):
+        crashed_sim.run(GraphFactoryCls=None)
+    sim_kwargs["parse_cpus"] = resumed_parse_cpus
+    resumed_sim = Simulation(output_dir=output_dir, resume=True, **sim_kwargs)
+    # Some work units finished before the crash, and won't be run again
+    work_units_left = resumed_sim._get_resumed_data()[1]
+    assert 0 < len(work_units_left) < len(resumed_sim._get_work_units())
+    resumed_sim.run(GraphFactoryCls=None)
+
+    assert resumed_sim.csv_path.read_text() == full_sim.csv_path.read_text()
+    # The trial records of the crashed run's unfinished work unit are dropped
+    assert _read_trial_records(resumed_sim) == _read_trial_records(full_sim)
+
+
+@pytest.mark.slow
+@pytest.mark.framework
+def test_sim_instrumentation(tmp_path: Path, sim_kwargs: dict):
+    """Tests that instrumentation is summed across workers and changes no data"""
+
+    sim = Simulation(output_dir=tmp_path / "plain", **sim_kwargs)
+    sim.run(GraphFactoryCls=None)
+    sim_kwargs["write_instrumentation"] = True
+    single_process_sim = Simulation(output_dir=tmp_path / "single", **sim_kwargs)
+    single_process_sim.run(GraphFactoryCls=None)
+    sim_kwargs["parse_cpus"] = 3
+    mp_sim = Simulation(output_dir=tmp_path / "mp", **sim_kwargs)
+    mp_sim.run(GraphFactoryCls=None)
+
+    assert not sim.instrumentation_path.exists()
+    assert single_process_sim.csv_path.read_text() == sim.csv_path.read_text()
+    single_process_data = json.loads(
+        single_process_sim.instrumentation_path.read_text()
+    )
+    mp_data = json.loads(mp_sim.instrumentation_path.read_text())
+    # Counts don't depend on how work units are scheduled, unlike the times
+    assert mp_data["counts"] == single_process_data["counts"]
+    for event in POLICY_EVENTS.values():
+        assert single_process_data["counts"][event] > 0
+    assert single_process_data["counts"]["anns_rejected"] > 0
+    assert mp_data["phases"]["graph_build"]["calls"] == 3
+    num_scenarios = sim_kwargs["num_trials"] * len(sim_kwargs["percent_adoptions"])
+    for phase in ("set_as_classes", "propagate_to_customers", "analysis"):
+        assert mp_data["phases"][phase]["calls"] == num_scenarios
@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+from frozendict import frozendict
+
+from bgpy.as_graphs import (
+    AS,
+    ASGraph,
+    ASGraphCache,
+    CAIDAASGraphConstructor,
+    SyntheticASGraphCollector,
+)
+from bgpy.tests.engine_tests.engine_test_configs.examples.as_graph_info_000 import (
+    as_graph_info_000,
+)
+
+
+def _big_providers_filter(as_graph: ASGraph) -> frozenset[AS]:
+    return frozenset(x for x in as_graph if len(x.customers) > 10)
+
+
+def _get_cache_hit(cache_dir: Path) -> bool:
+    """Builds the graph (in a new process) and returns if the cache was hit"""
+
+    constructor = CAIDAASGraphConstructor(
+        ASGraphCollectorCls=SyntheticASGraphCollector,
+        as_graph_collector_kwargs=frozendict(
+            {"num_ases": 1_000, "cache_dir": cache_dir}
+        ),
+        as_graph_kwargs=frozendict(
+            {
+                "additional_as_group_filters": frozendict(
+                    {"big_providers": _big_providers_filter}
+                )
+            }
+        ),
+    )
+    as_graph_cache = constructor._get_as_graph_cache(
+        constructor.as_graph_collector.run()
+    )
+    assert as_graph_cache is not None
+    cache_hit = as_graph_cache.read() is not None
+    constructor.run()
+    return cache_hit
+
+
+class OneArgCAIDAASGraphConstructor(CAIDAASGraphConstructor):
+    """Overrides _get_as_graph from before it took as_graph_attrs"""
+
+    def _get_as_graph(self, as_graph_info):  # type: ignore[override]
+        return ASGraph(as_graph_info, **self.as_graph_kwargs)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestASGraphCache:
+    def _get_cache(self, tmp_path, key_parts=()) -> ASGraphCache:
+        source_path = tmp_path / "as_graph.txt"
+        if not source_path.exists():
+            source_path.write_text("source file for the cache key")
+        return ASGraphCache(source_path, key_parts)
+
+    def test_round_trip(self, tmp_path):
+        """Tests that the cached graph matches the graph it was written from"""
+
+        kwargs = {"store_provider_cone_size": True}
+        as_graph = ASGraph(as_graph_info_000, **kwargs)
+        self._get_cache(tmp_path).write(as_graph_info_000, as_graph)
+        cached = self._get_cache(tmp_path).read()
+        assert cached is not None
+        as_graph_info, as_graph_attrs = cached
+        assert as_graph_info.customer_provider_links == (
+            as_graph_info_000.customer_provider_links
+        )
+        assert as_graph_info.peer_links == as_graph_info_000.peer_links
+        assert as_graph_info.input_clique_asns == as_graph_info_000.input_clique_asns
+
+        cached_as_graph = ASGraph(
+            as_graph_info, as_graph_attrs=as_graph_attrs, **kwargs
+        )
+        assert cached_as_graph == as_graph
+        for as_obj in as_graph:
+            cached_as_obj = cached_as_graph.as_dict[as_obj.asn]
+            assert cached_as_obj.provider_cone_size == as_obj.provider_cone_size
+            assert cached_as_obj.as_rank == as_obj.as_rank
+        assert [[x.asn for x in rank] for rank in as_graph.propagation_ranks] == [
+            [x.asn for x in rank] for rank in cached_as_graph.propagation_ranks
+        ]
+
+    def test_invalidation(self, tmp_path):
+        """Tests that changing the key parts or the source file misses the cache"""
+
+        as_graph = ASGraph(as_graph_info_000)
+        self._get_cache(tmp_path, ("kwargs",)).write(as_graph_info_000, as_graph)
+        assert self._get_cache(tmp_path, ("kwargs",)).read() is not None
+        assert self._get_cache(tmp_path, ("other kwargs",)).read() is None
+
+        source_path = tmp_path / "as_graph.txt"
+        stat = source_path.stat()
+        os.utime(source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert self._get_cache(tmp_path, ("kwargs",)).read() is None
+
+    def test_hit_across_processes(self, tmp_path):
+        """Tests that callables in the kwargs don't change the key per process"""
+
+        with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+            cache_hits = [
+                pool.apply(_get_cache_hit, (tmp_path,)),
+                pool.apply(_get_cache_hit, (tmp_path,)),
+            ]
+        assert cache_hits == [False, True]
+
+    def test_one_arg_get_as_graph(self, tmp_path):
+        """Tests subclasses that override _get_as_graph with only as_graph_info"""
+
+        constructor = OneArgCAIDAASGraphConstructor(
+            ASGraphCollectorCls=SyntheticASGraphCollector,
+            as_graph_collector_kwargs=frozendict(
+                {"num_ases": 1_000, "cache_dir": tmp_path}
+            ),
+        )
+        as_graph = constructor.run()
+        # From the cache
+        assert constructor.run() == as_graph
+        # From another process's info and attrs
+        as_graph_info, as_graph_attrs = constructor.get_as_graph_info_and_attrs()
+        assert as_graph_attrs is not None
+        assert constructor.run(as_graph_info, as_graph_attrs) == as_graph
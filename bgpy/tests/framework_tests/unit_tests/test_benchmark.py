@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from bgpy.simulation_engine import BGP, ROV
+from bgpy.simulation_framework import SubprefixHijack
+from bgpy.utils.benchmark import Benchmark, BenchmarkWorkload
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+def test_benchmark(tmp_path: Path):
+    """Tests a small workload and comparing it to a slower and faster baseline"""
+
+    workload = BenchmarkWorkload(200, SubprefixHijack, BGP, ROV)
+    results = Benchmark((workload,), num_trials=2, cache_dir=tmp_path).run()
+    workload_results = results["workloads"][workload.name]
+    assert workload_results["trials_per_sec"] > 0
+    assert workload_results["peak_rss_mb"] > 0
+    assert workload_results["phases"]["propagate_to_customers"] > 0
+
+    # Compared to itself, nothing regressed
+    assert not Benchmark.compare(results, results)
+    baseline = {
+        "workloads": {
+            workload.name: {
+                "trials_per_sec": workload_results["trials_per_sec"] * 2,
+                "peak_rss_mb": workload_results["peak_rss_mb"] / 2,
+            }
+        }
+    }
+    assert len(Benchmark.compare(results, baseline, tolerance=0.1)) == 2
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+def test_default_workloads():
+    """Tests that only BGPFull policies get the route leak workload"""
+
+    workloads = BenchmarkWorkload.get_default_workloads((1_000,))
+    names = {x.name for x in workloads}
+    assert "1000/SubprefixHijack/BGP/ROV" in names
+    assert "1000/AccidentalRouteLeak/BGPFull/ROVFull" in names
+    assert "1000/AccidentalRouteLeak/BGP/ROV" not in names
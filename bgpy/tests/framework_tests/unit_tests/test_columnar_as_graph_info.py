@@ -0,0 +1,57 @@
+import pytest
+
+from bgpy.as_graphs import ASGraph, ColumnarASGraphInfo
+from bgpy.tests.engine_tests.engine_test_configs.examples.as_graph_info_000 import (
+    as_graph_info_000,
+)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestColumnarASGraphInfo:
+    def test_conversion(self):
+        """Tests that converting ASGraphInfo keeps its links and graph"""
+
+        columnar_info = ColumnarASGraphInfo.from_as_graph_info(as_graph_info_000)
+        assert columnar_info == as_graph_info_000
+        assert list(columnar_info.asns) == as_graph_info_000.asns
+        assert columnar_info.links == as_graph_info_000.links
+        as_graph_info = columnar_info.to_as_graph_info()
+        assert as_graph_info.customer_provider_links == (
+            as_graph_info_000.customer_provider_links
+        )
+        assert as_graph_info.peer_links == as_graph_info_000.peer_links
+        assert ASGraph(columnar_info) == ASGraph(as_graph_info_000)
+
+    def test_from_pairs(self):
+        """Tests that duplicate links are only added once"""
+
+        columnar_info = ColumnarASGraphInfo.from_pairs(
+            cp_asns=[1, 2, 1, 2, 1, 3],
+            peer_asns=[2, 3, 3, 2],
+            input_clique_asns=[1],
+        )
+        assert list(columnar_info.provider_asns) == [1, 1]
+        assert list(columnar_info.customer_asns) == [2, 3]
+        assert list(columnar_info.peer1_asns) == [2]
+        assert list(columnar_info.peer2_asns) == [3]
+        assert columnar_info.asns == (1, 2, 3)
+        assert columnar_info.input_clique_asns == frozenset({1})
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            # Customer provider link in both directions
+            {"provider_asns": [1, 2], "customer_asns": [2, 1]},
+            # Customer provider link that's also a peer link
+            {
+                "provider_asns": [1],
+                "customer_asns": [2],
+                "peer1_asns": [2],
+                "peer2_asns": [1],
+            },
+        ],
+    )
+    def test_duplicate_links(self, kwargs: dict):
+        with pytest.raises(AssertionError):
+            ColumnarASGraphInfo(**kwargs)
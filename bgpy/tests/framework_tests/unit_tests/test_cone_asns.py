@@ -0,0 +1,142 @@
+import importlib
+import random
+
+import pytest
+
+from bgpy.as_graphs import AS, ASGraph, ConeASNs, SyntheticASGraphGenerator
+from bgpy.simulation_framework import ScenarioConfig, SubprefixHijack
+from bgpy.tests.engine_tests.engine_test_configs.examples.as_graph_info_000 import (
+    as_graph_info_000,
+)
+
+
+def _get_cone_asns(as_obj: AS, rel_attr: str) -> frozenset[int]:
+    """Returns the ASNs reachable through rel_attr by searching the graph"""
+
+    cone_asns: set[int] = set()
+    stack = [as_obj]
+    while stack:
+        for neighbor in getattr(stack.pop(), rel_attr):
+            if neighbor.asn not in cone_asns:
+                cone_asns.add(neighbor.asn)
+                stack.append(neighbor)
+    return frozenset(cone_asns)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+def test_cone_asns():
+    """Tests the cone bitsets against searching the graph"""
+
+    as_graph = ASGraph(
+        as_graph_info_000,
+        store_customer_cone_asns=True,
+        store_provider_cone_asns=True,
+    )
+    for as_obj in as_graph:
+        assert isinstance(as_obj.customer_cone_asns, ConeASNs)
+        assert isinstance(as_obj.provider_cone_asns, ConeASNs)
+        # Stubs and multihomed ASes have empty customer cones
+        if as_obj.stub or as_obj.multihomed:
+            customer_cone_asns: frozenset[int] = frozenset()
+        else:
+            customer_cone_asns = _get_cone_asns(as_obj, "customers")
+        provider_cone_asns = _get_cone_asns(as_obj, "providers")
+
+        assert as_obj.customer_cone_asns == customer_cone_asns
+        assert as_obj.customer_cone_size == len(customer_cone_asns)
+        assert as_obj.provider_cone_asns == provider_cone_asns
+        assert as_obj.provider_cone_size == len(provider_cone_asns)
+        assert hash(as_obj.provider_cone_asns) == hash(provider_cone_asns)
+        for asn in [*as_graph.as_dict, -1]:
+            assert (asn in as_obj.provider_cone_asns) == (asn in provider_cone_asns)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+def test_reachability_index():
+    """Tests the reachability index against searching the graph"""
+
+    as_graph = ASGraph(as_graph_info_000)
+    reachability_index = as_graph.reachability_index
+    for as_obj in as_graph:
+        customer_cone_asns = _get_cone_asns(as_obj, "customers")
+        provider_cone_asns = _get_cone_asns(as_obj, "providers")
+        assert reachability_index.get_customer_cone_asns(as_obj.asn) == (
+            customer_cone_asns
+        )
+        assert reachability_index.get_provider_cone_asns(as_obj.asn) == (
+            provider_cone_asns
+        )
+        provider_cone = reachability_index.get_provider_cone(as_obj.asn)
+        for asn in [*as_graph.as_dict, -1]:
+            assert reachability_index.in_customer_cone(asn, as_obj.asn) == (
+                asn in customer_cone_asns
+            )
+            assert reachability_index.in_provider_cone(asn, as_obj.asn) == (
+                asn in provider_cone_asns
+            )
+            assert (asn in provider_cone) == (asn in provider_cone_asns)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+def test_reachability_index_synthetic():
+    """Tests the pruned landmark labels against searching a larger graph
+
+    The example graph is too small for the pruning to matter, so this uses
+    a synthetic CAIDA-like graph with a few thousand ASes
+    """
+
+    as_graph = ASGraph(SyntheticASGraphGenerator(3_000, seed=0).get_as_graph_info())
+    reachability_index = as_graph.reachability_index
+    asns = [*as_graph.as_dict, -1]
+    # Checking every pair of ASes is too slow, so check a sample of them
+    rng = random.Random(0)  # noqa: S311
+    sampled_ases = frozenset(rng.sample(as_graph.ases, 100))
+    for as_obj in as_graph:
+        customer_cone_asns = _get_cone_asns(as_obj, "customers")
+        provider_cone_asns = _get_cone_asns(as_obj, "providers")
+        assert reachability_index.get_customer_cone_asns(as_obj.asn) == (
+            customer_cone_asns
+        )
+        assert reachability_index.get_provider_cone_asns(as_obj.asn) == (
+            provider_cone_asns
+        )
+        checked_asns = asns if as_obj in sampled_ases else rng.sample(asns, 20)
+        for asn in checked_asns:
+            assert reachability_index.in_customer_cone(asn, as_obj.asn) == (
+                asn in customer_cone_asns
+            )
+            assert reachability_index.in_provider_cone(asn, as_obj.asn) == (
+                asn in provider_cone_asns
+            )
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+def test_deprecated_cone_size_helper():
+    """Tests the deprecated shim when bound onto a Scenario like it used to be"""
+
+    with pytest.deprecated_call():
+        customer_cone_funcs = importlib.reload(
+            importlib.import_module("bgpy.as_graphs.base.as_graph.customer_cone_funcs")
+        )
+
+    class ConeSubprefixHijack(SubprefixHijack):
+        _get_cone_size_helper = customer_cone_funcs._get_cone_size_helper
+
+    scenario = ConeSubprefixHijack(
+        scenario_config=ScenarioConfig(
+            ScenarioCls=ConeSubprefixHijack,
+            override_attacker_asns=frozenset({1}),
+            override_victim_asns=frozenset({2}),
+            override_adopting_asns=frozenset(),
+        )
+    )
+    as_graph = ASGraph(as_graph_info_000)
+    cone_dict: dict[int, set[int]] = dict()
+    for as_obj in as_graph:
+        assert scenario._get_cone_size_helper(as_obj, cone_dict) == set(
+            as_graph.reachability_index.get_customer_cone_asns(as_obj.asn)
+        )
@@ -0,0 +1,157 @@
+import random
+
+import pytest
+
+from bgpy.shared.enums import ASGroups, InAdoptingASNs, Outcomes, Plane
+from bgpy.simulation_engine import ROV
+from bgpy.simulation_framework import (
+    ASGraphAnalyzer,
+    DataPointKey,
+    GraphCategory,
+    GraphDataAggregator,
+    ScenarioConfig,
+    SubprefixHijack,
+)
+from bgpy.simulation_framework.graph_data_aggregator import TrialData
+from bgpy.simulation_framework.utils import get_all_graph_categories
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestGraphDataAggregator:
+    def test_trial_percents(self, engine):
+        """Tests that the bitmask percents match TrialData's percents"""
+
+        graph_categories = tuple(
+            GraphCategory(
+                plane=plane,
+                as_group=as_group,
+                outcome=outcome,
+                in_adopting_asns=in_adopting_asns,
+            )
+            for plane in Plane
+            for as_group in ASGroups
+            for outcome in Outcomes
+            for in_adopting_asns in InAdoptingASNs
+        )
+        graph_data_aggregator = GraphDataAggregator(graph_categories=graph_categories)
+        scenario_config = ScenarioConfig(
+            ScenarioCls=SubprefixHijack, AdoptPolicyCls=ROV
+        )
+
+        random.seed(0)
+        for _ in range(3):
+            scenario = SubprefixHijack(
+                scenario_config=scenario_config, engine=engine, percent_adoption=0.5
+            )
+            scenario.setup_engine(engine)
+            engine.run(propagation_round=0, scenario=scenario)
+            outcomes = ASGraphAnalyzer(
+                engine=engine, scenario=scenario, control_plane_tracking=True
+            ).analyze()
+
+            trial_datas = [TrialData(x) for x in graph_categories]
+            graph_data_aggregator._aggregate_trial_data(
+                trial_datas=trial_datas,
+                engine=engine,
+                scenario=scenario,
+                outcomes=outcomes,
+            )
+            percents = graph_data_aggregator._get_trial_percents(
+                engine=engine, scenario=scenario, outcomes=outcomes
+            )
+            assert percents == {x.graph_category: x.get_percent() for x in trial_datas}
+
+    def test_custom_aggregate_trial_data(self, engine):
+        """Tests that a custom _aggregate_trial_data is still used"""
+
+        class ZeroNumeratorGraphDataAggregator(GraphDataAggregator):
+            def _aggregate_trial_data(self, *, trial_datas, **kwargs):
+                super()._aggregate_trial_data(trial_datas=trial_datas, **kwargs)
+                for trial_data in trial_datas:
+                    trial_data._numerator = 0
+
+        scenario_config = ScenarioConfig(ScenarioCls=SubprefixHijack)
+        random.seed(0)
+        scenario = SubprefixHijack(scenario_config=scenario_config, engine=engine)
+        scenario.setup_engine(engine)
+        engine.run(propagation_round=0, scenario=scenario)
+        outcomes = ASGraphAnalyzer(engine=engine, scenario=scenario).analyze()
+
+        graph_data_aggregators = (
+            GraphDataAggregator(),
+            ZeroNumeratorGraphDataAggregator(),
+        )
+        for graph_data_aggregator in graph_data_aggregators:
+            graph_data_aggregator.aggregate_and_store_trial_data(
+                engine=engine,
+                percent_adopt=0.5,
+                trial=0,
+                scenario=scenario,
+                propagation_round=0,
+                outcomes=outcomes,
+            )
+        default, custom = (x.get_csv_rows() for x in graph_data_aggregators)
+        assert any(x["value"] for x in default)
+        assert not any(x["value"] for x in custom)
+
+    def _get_trial_percents(self, num_trials: int):
+        """Returns random (trial, data_point_key, percents) like a simulation's"""
+
+        scenario_config = ScenarioConfig(ScenarioCls=SubprefixHijack)
+        trial_percents = list()
+        rng = random.Random(0)  # noqa: S311
+        for trial in range(num_trials):
+            for percent_adopt in (0.1, 0.5):
+                data_point_key = DataPointKey(
+                    propagation_round=0,
+                    percent_adopt=percent_adopt,
+                    scenario_config=scenario_config,
+                )
+                percents = {
+                    x: rng.randint(0, 700) * 100 / rng.randint(700, 3000)
+                    for x in get_all_graph_categories()
+                }
+                trial_percents.append((trial, data_point_key, percents))
+        return trial_percents
+
+    def test_running_stats(self):
+        """Tests that merging RunningStats gives the same data as merging lists"""
+
+        trial_percents = self._get_trial_percents(50)
+        graph_data_aggregators = dict()
+        for running_stats in (False, True):
+            # Split up the trials like simulation chunks
+            chunks = [
+                GraphDataAggregator(running_stats=running_stats) for _ in range(3)
+            ]
+            for trial, data_point_key, percents in trial_percents:
+                chunks[trial % 3].store_trial_percents(data_point_key, percents)
+            graph_data_aggregators[running_stats] = sum(
+                chunks, start=GraphDataAggregator(running_stats=running_stats)
+            )
+
+        lists, stats = graph_data_aggregators[False], graph_data_aggregators[True]
+        assert stats.get_csv_rows() == lists.get_csv_rows()
+        assert stats.get_pickle_data() == lists.get_pickle_data()
+
+    def test_trial_records(self, tmp_path):
+        """Tests that trial records aggregate to the same data as the trials"""
+
+        trial_records_path = tmp_path / "trial_records.pickle"
+        graph_data_aggregator = GraphDataAggregator(
+            trial_records_path=trial_records_path
+        )
+        trial_percents = self._get_trial_percents(5)
+        for trial, data_point_key, percents in trial_percents:
+            graph_data_aggregator._write_trial_record(trial, data_point_key, percents)
+            graph_data_aggregator.store_trial_percents(data_point_key, percents)
+
+        from_records = GraphDataAggregator.from_trial_records([trial_records_path])
+        assert from_records.get_csv_rows() == graph_data_aggregator.get_csv_rows()
+
+        # Simulate a crash partway through writing the last record
+        with trial_records_path.open("r+b") as f:
+            f.truncate(trial_records_path.stat().st_size - 10)
+        records = list(GraphDataAggregator.read_trial_records([trial_records_path]))
+        assert records == trial_percents[:-1]
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import bgpy
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestLazyImports:
+    @pytest.mark.parametrize(
+        ("stmt", "unimported_modules"),
+        [
+            (
+                "from bgpy.simulation_engine import BGP",
+                (
+                    "bgpy.as_graphs",
+                    "bgpy.simulation_framework",
+                    "bgpy.tests",
+                    "bgpy.utils",
+                    "pytest",
+                ),
+            ),
+            (
+                "from bgpy.simulation_framework import Simulation",
+                ("matplotlib", "requests", "requests_cache", "rov_collector"),
+            ),
+            ("from bgpy.utils import EngineRunner", ("rov_collector",)),
+        ],
+    )
+    def test_unimported_modules(self, stmt: str, unimported_modules: tuple[str, ...]):
+        """Tests that heavy modules aren't imported until they're used
+
+        Runs in a new interpreter, since this one has imported everything
+        """
+
+        code = f"import sys; {stmt}; print(' '.join(sys.modules))"
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            # So that this bgpy is imported even if it's not installed
+            cwd=Path(bgpy.__file__).parent.parent,
+        )
+        imported_modules = set(result.stdout.split())
+        for module in unimported_modules:
+            assert module not in imported_modules
+
+    def test_lazy_attrs(self):
+        """Tests that lazy subpackages and attrs are still accessible"""
+
+        assert bgpy.simulation_framework.Simulation.__name__ == "Simulation"
+        assert bgpy.utils.Diagram.__name__ == "Diagram"
+        assert "simulation_framework" in dir(bgpy)
+        with pytest.raises(AttributeError):
+            bgpy.not_a_subpackage  # noqa: B018
@@ -0,0 +1,60 @@
+import pytest
+
+from bgpy.as_graphs import ASGraph, ASGraphInfo
+from bgpy.as_graphs.base.links import CustomerProviderLink as CPLink
+from bgpy.shared.exceptions import CustomerProviderCycleError
+from bgpy.tests.engine_tests.engine_test_configs.examples.as_graph_info_000 import (
+    as_graph_info_000,
+)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestPropagationRanks:
+    def test_ranks(self):
+        """Tests that each AS's rank is one more than its highest ranked customer"""
+
+        as_graph = ASGraph(as_graph_info_000)
+        for as_obj in as_graph:
+            assert as_obj.propagation_rank == max(
+                (x.propagation_rank + 1 for x in as_obj.customers), default=0
+            )
+
+    def test_deep_chain(self):
+        """Tests a provider chain deeper than the recursion limit"""
+
+        num_ases = 5000
+        as_graph = ASGraph(
+            ASGraphInfo(
+                customer_provider_links=frozenset(
+                    CPLink(provider_asn=asn + 1, customer_asn=asn)
+                    for asn in range(1, num_ases)
+                )
+            ),
+            store_provider_cone_size=True,
+        )
+        assert len(as_graph.propagation_ranks) == num_ases
+        # The top AS has only one neighbor, so it's a stub with no customer cone
+        assert as_graph.as_dict[num_ases - 1].customer_cone_size == num_ases - 2
+        assert as_graph.as_dict[1].provider_cone_size == num_ases - 1
+
+    def test_cycle(self):
+        """Tests that customer-provider cycles are reported"""
+
+        as_graph_info = ASGraphInfo(
+            customer_provider_links=frozenset(
+                [
+                    CPLink(provider_asn=2, customer_asn=1),
+                    CPLink(provider_asn=3, customer_asn=2),
+                    CPLink(provider_asn=4, customer_asn=3),
+                    CPLink(provider_asn=2, customer_asn=4),
+                    CPLink(provider_asn=5, customer_asn=4),
+                ]
+            )
+        )
+        with pytest.raises(CustomerProviderCycleError) as exc_info:
+            ASGraph(as_graph_info)
+        cycle_asns = exc_info.value.cycle_asns
+        # The cycle can start from any of its ASes
+        start = cycle_asns.index(4)
+        assert cycle_asns[start:] + cycle_asns[:start] == (4, 3, 2)
@@ -2,11 +2,13 @@ import random
 from ipaddress import ip_network
 
 import pytest
-from roa_checker import ROA
+from roa_checker import ROA, ROAChecker
 
-from bgpy.shared.enums import ASNs, Prefixes
+from bgpy.shared.enums import ASGroups, ASNs, Prefixes
 from bgpy.simulation_engine import BGP, Announcement, BGPFull
+from bgpy.simulation_engine.policies.policy import ROAInfo
 from bgpy.simulation_framework import (
+    AccidentalRouteLeak,
     NonRoutedPrefixHijack,
     ScenarioConfig,
     SubprefixHijack,
@@ -14,6 +16,13 @@ from bgpy.simulation_framework import (
 )
 
 
+class OwnROACheckerBGP(BGP):
+    """BGP with a ROAChecker that has no ROAs"""
+
+    name = "OwnROACheckerBGP"
+    roa_checker = ROAChecker()
+
+
 @pytest.mark.framework
 @pytest.mark.unit_tests
 class TestScenario:
@@ -323,6 +332,49 @@ class TestScenario:
         )
         assert bgp.ann_is_invalid_by_roa(malicious)
 
+    def test_roa_info_table(self, engine):
+        """Tests that the ROAInfo table matches the roa_checker"""
+
+        scenario = NonRoutedPrefixHijack(
+            scenario_config=ScenarioConfig(ScenarioCls=NonRoutedPrefixHijack),
+            engine=engine,
+        )
+        bgp = BGP()
+        assert set(bgp.get_roa_info_table()) == {
+            (x.prefix, x.origin) for x in scenario.announcements
+        }
+        for (prefix, origin), roa_info in bgp.get_roa_info_table().items():
+            assert roa_info == ROAInfo.from_roa_checker(bgp.roa_checker, prefix, origin)
+        (attacker_ann,) = scenario.announcements
+        assert bgp.ann_is_roa_non_routed(attacker_ann)
+
+        # Pairs that aren't in the table fall back to the roa_checker
+        ann = attacker_ann.copy({"as_path": (ASNs.VICTIM.value,)})
+        assert (ann.prefix, ann.origin) not in bgp.get_roa_info_table()
+        assert bgp.get_roa_info(ann) == ROAInfo.from_roa_checker(
+            bgp.roa_checker, ann.prefix, ann.origin
+        )
+
+    def test_roa_info_table_per_roa_checker(self, engine):
+        """Tests that policies with their own roa_checker get their own table"""
+
+        scenario = NonRoutedPrefixHijack(
+            scenario_config=ScenarioConfig(ScenarioCls=NonRoutedPrefixHijack),
+            engine=engine,
+        )
+        (attacker_ann,) = scenario.announcements
+        prefix_origin = (attacker_ann.prefix, attacker_ann.origin)
+        base_roa_info = BGP().get_roa_info(attacker_ann)
+        assert base_roa_info.invalid
+
+        # No ROAs, so this is unknown rather than invalid
+        OwnROACheckerBGP.reset_roa_info_table([prefix_origin])
+        own_roa_info = OwnROACheckerBGP().get_roa_info(attacker_ann)
+        assert own_roa_info.unknown
+        assert OwnROACheckerBGP.get_roa_info_table() == {prefix_origin: own_roa_info}
+        # And the table of every other policy is left as is
+        assert BGP.get_roa_info_table()[prefix_origin] == base_roa_info
+
     #######################
     # Adopting ASNs funcs #
     #######################
@@ -382,3 +434,27 @@ class TestScenario:
             Prefixes.SUBPREFIX.value: [],
         }
         assert scenario.ordered_prefix_subprefix_dict == gt
+
+    @pytest.mark.parametrize("ScenarioCls", [SubprefixHijack, AccidentalRouteLeak])
+    def test_get_attacker_and_victim_asns(self, ScenarioCls, engine):
+        """Tests that they're the same as a new scenario's, without creating one"""
+
+        scenario_config = ScenarioConfig(
+            ScenarioCls=ScenarioCls,
+            attacker_subcategory_attr=ASGroups.MULTIHOMED.value,
+        )
+        random.seed(0)
+        scenario = ScenarioCls(
+            scenario_config=scenario_config, engine=engine, percent_adoption=0.5
+        )
+        roa_info_table = BGP.get_roa_info_table()
+        random.seed(0)
+        attacker_and_victim_asns = ScenarioCls.get_attacker_and_victim_asns(
+            scenario_config=scenario_config, engine=engine, percent_adoption=0.5
+        )
+        assert attacker_and_victim_asns == (
+            scenario.attacker_asns,
+            scenario.victim_asns,
+        )
+        # The ROA checker isn't reset
+        assert BGP.get_roa_info_table() is roa_info_table
@@ -0,0 +1,75 @@
+import bz2
+from pathlib import Path
+
+import pytest
+
+from bgpy.as_graphs import CAIDAASGraphConstructor, SyntheticASGraphGenerator
+from bgpy.as_graphs.base import CustomerProviderLink as CPLink
+from bgpy.as_graphs.base import PeerLink
+from bgpy.as_graphs.caida_as_graph import serial_2
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestSerial2:
+    @pytest.mark.parametrize("compressed", [False, True])
+    def test_round_trip(self, tmp_path: Path, monkeypatch, compressed: bool):
+        """Tests that parsing a written topology gives the same ASGraphInfo
+
+        Uses small blocks so that lines are split across blocks
+        """
+
+        monkeypatch.setattr(serial_2, "BLOCK_SIZE", 1_000)
+        generator = SyntheticASGraphGenerator(2_000)
+        path = tmp_path / "serial_2.txt"
+        generator.write_serial_2(path)
+        if compressed:
+            bz2_path = tmp_path / "serial_2.txt.bz2"
+            bz2_path.write_bytes(bz2.compress(path.read_bytes()))
+            path = bz2_path
+
+        as_graph_info = CAIDAASGraphConstructor()._get_as_graph_info(path)
+        expected_as_graph_info = generator.get_as_graph_info()
+        assert as_graph_info.customer_provider_links == (
+            expected_as_graph_info.customer_provider_links
+        )
+        assert as_graph_info.peer_links == expected_as_graph_info.peer_links
+        assert as_graph_info.ixp_asns == expected_as_graph_info.ixp_asns
+        assert as_graph_info.input_clique_asns == (
+            expected_as_graph_info.input_clique_asns
+        )
+
+    def test_relationship_field(self, tmp_path: Path):
+        """Tests that links are classified by their relationship field only"""
+
+        path = tmp_path / "serial_2.txt"
+        path.write_text(
+            "# source:topology|BGP\n"
+            "# input clique: 1 2\n"
+            "# IXP ASes: 5\n"
+            "1|2|0|bgp\n"
+            "\n"
+            "1|3|-1|bgp\n"
+            "2|31|0|bgp\n"
+            # Would've been a customer provider link by substring
+            "4|5|0|-1\n"
+            "6|7|0|bgp"
+        )
+
+        as_graph_info = CAIDAASGraphConstructor()._get_as_graph_info(
+            path, invalid_asns=frozenset({7})
+        )
+        assert as_graph_info.customer_provider_links == frozenset(
+            {CPLink(provider_asn=1, customer_asn=3)}
+        )
+        assert as_graph_info.peer_links == frozenset(
+            {PeerLink(1, 2), PeerLink(2, 31), PeerLink(4, 5)}
+        )
+        assert as_graph_info.input_clique_asns == frozenset({1, 2})
+        assert as_graph_info.ixp_asns == frozenset({5})
+
+    def test_unknown_relationship(self, tmp_path: Path):
+        path = tmp_path / "serial_2.txt"
+        path.write_text("1|2|-1|bgp\n1|3|2|bgp\n")
+        with pytest.raises(ValueError, match="relationships"):
+            serial_2.read_serial_2(path)
@@ -0,0 +1,68 @@
+import pytest
+
+from bgpy.as_graphs import (
+    ASGraph,
+    ASGraphAttrs,
+    ColumnarASGraphInfo,
+    PeerLink,
+    SharedASGraphInfo,
+)
+from bgpy.as_graphs.base.shared_as_graph_info import as_graph_info_from_arrays
+from bgpy.tests.engine_tests.engine_test_configs.examples.as_graph_info_000 import (
+    as_graph_info_000,
+)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestSharedASGraphInfo:
+    def test_round_trip(self):
+        """Tests that ASGraphInfo read from shared memory builds the same graph"""
+
+        with SharedASGraphInfo.from_as_graph_info(as_graph_info_000) as shared_info:
+            # Attach a second time like a worker would
+            with SharedASGraphInfo(shared_info.name) as worker_shared_info:
+                as_graph_info = worker_shared_info.to_as_graph_info()
+
+        assert as_graph_info.customer_provider_links == (
+            as_graph_info_000.customer_provider_links
+        )
+        assert as_graph_info.peer_links == as_graph_info_000.peer_links
+        assert as_graph_info.ixp_asns == as_graph_info_000.ixp_asns
+        assert as_graph_info.input_clique_asns == as_graph_info_000.input_clique_asns
+        assert ASGraph(as_graph_info) == ASGraph(as_graph_info_000)
+
+    def test_round_trip_with_attrs(self):
+        """Tests that workers get the ranks and cones without recomputing them"""
+
+        as_graph = ASGraph(as_graph_info_000, store_provider_cone_size=True)
+        as_graph_attrs = ASGraphAttrs.from_as_graph(as_graph)
+        with SharedASGraphInfo.from_as_graph_info(
+            as_graph_info_000, as_graph_attrs
+        ) as shared_info:
+            with SharedASGraphInfo(shared_info.name) as worker_shared_info:
+                as_graph_info, worker_as_graph_attrs = worker_shared_info.read()
+
+        assert worker_as_graph_attrs == as_graph_attrs
+        assert (
+            ASGraph(
+                as_graph_info,
+                store_provider_cone_size=True,
+                as_graph_attrs=worker_as_graph_attrs,
+            )
+            == as_graph
+        )
+        with SharedASGraphInfo.from_as_graph_info(as_graph_info_000) as shared_info:
+            assert shared_info.read()[1] is None
+
+    def test_from_arrays(self):
+        """Tests that duplicate links (and peers in either order) are added once"""
+
+        as_graph_info = as_graph_info_from_arrays(
+            [1, 2, 1, 2, 1, 3], [2, 3, 3, 2], unlinked_asns=[4]
+        )
+        assert isinstance(as_graph_info, ColumnarASGraphInfo)
+        assert list(as_graph_info.provider_asns) == [1, 1]
+        assert list(as_graph_info.customer_asns) == [2, 3]
+        assert as_graph_info.peer_links == frozenset({PeerLink(2, 3)})
+        assert as_graph_info.asns == (1, 2, 3, 4)
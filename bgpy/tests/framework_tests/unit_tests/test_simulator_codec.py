@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from bgpy.tests.engine_tests.engine_test_configs import engine_test_configs
+from bgpy.tests.engine_tests.utils import EngineTestConfig
+from bgpy.utils import SimulatorCodec
+
+ENGINE_TEST_OUTPUTS = (
+    Path(__file__).parent.parent.parent / "engine_tests" / "engine_test_outputs"
+)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestSimulatorCodec:
+    @pytest.mark.parametrize(
+        "conf", engine_test_configs, ids=[x.name for x in engine_test_configs]
+    )
+    def test_snapshot(self, conf: EngineTestConfig, tmp_path: Path):
+        """Tests that engines and outcomes are the same after a snapshot"""
+
+        codec = SimulatorCodec()
+        for yaml_name in ("engine_gt.yaml", "outcomes_gt.yaml"):
+            obj = codec.load(ENGINE_TEST_OUTPUTS / conf.name / yaml_name)
+            snapshot_path = tmp_path / "snapshot"
+            codec.dump_snapshot(obj, snapshot_path)
+            snapshot_obj = codec.load_snapshot(snapshot_path)
+            assert snapshot_obj == obj
+            assert type(snapshot_obj) is type(obj)
+
+            # And the same again after a YAML round trip
+            yaml_path = tmp_path / yaml_name
+            codec.dump(snapshot_obj, yaml_path)
+            assert codec.load(yaml_path) == obj
+
+    def test_not_a_snapshot(self, tmp_path: Path):
+        path = tmp_path / "snapshot"
+        path.write_bytes(b"not a snapshot")
+        with pytest.raises(ValueError, match="Not a simulator snapshot"):
+            SimulatorCodec().load_snapshot(path)
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+from frozendict import frozendict
+
+from bgpy.as_graphs import (
+    CAIDAASGraph,
+    CAIDAASGraphConstructor,
+    SimpleSyntheticASGraphCollector,
+    SyntheticASGraphCollector,
+    SyntheticASGraphGenerator,
+)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestSyntheticASGraph:
+    def test_deterministic(self):
+        """Tests that the topology only depends on the settings"""
+
+        as_graph_info = SyntheticASGraphGenerator(2_000, seed=1).get_as_graph_info()
+        same_seed = SyntheticASGraphGenerator(2_000, seed=1).get_as_graph_info()
+        other_seed = SyntheticASGraphGenerator(2_000, seed=2).get_as_graph_info()
+        assert as_graph_info.links == same_seed.links
+        assert as_graph_info.links != other_seed.links
+
+    def test_shape(self):
+        """Tests the tiers, IXPs, and heavy tailed customer degrees"""
+
+        generator = SyntheticASGraphGenerator(5_000, peer_density=4)
+        as_graph = CAIDAASGraph(generator.get_as_graph_info())
+        assert len(as_graph.ases) == 5_000
+        assert {x.asn for x in as_graph if x.input_clique} == set(
+            generator.input_clique_asns
+        )
+        assert {x.asn for x in as_graph if x.ixp} == set(generator.ixp_asns)
+        for as_obj in as_graph:
+            if as_obj.input_clique:
+                assert not as_obj.providers
+                assert len(as_obj.peers) >= len(generator.input_clique_asns) - 1
+            elif as_obj.ixp:
+                assert not as_obj.providers
+                assert not as_obj.customers
+            else:
+                assert as_obj.providers
+        # Only transit ASes and the input clique have customers
+        assert all(
+            x.asn in generator.transit_asns or x.input_clique
+            for x in as_graph
+            if x.customers
+        )
+        num_customers = sorted(len(x.customers) for x in as_graph if x.customers)
+        assert num_customers[-1] > 20 * num_customers[len(num_customers) // 2]
+
+    def test_collector(self, tmp_path: Path):
+        """Tests that the cached serial-2 file parses to the same topology"""
+
+        constructor = CAIDAASGraphConstructor(
+            ASGraphCollectorCls=SyntheticASGraphCollector,
+            as_graph_collector_kwargs=frozendict(
+                {
+                    "num_ases": 1_000,
+                    "generator_kwargs": frozendict({"num_ixps": 5}),
+                    "cache_dir": tmp_path,
+                }
+            ),
+            use_as_graph_cache=False,
+        )
+        as_graph_info = constructor.get_as_graph_info()
+        expected = SyntheticASGraphGenerator(1_000, num_ixps=5).get_as_graph_info()
+        assert as_graph_info.customer_provider_links == (
+            expected.customer_provider_links
+        )
+        assert as_graph_info.peer_links == expected.peer_links
+        assert as_graph_info.ixp_asns == expected.ixp_asns
+        assert as_graph_info.input_clique_asns == expected.input_clique_asns
+
+    def test_simple_collector(self, tmp_path: Path):
+        """Tests that the simple topology is deterministic and parses"""
+
+        paths = [
+            SimpleSyntheticASGraphCollector(num_ases=500, cache_dir=x).run()
+            for x in (tmp_path / "a", tmp_path / "b")
+        ]
+        assert paths[0].read_text() == paths[1].read_text()
+        as_graph = CAIDAASGraph(
+            CAIDAASGraphConstructor(
+                ASGraphCollectorCls=SimpleSyntheticASGraphCollector,
+                as_graph_collector_kwargs=frozendict(
+                    {"num_ases": 500, "cache_dir": tmp_path / "a"}
+                ),
+                use_as_graph_cache=False,
+            ).get_as_graph_info()
+        )
+        assert len(as_graph.ases) == 500
@@ -1,8 +1,49 @@
-from .engine_runner import Diagram, EngineRunConfig, EngineRunner, SimulatorCodec
-from .utils import get_real_world_rov_asn_cls_dict, max_prob_rov
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Only for type checkers, since at runtime __getattr__ below imports these on
+# first access (PEP 562). They're still exported in __all__
+if TYPE_CHECKING:
+    from .benchmark import Benchmark, BenchmarkWorkload  # noqa: TC004
+    from .engine_runner import (  # noqa: TC004
+        Diagram,
+        EngineRunConfig,
+        EngineRunner,
+        SimulatorCodec,
+    )
+    from .utils import get_real_world_rov_asn_cls_dict, max_prob_rov  # noqa: TC004
+
+# Imported on first access (PEP 562), since these pull in heavy dependencies
+# (i.e. rov_collector for the real world ROV funcs, graphviz for Diagram)
+_LAZY_ATTR_MODULES: dict[str, str] = {
+    "Benchmark": ".benchmark",
+    "BenchmarkWorkload": ".benchmark",
+    "Diagram": ".engine_runner",
+    "EngineRunConfig": ".engine_runner",
+    "EngineRunner": ".engine_runner",
+    "SimulatorCodec": ".engine_runner",
+    "get_real_world_rov_asn_cls_dict": ".utils",
+    "max_prob_rov": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTR_MODULES:
+        module = importlib.import_module(_LAZY_ATTR_MODULES[name], __name__)
+        value = getattr(module, name)
+        # Cache it so that this is only called once per attr
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTR_MODULES})
 
 
 __all__ = [
+    "Benchmark",
+    "BenchmarkWorkload",
     "Diagram",
     "EngineRunConfig",
     "EngineRunner",
@@ -0,0 +1,4 @@
+from .benchmark_workload import BenchmarkWorkload
+from .benchmark import Benchmark
+
+__all__ = ["Benchmark", "BenchmarkWorkload"]
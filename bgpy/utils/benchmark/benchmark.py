@@ -0,0 +1,190 @@
+import json
+import platform
+import random
+import resource
+import sys
+import time
+import traceback
+from multiprocessing import Process, Queue
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any
+
+from frozendict import frozendict
+
+from bgpy.as_graphs import CAIDAASGraphConstructor, SyntheticASGraphCollector
+from bgpy.shared.constants import DIRS
+from bgpy.simulation_engine import Instrumentation
+from bgpy.simulation_framework import Simulation
+
+from .benchmark_workload import BenchmarkWorkload
+
+if TYPE_CHECKING:
+    from multiprocessing import queues
+
+
+class Benchmark:
+    """Runs workloads on synthetic AS graphs and compares them to a baseline
+
+    Every workload runs in its own process, so that its peak RSS isn't
+    inflated by the previous workloads. The results are JSON, i.e.
+
+    {"python": ..., "workloads": {name: {"trials_per_sec": ..., ...}}}
+
+    where each workload has trials_per_sec (only counting the time spent in
+    trials, not building the graph), peak_rss_mb, and the seconds spent in
+    each phase (see Instrumentation). Workloads that raise (i.e. policies
+    that don't support a scenario yet) have an error instead
+    """
+
+    def __init__(
+        self,
+        workloads: tuple[BenchmarkWorkload, ...] = (),
+        num_trials: int = 2,
+        seed: int = 0,
+        cache_dir: Path = Path(DIRS.user_cache_dir) / "synthetic_as_graphs",
+    ) -> None:
+        self.workloads: tuple[BenchmarkWorkload, ...] = (
+            workloads or BenchmarkWorkload.get_default_workloads()
+        )
+        self.num_trials: int = num_trials
+        # Seeds both the synthetic AS graphs and the trials
+        self.seed: int = seed
+        self.cache_dir: Path = cache_dir
+
+    def run(self) -> dict[str, Any]:
+        """Runs every workload and returns the results"""
+
+        workload_results: dict[str, dict[str, Any]] = dict()
+        for workload in self.workloads:
+            print(f"Benchmarking {workload.name}", file=sys.stderr)  # noqa: T201
+            workload_results[workload.name] = self._run_workload_in_process(workload)
+        return {
+            "python": f"{platform.python_implementation()} {platform.python_version()}",
+            "num_trials": self.num_trials,
+            "seed": self.seed,
+            "workloads": workload_results,
+        }
+
+    def _run_workload_in_process(self, workload: BenchmarkWorkload) -> dict[str, Any]:
+        """Runs the workload in a new process and returns its results"""
+
+        results_queue: queues.Queue[dict[str, Any]] = Queue()
+        process = Process(target=self._run_workload, args=(workload, results_queue))
+        process.start()
+        # Get before joining, since a process can't exit with a full queue
+        results = results_queue.get()
+        process.join()
+        return results
+
+    def _run_workload(
+        self,
+        workload: BenchmarkWorkload,
+        results_queue: "queues.Queue[dict[str, Any]]",
+    ) -> None:
+        """Runs the workload's trials and puts the results on the queue"""
+
+        try:
+            results = self._get_workload_results(workload)
+        # Record the error rather than stopping the remaining workloads
+        except Exception:  # noqa: BLE001
+            results = {"error": traceback.format_exc(limit=-1).strip()}
+        results_queue.put(results)
+
+    def _get_workload_results(self, workload: BenchmarkWorkload) -> dict[str, Any]:
+        """Runs a single process simulation of the workload and times it"""
+
+        # Without a python_hash_seed, the simulation's seed is drawn from this
+        random.seed(self.seed)
+        with TemporaryDirectory() as tmp_dir:
+            sim = Simulation(
+                percent_adoptions=(0.5,),
+                scenario_configs=(workload.scenario_config,),
+                num_trials=self.num_trials,
+                parse_cpus=1,
+                output_dir=Path(tmp_dir),
+                ASGraphConstructorCls=CAIDAASGraphConstructor,
+                as_graph_constructor_kwargs=frozendict(
+                    {
+                        "ASGraphCollectorCls": SyntheticASGraphCollector,
+                        "as_graph_collector_kwargs": frozendict(
+                            {
+                                "num_ases": workload.num_ases,
+                                "seed": self.seed,
+                                "cache_dir": self.cache_dir,
+                            }
+                        ),
+                        "tsv_path": None,
+                    }
+                ),
+            )
+            # Counting the hot paths would slow down the phases being timed
+            sim.instrumentation = Instrumentation(enabled=True, count_hot_paths=False)
+            start = time.perf_counter()
+            sim.run(GraphFactoryCls=None)
+            seconds = time.perf_counter() - start
+
+        phase_seconds = sim.instrumentation.phase_seconds
+        return {
+            "trials_per_sec": self.num_trials / phase_seconds["work_unit"],
+            "peak_rss_mb": self._get_peak_rss_mb(),
+            "seconds": seconds,
+            "phases": dict(sorted(phase_seconds.items())),
+        }
+
+    @staticmethod
+    def _get_peak_rss_mb() -> float:
+        """Returns the peak RSS of this process in MiB"""
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, MacOS reports bytes
+        return max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10
+
+    ###############
+    # Comparisons #
+    ###############
+
+    @staticmethod
+    def compare(
+        results: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.1
+    ) -> list[str]:
+        """Returns the regressions of the results from the baseline
+
+        A workload regresses if its trials_per_sec is lower, or its peak_rss_mb
+        is higher, than the baseline by more than the tolerance (a fraction).
+        Also a workload that ran in the baseline but errors now regresses
+        """
+
+        regressions: list[str] = list()
+        baseline_workloads = baseline["workloads"]
+        for name, workload_results in results["workloads"].items():
+            baseline_results = baseline_workloads.get(name)
+            if baseline_results is None or "error" in baseline_results:
+                continue
+            elif "error" in workload_results:
+                regressions.append(f"{name} errored: {workload_results['error']}")
+                continue
+            trials_per_sec = workload_results["trials_per_sec"]
+            baseline_trials_per_sec = baseline_results["trials_per_sec"]
+            if trials_per_sec < baseline_trials_per_sec * (1 - tolerance):
+                regressions.append(
+                    f"{name} trials/sec dropped from "
+                    f"{baseline_trials_per_sec:.2f} to {trials_per_sec:.2f}"
+                )
+            peak_rss_mb = workload_results["peak_rss_mb"]
+            baseline_peak_rss_mb = baseline_results["peak_rss_mb"]
+            if peak_rss_mb > baseline_peak_rss_mb * (1 + tolerance):
+                regressions.append(
+                    f"{name} peak RSS rose from "
+                    f"{baseline_peak_rss_mb:.1f}MiB to {peak_rss_mb:.1f}MiB"
+                )
+        return regressions
+
+    @staticmethod
+    def read(path: Path) -> dict[str, Any]:
+        results: dict[str, Any] = json.loads(path.read_text())
+        return results
+
+    @staticmethod
+    def write(results: dict[str, Any], path: Path) -> None:
+        path.write_text(json.dumps(results, indent=4))
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+
+from bgpy.shared.enums import ASGroups
+from bgpy.simulation_engine import (
+    BGP,
+    BGPFull,
+    FirstASNStrippingPrefixASPAAttacker,
+    Policy,
+    ShortestPathPrefixASPAAttacker,
+)
+from bgpy.simulation_framework import (
+    AccidentalRouteLeak,
+    Scenario,
+    ScenarioConfig,
+    ShortestPathPrefixHijack,
+    SubprefixHijack,
+)
+from bgpy.simulation_framework.scenarios.scenario_config import MISSINGPolicy
+
+# Policies that only attackers run, and the placeholder for unset policies,
+# which aren't benchmarked as adopters
+EXCLUDED_POLICY_CLASSES: frozenset[type[Policy]] = frozenset(
+    {
+        FirstASNStrippingPrefixASPAAttacker,
+        ShortestPathPrefixASPAAttacker,
+        MISSINGPolicy,
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkWorkload:
+    """A policy and scenario to benchmark on a synthetic AS graph"""
+
+    num_ases: int
+    ScenarioCls: type[Scenario]
+    BasePolicyCls: type[Policy]
+    AdoptPolicyCls: type[Policy]
+
+    @property
+    def name(self) -> str:
+        """Identifies the workload within the results and baselines"""
+
+        return "/".join(
+            [
+                str(self.num_ases),
+                self.ScenarioCls.__name__,
+                self.BasePolicyCls.__name__,
+                self.AdoptPolicyCls.__name__,
+            ]
+        )
+
+    @property
+    def scenario_config(self) -> ScenarioConfig:
+        if issubclass(self.ScenarioCls, AccidentalRouteLeak):
+            # Stubs can't leak, and the leak is propagated in a second round
+            return ScenarioConfig(
+                ScenarioCls=self.ScenarioCls,
+                BasePolicyCls=self.BasePolicyCls,
+                AdoptPolicyCls=self.AdoptPolicyCls,
+                attacker_subcategory_attr=ASGroups.MULTIHOMED.value,
+                propagation_rounds=2,
+            )
+        else:
+            return ScenarioConfig(
+                ScenarioCls=self.ScenarioCls,
+                BasePolicyCls=self.BasePolicyCls,
+                AdoptPolicyCls=self.AdoptPolicyCls,
+            )
+
+    @classmethod
+    def get_default_workloads(
+        cls, sizes: tuple[int, ...] = (1_000, 10_000, 100_000)
+    ) -> tuple["BenchmarkWorkload", ...]:
+        """Returns every adoptable policy in representative scenarios
+
+        Policies with withdrawals (BGPFull subclasses) run among BGPFull,
+        and are also benchmarked with AccidentalRouteLeak, which repropagates
+        """
+
+        workloads: list[BenchmarkWorkload] = list()
+        for num_ases in sizes:
+            for AdoptPolicyCls in sorted(
+                Policy.subclass_to_name_dict, key=lambda x: x.__name__
+            ):
+                if AdoptPolicyCls in EXCLUDED_POLICY_CLASSES:
+                    continue
+                ScenarioClasses: list[type[Scenario]] = [
+                    SubprefixHijack,
+                    ShortestPathPrefixHijack,
+                ]
+                if issubclass(AdoptPolicyCls, BGPFull):
+                    BasePolicyCls: type[Policy] = BGPFull
+                    ScenarioClasses.append(AccidentalRouteLeak)
+                else:
+                    BasePolicyCls = BGP
+                workloads.extend(
+                    cls(num_ases, ScenarioCls, BasePolicyCls, AdoptPolicyCls)
+                    for ScenarioCls in ScenarioClasses
+                )
+        return tuple(workloads)
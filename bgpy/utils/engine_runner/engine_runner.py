@@ -76,7 +76,9 @@ class EngineRunner:
         # Store engine and traceback YAML
         self._store_data(engine, outcomes_yaml, graph_data_aggregator)
         # Create diagrams before the test can fail
-        self._generate_diagrams(scenario, graph_data_aggregator)
+        self._generate_diagrams(
+            scenario, graph_data_aggregator, engine=engine, outcomes=outcomes_yaml
+        )
 
         return engine, outcomes_yaml, graph_data_aggregator, scenario
 
@@ -153,18 +155,32 @@ class EngineRunner:
         )
 
     def _generate_diagrams(
-        self, scenario: Scenario, graph_data_aggregator: GraphDataAggregator
+        self,
+        scenario: Scenario,
+        graph_data_aggregator: GraphDataAggregator,
+        engine: BaseSimulationEngine | None = None,
+        outcomes: dict[int, int] | None = None,
     ) -> tuple[
         BaseSimulationEngine,
         dict[int, Outcomes],
         tuple[tuple["AS", ...], ...],
     ]:
-        """Generates diagrams"""
+        """Generates diagrams
+
+        Uses the engine and outcomes if passed in, rather than reloading the
+        YAML that was just written for them
+        """
 
         # Load engines
-        engine_guess = self.codec.load(self.engine_guess_path)
+        if engine is None:
+            engine_guess = self.codec.load(self.engine_guess_path)
+        else:
+            engine_guess = engine
         # Load outcomes
-        outcomes_guess = self.codec.load(self.outcomes_guess_path)
+        if outcomes is None:
+            outcomes_guess = self.codec.load(self.outcomes_guess_path)
+        else:
+            outcomes_guess = outcomes
 
         static_order = bool(self.conf.as_graph_info.diagram_ranks)
         diagram_obj_ranks = self._get_diagram_obj_ranks(engine_guess)
@@ -1,5 +1,6 @@
 # YAML STUFF
 from collections.abc import Iterable
+from pathlib import Path
 from typing import Any
 
 import yaml
@@ -9,7 +10,9 @@ from bgpy.shared.constants import bgpy_logger
 from bgpy.shared.enums import YamlAbleEnum
 from bgpy.simulation_engine.ann_containers.ann_container import AnnContainer
 
+from .simulator_dumper import SimulatorDumper
 from .simulator_loader import SimulatorLoader
+from .simulator_snapshot import SnapshotDecoder, SnapshotEncoder
 
 # 2-way mappings between the types and the yaml tags
 types_to_yaml_tags: dict[type[Any], str] = {
@@ -71,19 +74,32 @@ class SimulatorCodec(YamlCodec):
             return types_to_yaml_tags[type(obj)], vars(obj)
 
     def dump(self, obj, path=None):
-        # https://stackoverflow.com/a/30682604/8903959
-        # Ignores references for more readable output
-        yaml.Dumper.ignore_aliases = lambda *args: True  # type: ignore
         if path is None:
-            yaml.dump(obj)
+            yaml.dump(obj, Dumper=SimulatorDumper)
         else:
             with path.open(mode="w") as f:
-                yaml.dump(obj, f)
+                yaml.dump(obj, f, Dumper=SimulatorDumper)
 
     def load(self, path):
         with path.open(mode="r") as f:
             # This isn't insecure, ignore S506
             return yaml.load(f, Loader=SimulatorLoader)  # noqa: S506
 
+    def dump_snapshot(self, obj: Any, path: Path) -> None:
+        """Dumps to a compact binary snapshot, which is much faster than YAML
+
+        Stores the same yaml dicts as dump, but isn't human readable,
+        so use YAML for anything that's checked in (i.e. ground truth)
+        """
+
+        snapshot = SnapshotEncoder(types_to_yaml_tags, self.to_yaml_dict).dumps(obj)
+        path.write_bytes(snapshot)
+
+    def load_snapshot(self, path: Path) -> Any:
+        """Loads a snapshot written by dump_snapshot"""
+
+        decoder = SnapshotDecoder(yaml_tags_to_types, self.from_yaml_dict)
+        return decoder.loads(path.read_bytes())
+
 
 SimulatorCodec.register_with_pyyaml()
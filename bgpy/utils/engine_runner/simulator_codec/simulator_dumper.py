@@ -0,0 +1,28 @@
+from typing import Any
+
+import yaml
+from yaml import Dumper
+
+# The LibYAML C dumper is much faster, but PyYAML may be built without it
+_BaseDumper: Any = getattr(yaml, "CDumper", Dumper)
+
+
+class SimulatorDumper(_BaseDumper):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # yamlable and the SimulatorCodec register their representers with
+        # Dumper, which CDumper doesn't inherit from
+        self.yaml_representers = {
+            **Dumper.yaml_representers,
+            **type(self).yaml_representers,
+        }
+        self.yaml_multi_representers = {
+            **Dumper.yaml_multi_representers,
+            **type(self).yaml_multi_representers,
+        }
+
+    # https://stackoverflow.com/a/30682604/8903959
+    def ignore_aliases(self, data: Any) -> bool:
+        """Ignores references for more readable output"""
+
+        return True
@@ -1,8 +1,27 @@
+from typing import Any
+
+import yaml
 from yaml import SafeLoader
 
+# The LibYAML C loader is much faster, but PyYAML may be built without it
+_BaseLoader: Any = getattr(yaml, "CSafeLoader", SafeLoader)
+
 
 # https://stackoverflow.com/a/39554610/8903959
-class SimulatorLoader(SafeLoader):
+class SimulatorLoader(_BaseLoader):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # yamlable and the SimulatorCodec register their constructors with
+        # SafeLoader, which CSafeLoader doesn't inherit from
+        self.yaml_constructors = {
+            **SafeLoader.yaml_constructors,
+            **type(self).yaml_constructors,
+        }
+        self.yaml_multi_constructors = {
+            **SafeLoader.yaml_multi_constructors,
+            **type(self).yaml_multi_constructors,
+        }
+
     def construct_python_tuple(self, node):
         return tuple(self.construct_sequence(node))
 
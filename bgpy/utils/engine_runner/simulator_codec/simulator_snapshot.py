@@ -0,0 +1,296 @@
+"""Compact binary snapshots of engines (and anything else the codec can dump)
+
+Snapshots store the same dicts as the YAML (from __to_yaml_dict__ and
+SimulatorCodec.to_yaml_dict), so any object that can be dumped to YAML can be
+stored in a snapshot, and is loaded with the same __from_yaml_dict__ funcs.
+Rather than a YAML document, these dicts are encoded into a tree of tuples and
+builtins, which is written with marshal (all at C speed):
+
+- Every tuple in the tree is a node, whose first item is its kind
+- Containers of only builtin scalars are stored as is
+- Objects only store their values, since their yaml tag and dict keys
+  are stored once per type in the shapes of the snapshot
+- Announcements are interned, and stored once in the anns of the snapshot,
+  no matter how many RIBs they are in
+
+marshal's format can change between Python versions, so snapshots are for
+passing engines between runs, not long term storage (use YAML for that)
+"""
+
+import gc
+import marshal
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+from itertools import chain
+from pathlib import Path, PurePath
+from types import NoneType
+from typing import Any
+
+from yamlable import YamlAble
+
+from bgpy.simulation_engine import Announcement as Ann
+
+MAGIC = b"BGPYSNAP"
+VERSION = 1
+
+# Types that are stored as is
+_SCALAR_TYPES: frozenset[type[Any]] = frozenset(
+    {NoneType, bool, int, float, str, bytes}
+)
+
+# Node kinds
+_RAW = 0
+_TUPLE = 1
+_LIST = 2
+_SET = 3
+_FROZENSET = 4
+_DICT = 5
+_PATH = 6
+_YAMLABLE = 7
+_CODEC_OBJ = 8
+_ENUM = 9
+_ANN = 10
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pauses the garbage collector
+
+    Otherwise it's run over and over again (for nothing) while creating
+    the millions of objects of a large engine
+    """
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+class SnapshotEncoder:
+    """Encodes objects into a snapshot tree"""
+
+    def __init__(
+        self,
+        codec_types: Iterable[type[Any]],
+        to_yaml_dict: Callable[[Any], tuple[str, Any]],
+    ) -> None:
+        self.codec_types: frozenset[type[Any]] = frozenset(codec_types)
+        self.to_yaml_dict: Callable[[Any], tuple[str, Any]] = to_yaml_dict
+        # (kind, yaml tag, dict keys) to index
+        self.shapes: dict[tuple[int, str, tuple[Any, ...] | None], int] = dict()
+        self.anns: list[tuple[Any, ...]] = list()
+        self.ann_indexes: dict[Ann, int] = dict()
+        self.enum_nodes: dict[Enum, tuple[Any, ...]] = dict()
+        self.encode_funcs: dict[type[Any], Callable[[Any], Any]] = dict()
+
+    def dumps(self, obj: Any) -> bytes:
+        with _gc_paused():
+            root = self.encode(obj)
+            return MAGIC + marshal.dumps(
+                (VERSION, tuple(self.shapes), tuple(self.anns), root)
+            )
+
+    def encode(self, obj: Any) -> Any:
+        obj_type = type(obj)
+        if obj_type in _SCALAR_TYPES:
+            return obj
+        encode_func = self.encode_funcs.get(obj_type)
+        if encode_func is None:
+            encode_func = self._get_encode_func(obj_type)
+            self.encode_funcs[obj_type] = encode_func
+        return encode_func(obj)
+
+    def _get_encode_func(self, obj_type: type[Any]) -> Callable[[Any], Any]:
+        """Returns the func to encode objects of this type
+
+        Subclasses of the builtin containers (i.e. AnnContainers, which are
+        UserDicts anyways) are objects, not containers
+        """
+
+        if obj_type in self.codec_types:
+            if issubclass(obj_type, Enum):
+                return self._encode_enum
+            else:
+                return self._encode_codec_obj
+        elif issubclass(obj_type, Ann):
+            return self._encode_ann
+        elif issubclass(obj_type, YamlAble):
+            return self._encode_yamlable
+        elif obj_type is dict:
+            return self._encode_dict
+        elif obj_type in (tuple, list, set, frozenset):
+            kind = {tuple: _TUPLE, list: _LIST, set: _SET, frozenset: _FROZENSET}
+            return lambda x: self._encode_collection(x, kind[obj_type])
+        elif issubclass(obj_type, PurePath):
+            return lambda x: (_PATH, str(x))
+        else:
+            raise TypeError(f"{obj_type} can't be stored in a snapshot")
+
+    def _encode_items(self, items: Iterable[Any]) -> list[Any]:
+        # Most items are scalars, so check them here rather than call encode
+        encode = self.encode
+        return [x if type(x) in _SCALAR_TYPES else encode(x) for x in items]
+
+    def _encode_collection(self, collection: Any, kind: int) -> tuple[Any, ...]:
+        if _SCALAR_TYPES.issuperset(map(type, collection)):
+            return (_RAW, collection)
+        else:
+            return (kind, *self._encode_items(collection))
+
+    def _encode_dict(self, dct: dict[Any, Any]) -> tuple[Any, ...]:
+        if _SCALAR_TYPES.issuperset(map(type, dct)) and _SCALAR_TYPES.issuperset(
+            map(type, dct.values())
+        ):
+            return (_RAW, dct)
+        else:
+            return (_DICT, *self._encode_items(chain.from_iterable(dct.items())))
+
+    def _encode_yamlable(self, obj: YamlAble) -> tuple[Any, ...]:
+        dct = obj.__to_yaml_dict__()
+        shape_index = self._get_shape_index(
+            _YAMLABLE, type(obj).__yaml_tag_suffix__, tuple(dct)
+        )
+        return (_YAMLABLE, shape_index, *self._encode_items(dct.values()))
+
+    def _encode_codec_obj(self, obj: Any) -> tuple[Any, ...]:
+        yaml_tag, dct = self.to_yaml_dict(obj)
+        return (
+            _CODEC_OBJ,
+            self._get_shape_index(_CODEC_OBJ, yaml_tag, None),
+            self.encode(dct),
+        )
+
+    def _encode_enum(self, enum: Enum) -> tuple[Any, ...]:
+        node = self.enum_nodes.get(enum)
+        if node is None:
+            yaml_tag, dct = self.to_yaml_dict(enum)
+            shape_index = self._get_shape_index(_ENUM, yaml_tag, None)
+            node = (_ENUM, shape_index, dct["value"])
+            self.enum_nodes[enum] = node
+        return node
+
+    def _encode_ann(self, ann: Ann) -> tuple[Any, ...]:
+        ann_index = self.ann_indexes.get(ann)
+        if ann_index is None:
+            # Encode first, in case this ann contains other anns
+            node = self._encode_yamlable(ann)
+            ann_index = len(self.anns)
+            self.anns.append(node)
+            self.ann_indexes[ann] = ann_index
+        return (_ANN, ann_index)
+
+    def _get_shape_index(
+        self, kind: int, yaml_tag: str, keys: tuple[Any, ...] | None
+    ) -> int:
+        shape = (kind, yaml_tag, keys)
+        shape_index = self.shapes.get(shape)
+        if shape_index is None:
+            shape_index = len(self.shapes)
+            self.shapes[shape] = shape_index
+        return shape_index
+
+
+class SnapshotDecoder:
+    """Decodes objects from a snapshot tree"""
+
+    def __init__(
+        self,
+        yaml_tags_to_codec_types: dict[str, type[Any]],
+        from_yaml_dict: Callable[[str, Any], Any],
+    ) -> None:
+        self.yaml_tags_to_codec_types: dict[str, type[Any]] = yaml_tags_to_codec_types
+        self.from_yaml_dict: Callable[[str, Any], Any] = from_yaml_dict
+        # (kind, yaml tag, dict keys, type)
+        self.shapes: list[tuple[int, str, tuple[Any, ...] | None, type[Any]]] = list()
+        self.anns: list[Ann] = list()
+        self.enums: dict[tuple[int, Any], Enum] = dict()
+        self.decode_funcs: tuple[Callable[[tuple[Any, ...]], Any], ...] = (
+            lambda node: node[1],
+            lambda node: tuple(self._decode_items(node[1:])),
+            lambda node: self._decode_items(node[1:]),
+            lambda node: set(self._decode_items(node[1:])),
+            lambda node: frozenset(self._decode_items(node[1:])),
+            self._decode_dict,
+            lambda node: Path(node[1]),
+            self._decode_yamlable,
+            self._decode_codec_obj,
+            self._decode_enum,
+            lambda node: self.anns[node[1]],
+        )
+
+    def loads(self, data: bytes) -> Any:
+        if not data.startswith(MAGIC):
+            raise ValueError("Not a simulator snapshot")
+        with _gc_paused():
+            return self._loads(data)
+
+    def _loads(self, data: bytes) -> Any:
+        # Only load snapshots that you trust, like YAML with custom tags
+        version, shapes, anns, root = marshal.loads(data[len(MAGIC) :])  # noqa: S302
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+
+        yamlable_types = self._get_yaml_tags_to_yamlable_types()
+        for kind, yaml_tag, keys in shapes:
+            if kind == _YAMLABLE:
+                cls = yamlable_types[yaml_tag]
+            else:
+                cls = self.yaml_tags_to_codec_types[yaml_tag]
+            self.shapes.append((kind, yaml_tag, keys, cls))
+        for node in anns:
+            self.anns.append(self.decode(node))
+        return self.decode(root)
+
+    def decode(self, node: Any) -> Any:
+        # Every tuple is a node, everything else is a scalar
+        if type(node) is tuple:
+            return self.decode_funcs[node[0]](node)
+        else:
+            return node
+
+    def _decode_items(self, nodes: tuple[Any, ...]) -> list[Any]:
+        # Most items are scalars, so check them here rather than call decode
+        decode_funcs = self.decode_funcs
+        return [decode_funcs[x[0]](x) if type(x) is tuple else x for x in nodes]
+
+    def _decode_dict(self, node: tuple[Any, ...]) -> dict[Any, Any]:
+        items = iter(self._decode_items(node[1:]))
+        return dict(zip(items, items, strict=True))
+
+    def _decode_yamlable(self, node: tuple[Any, ...]) -> Any:
+        _, yaml_tag, keys, cls = self.shapes[node[1]]
+        assert keys is not None
+        dct = dict(zip(keys, self._decode_items(node[2:]), strict=True))
+        return cls.__from_yaml_dict__(dct, yaml_tag)
+
+    def _decode_codec_obj(self, node: tuple[Any, ...]) -> Any:
+        yaml_tag = self.shapes[node[1]][1]
+        return self.from_yaml_dict(yaml_tag, self.decode(node[2]))
+
+    def _decode_enum(self, node: tuple[Any, ...]) -> Enum:
+        key = (node[1], node[2])
+        enum = self.enums.get(key)
+        if enum is None:
+            enum = self.from_yaml_dict(self.shapes[node[1]][1], {"value": node[2]})
+            self.enums[key] = enum
+        return enum
+
+    @staticmethod
+    def _get_yaml_tags_to_yamlable_types() -> dict[str, type[YamlAble]]:
+        """Returns all YamlAble classes with their own yaml tag
+
+        yamlable searches all of these for every object it loads
+        """
+
+        yaml_tags_to_types: dict[str, type[YamlAble]] = dict()
+        stack: list[type[YamlAble]] = [YamlAble]
+        while stack:
+            cls = stack.pop()
+            if "__yaml_tag_suffix__" in cls.__dict__ and cls.__yaml_tag_suffix__:
+                yaml_tags_to_types[cls.__yaml_tag_suffix__] = cls
+            stack.extend(cls.__subclasses__())
+        return yaml_tags_to_types
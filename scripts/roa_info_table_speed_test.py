@@ -0,0 +1,57 @@
+import random
+import time
+
+from bgpy.as_graphs import CAIDAASGraphConstructor
+from bgpy.simulation_engine import ASPA, ROV, Policy, ROVPPV1Lite, SimulationEngine
+from bgpy.simulation_framework import ScenarioConfig, SubprefixHijack
+
+
+def time_propagation(
+    engine: SimulationEngine,
+    AdoptPolicyCls: type[Policy],
+    use_roa_info_table: bool,
+    num_trials: int = 10,
+    percent_adopt: float = 0.5,
+) -> float:
+    """Returns the average seconds per trial to propagate
+
+    Without the roa_info_table, every ROA check falls back to the roa_checker
+    """
+
+    scenario_config = ScenarioConfig(
+        ScenarioCls=SubprefixHijack, AdoptPolicyCls=AdoptPolicyCls
+    )
+    random.seed(0)
+    total = 0.0
+    for _ in range(num_trials):
+        scenario = SubprefixHijack(
+            scenario_config=scenario_config,
+            engine=engine,
+            percent_adoption=percent_adopt,
+        )
+        scenario.setup_engine(engine)
+        if not use_roa_info_table:
+            Policy.roa_info_table.clear()
+        start = time.perf_counter()
+        engine.run(propagation_round=0, scenario=scenario)
+        total += time.perf_counter() - start
+    return total / num_trials
+
+
+def main():
+    """Compares propagation time with and without the roa_info_table"""
+
+    engine = SimulationEngine(CAIDAASGraphConstructor().run())
+    for AdoptPolicyCls in (ROV, ROVPPV1Lite, ASPA):
+        before = time_propagation(engine, AdoptPolicyCls, use_roa_info_table=False)
+        after = time_propagation(engine, AdoptPolicyCls, use_roa_info_table=True)
+        print(
+            f"{AdoptPolicyCls.name}: "
+            f"roa_checker {before * 1000:.1f}ms/trial, "
+            f"roa_info_table {after * 1000:.1f}ms/trial, "
+            f"{before / after:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import random
+import time
+
+from bgpy.as_graphs import CAIDAASGraph, SyntheticASGraphGenerator
+from bgpy.simulation_engine import ROV, Policy, SimulationEngine
+from bgpy.simulation_framework import ScenarioConfig, SubprefixHijack
+
+
+class RecreatePoliciesSimulationEngine(SimulationEngine):
+    """Engine that always recreates policies (the old setup behavior)"""
+
+    @staticmethod
+    def _policy_cls_resettable(PolicyCls: type[Policy]) -> bool:
+        return False
+
+
+def time_setup(
+    EngineCls: type[SimulationEngine],
+    num_ases: int = 3_000,
+    num_trials: int = 20,
+    percent_adopt: float = 0.1,
+) -> float:
+    """Returns the average seconds per trial to set up the engine
+
+    Each trial has a new random adopting set, like in a Simulation.
+    Uses a synthetic CAIDA-like graph so that this runs offline
+    """
+
+    as_graph_info = SyntheticASGraphGenerator(num_ases).get_as_graph_info()
+    engine = EngineCls(CAIDAASGraph(as_graph_info))
+    scenario_config = ScenarioConfig(ScenarioCls=SubprefixHijack, AdoptPolicyCls=ROV)
+    random.seed(0)
+    total = 0.0
+    for _ in range(num_trials):
+        scenario = SubprefixHijack(
+            scenario_config=scenario_config,
+            engine=engine,
+            percent_adoption=percent_adopt,
+        )
+        start = time.perf_counter()
+        scenario.setup_engine(engine)
+        total += time.perf_counter() - start
+        engine.run(propagation_round=0, scenario=scenario)
+    return total / num_trials
+
+
+def main():
+    """Compares per trial engine setup time with and without in place resets"""
+
+    for percent_adopt in (0.1, 0.5, 0.8):
+        before = time_setup(
+            RecreatePoliciesSimulationEngine, percent_adopt=percent_adopt
+        )
+        after = time_setup(SimulationEngine, percent_adopt=percent_adopt)
+        print(
+            f"{percent_adopt * 100:.0f}% adoption: "
+            f"recreate {before * 1000:.1f}ms/trial, "
+            f"reset {after * 1000:.1f}ms/trial, "
+            f"{before / after:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()